@@ -1,22 +1,21 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-from tkcalendar import Calendar, DateEntry
 from calendar import month_name, monthrange, day_name
 from datetime import datetime, timedelta, date
+from functools import lru_cache
 from typing import Optional, Any
 import tkinter.font as tkfont
 import csv
-import json  # For potential saves
-import yaml
 import os
+import mmap
+import queue
 import random
 import threading
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.pyplot as plt
+from bisect import bisect_right
+import numpy as np
 
 # Import the scheduler service (clean API layer)
-from scheduler_service import SchedulerService, ScheduleResult, WorkerStats
+from scheduler_service import SchedulerService, ScheduleResult, dumps_json, read_history_file, write_history_file
 from utils import Tooltip
 from constants import EQUITY_STATS
 from logger import get_logger
@@ -26,13 +25,101 @@ logger = get_logger('ui')
 # Configuration file path
 CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config.yaml")
 RULES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "RULES.md")
+# Rules text larger than this is fed to the Text widget in idle-time chunks
+RULES_CHUNK_CHARS = 64 * 1024
+
+# Delay used to coalesce bursts of dashboard refresh requests
+DASHBOARD_REFRESH_MS = 150
+# How often the Tk thread checks for results of background work
+UI_QUEUE_POLL_MS = 50
+
+# Schedule grid layout
+SCHEDULE_COLUMNS = ["Day", "M1", "M2", "Night"]
+SCHEDULE_COL_WIDTHS = [120, 150, 150, 150]
+SCHEDULE_GRID_TAG = "grid"  # Canvas tag shared by every header and cell item of the grid
+
+
+# Schedule row backgrounds
+WEEKEND_ROW_BG = '#e0f7fa'  # Light cyan for weekends
+HOLIDAY_ROW_BG = '#ffebee'  # Light red for holidays
+ODD_ROW_BG = '#f0f0f0'  # Alternating gray
+EVEN_ROW_BG = '#ffffff'  # White
+# Indexed by row kind: 0 even, 1 odd, 2 holiday, 3 weekend
+ROW_BG_TABLE = np.array([EVEN_ROW_BG, ODD_ROW_BG, HOLIDAY_ROW_BG, WEEKEND_ROW_BG])
+
+# Text color of a shift cell not showing a known worker, indexed by "cell has a name":
+# empty cells are understaffed (red), unknown names plain black
+FALLBACK_CELL_FG = ('red', '#000000')
+
+WEEKDAY_ABBRS = tuple(name[:3] for name in day_name)
+MONTH_NAMES = tuple(month_name)[1:]
+MONTH_INDEX = {name: i for i, name in enumerate(MONTH_NAMES, start=1)}
+
+
+def month_index(name: str) -> int:
+    """Return the month number (1-12) for a full month name.
+
+    Raises:
+        ValueError: If name is not a month name
+    """
+    try:
+        return MONTH_INDEX[name]
+    except KeyError:
+        raise ValueError(f"Unknown month: {name!r}") from None
+
+
+def schedule_calendar(days, holidays):
+    """Compute per-row calendar data for the schedule grid in one pass.
+
+    Args:
+        days: datetime64[D] array with one date per grid row
+        holidays: Day-of-month numbers that are holidays
+
+    Returns:
+        (day numbers, weekday indices with Monday=0, row background colors)
+    """
+    days = np.asarray(days, dtype='datetime64[D]')
+    day_numbers = (days - days.astype('datetime64[M]')).astype(np.int64) + 1
+    # 1970-01-01 (day 0) was a Thursday
+    weekdays = (days.astype(np.int64) + 3) % 7
+    is_holiday = np.zeros(32, dtype=bool)  # Indexed by day of month
+    is_holiday[[day for day in holidays if 1 <= day <= 31]] = True  # Imported days may be out of range
+    kinds = np.where(weekdays >= 5, 3, np.where(is_holiday[day_numbers], 2, np.arange(len(days)) & 1))
+    return day_numbers.tolist(), weekdays.tolist(), ROW_BG_TABLE[kinds].tolist()
+
+
+# sRGB channel (0-255) -> linear value, per the WCAG relative luminance formula
+_LIN = tuple(
+    (c / 255.0) / 12.92 if (c / 255.0) <= 0.03928 else (((c / 255.0) + 0.055) / 1.055) ** 2.4
+    for c in range(256)
+)
+# Contrast text colors indexed by "background is light"
+_BW = ('#FFFFFF', '#000000')
+# Contrast color per color string exactly as passed in, so repeat lookups skip normalizing
+_CONTRAST_CACHE: dict[str, str] = {}
+
+
+@lru_cache(maxsize=4096)
+def _contrast_for_normalized(hex_color: str) -> str:
+    """Compute the contrast color for an already-normalized 'RRGGBB' string."""
+    try:
+        r = int(hex_color[0:2], 16)
+        g = int(hex_color[2:4], 16)
+        b = int(hex_color[4:6], 16)
+    except (ValueError, IndexError):
+        return '#000000'  # Default to black on parsing error
+
+    # Black text for light backgrounds, white for dark; the comparison indexes _BW
+    return _BW[0.2126 * _LIN[r] + 0.7152 * _LIN[g] + 0.0722 * _LIN[b] > 0.179]
 
 
 def get_contrast_color(hex_color: str) -> str:
     """Calculate a contrasting text color (black or white) for a given background color.
     
     Uses the relative luminance formula from WCAG guidelines to determine
-    whether black or white text provides better contrast.
+    whether black or white text provides better contrast. Results are cached
+    per color string as given, and the luminance math per normalized color,
+    so '#fff' and 'FFFFFF' share one computation.
     
     Args:
         hex_color: Background color in hex format (e.g., '#FF5733' or 'FF5733')
@@ -40,37 +127,62 @@ def get_contrast_color(hex_color: str) -> str:
     Returns:
         '#000000' for dark text on light backgrounds, '#FFFFFF' for light text on dark backgrounds
     """
+    contrast = _CONTRAST_CACHE.get(hex_color)
+    if contrast is not None:
+        return contrast
+
     # Remove '#' if present
-    hex_color = hex_color.lstrip('#')
+    normalized = hex_color.lstrip('#').upper()
     
     # Handle short hex format (e.g., 'FFF' -> 'FFFFFF')
-    if len(hex_color) == 3:
-        hex_color = ''.join([c*2 for c in hex_color])
-    
-    # Convert to RGB
-    try:
-        r = int(hex_color[0:2], 16)
-        g = int(hex_color[2:4], 16)
-        b = int(hex_color[4:6], 16)
-    except (ValueError, IndexError):
-        return '#000000'  # Default to black on parsing error
-    
-    # Calculate relative luminance using the formula from WCAG
-    # First linearize the sRGB values
-    def linearize(c):
-        c = c / 255.0
-        return c / 12.92 if c <= 0.03928 else ((c + 0.055) / 1.055) ** 2.4
+    if len(normalized) == 3:
+        normalized = ''.join([c*2 for c in normalized])
     
-    luminance = 0.2126 * linearize(r) + 0.7152 * linearize(g) + 0.0722 * linearize(b)
-    
-    # Return black text for light backgrounds, white for dark backgrounds
-    return '#000000' if luminance > 0.179 else '#FFFFFF'
+    contrast = _CONTRAST_CACHE[hex_color] = _contrast_for_normalized(normalized)
+    return contrast
+
+
+def bar_polygons(heights, width=0.8):
+    """Return (n, 4, 2) rectangle vertices for bars centred on 0..n-1."""
+    heights = np.asarray(heights, dtype=float)
+    x = np.arange(len(heights), dtype=float)
+    verts = np.zeros((len(heights), 4, 2))
+    verts[:, (0, 1), 0] = (x - width / 2)[:, None]
+    verts[:, (2, 3), 0] = (x + width / 2)[:, None]
+    verts[:, (1, 2), 1] = heights[:, None]
+    return verts
+
+
+def bar_ylim(heights):
+    """Y-limits for a bar chart: zero up to the tallest bar plus a 5% margin.
+
+    The top is rounded up to a multiple of 5 so that small changes in the
+    heights keep the same limits (and the dashboard can keep blitting).
+    """
+    top = float(np.max(heights)) if len(heights) else 0.0
+    return (0.0, float(np.ceil(top * 1.05 / 5) * 5) if top > 0 else 1.0)
+
+
+def add_bindtag(widget, tag):
+    """Insert tag right after the widget's own bindtag.
+
+    Widgets sharing a tag share one bind_class handler, which finds out
+    which widget fired from event.widget.
+    """
+    tags = widget.bindtags()
+    widget.bindtags((tags[0], tag) + tags[1:])
+
 
 class WorkerTab(ttk.Frame):
+    # Bindtag shared by all allocation spinboxes
+    ALLOCATION_BINDTAG = "AllocationSpinbox"
+
     def __init__(self, parent, app):
         super().__init__(parent, padding="10")
         self.app = app
         self.allocation_spinboxes = {}  # Store spinbox references for updates
+        self._allocation_shown = {}  # stat -> value currently shown in its spinbox
+        self._spinbox_stats = {}  # spinbox widget path -> stat
         self.build_ui()
 
     def build_ui(self):
@@ -89,8 +201,7 @@ class WorkerTab(ttk.Frame):
         Tooltip(self.app.worker_listbox, "Select a worker to view stats and manage availability")
         
         # Populate the listbox initially
-        for w in self.app.workers:
-            self.app.worker_listbox.insert(tk.END, w['name'])
+        self.app.worker_listbox.insert(tk.END, *(w['name'] for w in self.app.workers))
 
         add_worker_btn = ttk.Button(self, text="Add Worker", command=self.app.add_worker)
         add_worker_btn.grid(row=1, column=1, padx=(10, 5), pady=5, sticky="ew")
@@ -169,7 +280,9 @@ class WorkerTab(ttk.Frame):
             row=0, column=0, columnspan=2, pady=(0, 5), sticky="w"
         )
         
-        # Create spinboxes for each stat
+        # Create spinboxes for each stat; Return/FocusOut go through one shared handler
+        self.bind_class(self.ALLOCATION_BINDTAG, '<Return>', self._on_allocation_event)
+        self.bind_class(self.ALLOCATION_BINDTAG, '<FocusOut>', self._on_allocation_event)
         for idx, (stat, label) in enumerate(self.ui_allocation_stats, start=1):
             ttk.Label(alloc_scrollable, text=label, width=15, anchor="w").grid(row=idx, column=0, padx=2, pady=1, sticky="w")
             var = tk.IntVar(value=100)
@@ -178,8 +291,8 @@ class WorkerTab(ttk.Frame):
                 command=lambda s=stat, v=var: self._on_allocation_change(s, v)
             )
             spinbox.grid(row=idx, column=1, padx=2, pady=1)
-            spinbox.bind('<Return>', lambda e, s=stat, v=var: self._on_allocation_change(s, v))
-            spinbox.bind('<FocusOut>', lambda e, s=stat, v=var: self._on_allocation_change(s, v))
+            add_bindtag(spinbox, self.ALLOCATION_BINDTAG)
+            self._spinbox_stats[str(spinbox)] = stat
             self.allocation_spinboxes[stat] = var
             Tooltip(spinbox, f"Percentage of {label} shifts (0-100, 100=normal share)")
         
@@ -191,6 +304,12 @@ class WorkerTab(ttk.Frame):
         self.columnconfigure(4, weight=1)
         self.rowconfigure(1, weight=0)
 
+    def _on_allocation_event(self, event):
+        """Dispatch Return/FocusOut from any allocation spinbox."""
+        stat = self._spinbox_stats.get(str(event.widget))
+        if stat is not None:
+            self._on_allocation_change(stat, self.allocation_spinboxes[stat])
+
     def _on_allocation_change(self, stat: str, var: tk.IntVar):
         """Handle allocation percentage change for a stat."""
         selection = self.app.worker_listbox.curselection()
@@ -199,17 +318,25 @@ class WorkerTab(ttk.Frame):
         worker_name = self.app.worker_listbox.get(selection[0])
         try:
             pct = var.get()
+            self._allocation_shown[stat] = pct
             self.app.scheduler.set_shift_allocation_pct(worker_name, stat, pct)
             # Save config to persist the allocation change
             self.app.scheduler.save_config()
         except (ValueError, tk.TclError):
-            pass  # Ignore invalid values
+            # Ignore invalid values, but reset the spinbox on the next refresh
+            self._allocation_shown.pop(stat, None)
 
     def update_allocation_display(self, worker_name: str):
-        """Update the allocation spinboxes for the selected worker."""
+        """Update the allocation spinboxes for the selected worker.
+
+        Spinboxes already showing the worker's value are left untouched.
+        """
+        shown = self._allocation_shown
         for stat, var in self.allocation_spinboxes.items():
             pct = self.app.scheduler.get_shift_allocation_pct(worker_name, stat)
-            var.set(pct)
+            if shown.get(stat) != pct:
+                var.set(pct)
+                shown[stat] = pct
 
 
 class ScheduleTab(ttk.Frame):
@@ -238,48 +365,48 @@ class ScheduleTab(ttk.Frame):
         self.schedule_canvas.grid(row=0, column=0, sticky="nsew")
         
         # Scrollbars
-        vsb = ttk.Scrollbar(self.schedule_container, orient="vertical", command=self.schedule_canvas.yview)
-        vsb.grid(row=0, column=1, sticky="ns")
+        self.vsb = ttk.Scrollbar(self.schedule_container, orient="vertical", command=self.schedule_canvas.yview)
+        self.vsb.grid(row=0, column=1, sticky="ns")
         hsb = ttk.Scrollbar(self.schedule_container, orient="horizontal", command=self.schedule_canvas.xview)
         hsb.grid(row=1, column=0, sticky="ew")
         
-        self.schedule_canvas.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+        self.schedule_canvas.configure(yscrollcommand=self.vsb.set, xscrollcommand=hsb.set,
+                                       yscrollincrement=self.app._schedule_row_height)
         
-        # Frame inside canvas for the grid
-        self.app.schedule_grid_frame = ttk.Frame(self.schedule_canvas)
-        self.schedule_canvas_window = self.schedule_canvas.create_window((0, 0), window=self.app.schedule_grid_frame, anchor="nw")
-        
-        # Bind resize events
-        self.app.schedule_grid_frame.bind("<Configure>", self._on_grid_configure)
+        # The grid is drawn directly on the canvas; cells are rectangle + text items
         self.schedule_canvas.bind("<Configure>", self._on_canvas_configure)
+        self.schedule_canvas.bind("<Double-1>", self.app._on_schedule_double_click)
         
-        # Enable mouse wheel scrolling
-        self.schedule_canvas.bind_all("<MouseWheel>", self._on_mousewheel)
-        self.schedule_canvas.bind_all("<Button-4>", self._on_mousewheel)  # Linux scroll up
-        self.schedule_canvas.bind_all("<Button-5>", self._on_mousewheel)  # Linux scroll down
+        # Enable mouse wheel scrolling only while the pointer is over the grid
+        self.schedule_canvas.bind("<Enter>", self._bind_wheel)
+        self.schedule_canvas.bind("<Leave>", self._unbind_wheel)
         
-        # Store reference for scrolling
+        # Store reference for drawing and scrolling
         self.app.schedule_canvas = self.schedule_canvas
         
         # Initialize the grid structure
-        self.app._schedule_cells = {}  # Store cell labels for editing
-        self.app._schedule_data = []   # Store row data for export/save
         self.app.update_schedule_columns()
 
         save_btn = ttk.Button(self, text="Save Manual Changes", command=self.app.save_manual_changes)
         save_btn.grid(row=3, column=0, pady=10, sticky="ew")
         Tooltip(save_btn, "Save any manual edits to the schedule")
     
-    def _on_grid_configure(self, event):
-        """Update scroll region when grid changes."""
-        self.schedule_canvas.configure(scrollregion=self.schedule_canvas.bbox("all"))
-    
     def _on_canvas_configure(self, event):
-        """Update grid width when canvas is resized."""
-        # Make the grid frame at least as wide as the canvas
-        canvas_width = event.width
-        self.schedule_canvas.itemconfig(self.schedule_canvas_window, width=canvas_width)
+        """Stretch the grid columns to the new canvas width."""
+        self.app._request_schedule_layout(event.width)
     
+    def _bind_wheel(self, event=None):
+        """Install the global wheel handlers while the pointer is over the grid."""
+        self.schedule_canvas.bind_all("<MouseWheel>", self._on_mousewheel)
+        self.schedule_canvas.bind_all("<Button-4>", self._on_mousewheel)  # Linux scroll up
+        self.schedule_canvas.bind_all("<Button-5>", self._on_mousewheel)  # Linux scroll down
+
+    def _unbind_wheel(self, event=None):
+        """Remove the global wheel handlers when the pointer leaves the grid."""
+        self.schedule_canvas.unbind_all("<MouseWheel>")
+        self.schedule_canvas.unbind_all("<Button-4>")
+        self.schedule_canvas.unbind_all("<Button-5>")
+
     def _on_mousewheel(self, event):
         """Handle mouse wheel scrolling."""
         # Check if this canvas is visible
@@ -320,15 +447,33 @@ class ReportsTab(ttk.Frame):
         dashboard_frame.grid(row=3, column=0, columnspan=2, pady=10, sticky="nsew")
         dashboard_frame.columnconfigure(0, weight=1)
         dashboard_frame.rowconfigure(0, weight=1)
+        self.dashboard_frame = dashboard_frame
 
-        self.figure = Figure(figsize=(10, 8), dpi=100)
-        self.canvas = FigureCanvasTkAgg(self.figure, master=dashboard_frame)
-        self.canvas.get_tk_widget().grid(row=0, column=0, sticky="nsew")
+        # matplotlib is only imported once the dashboard is shown or plotted
+        self.figure = None
+        self.canvas = None
+        dashboard_frame.bind("<Map>", lambda e: self.ensure_dashboard())
+
+    def ensure_dashboard(self):
+        """Create the dashboard figure and canvas on first use."""
+        if self.canvas is None:
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+            self.figure = Figure(figsize=(10, 8), dpi=100)
+            self.canvas = FigureCanvasTkAgg(self.figure, master=self.dashboard_frame)
+            self.canvas.get_tk_widget().grid(row=0, column=0, sticky="nsew")
+        return self.canvas
 
 class SettingsTab(ttk.Frame):
+    # Minimum delay between value label and weight refreshes while dragging (~60 Hz)
+    LABEL_REFRESH_MS = 16
+
     def __init__(self, parent, app):
         super().__init__(parent, padding="10")
         self.app = app
+        self._dirty_labels = {}  # label StringVar -> (DoubleVar whose value it shows, store callback)
+        self._label_flush_pending = False
         self.build_ui()
 
     def build_ui(self):
@@ -337,27 +482,21 @@ class SettingsTab(ttk.Frame):
 
         ttk.Label(self, text="Equity Weights Adjustment", font=self.app.heading_font).pack(pady=10)
 
+        self.weight_vars = {}  # stat -> DoubleVar bound to its scale
         for stat, weight in self.app.scheduler.equity_weights.items():
             frame = ttk.Frame(self)
             frame.pack(fill="x", pady=5)
             ttk.Label(frame, text=stat.capitalize().replace('_', ' '), width=20).pack(side="left", padx=10)
-            scale = ttk.Scale(frame, from_=0, to=500, orient="horizontal", value=weight,
-                              command=lambda v, s=stat: self.update_weight(s, float(v)))
-            scale.pack(side="left", fill="x", expand=True, padx=10)
-            value_label = ttk.Label(frame, text=f"{weight:.1f}")
-            value_label.pack(side="left", padx=10)
-            scale.bind("<Motion>", lambda e, vl=value_label: vl.config(text=f"{scale.get():.1f}"))
+            _scale, self.weight_vars[stat] = self._make_weight_scale(
+                frame, weight, 500, lambda value, stat=stat: self.update_weight(stat, value)
+            )
 
         dow_frame = ttk.Frame(self)
         dow_frame.pack(fill="x", pady=5)
         ttk.Label(dow_frame, text="Day of Week Equity", width=20).pack(side="left", padx=10)
-        self.dow_scale = ttk.Scale(dow_frame, from_=0, to=10, orient="horizontal", 
-                                   value=self.app.scheduler.dow_equity_weight,
-                                   command=lambda v: setattr(self.app.scheduler, 'dow_equity_weight', float(v)))
-        self.dow_scale.pack(side="left", fill="x", expand=True, padx=10)
-        dow_value_label = ttk.Label(dow_frame, text=f"{self.app.scheduler.dow_equity_weight:.1f}")
-        dow_value_label.pack(side="left", padx=10)
-        self.dow_scale.bind("<Motion>", lambda e: dow_value_label.config(text=f"{self.dow_scale.get():.1f}"))
+        self.dow_scale, self.dow_var = self._make_weight_scale(
+            dow_frame, self.app.scheduler.dow_equity_weight, 10, self.update_dow_weight
+        )
 
         solver_frame = ttk.LabelFrame(self, text="Solver", padding="10")
         solver_frame.pack(fill="x", pady=15)
@@ -371,9 +510,47 @@ class SettingsTab(ttk.Frame):
         lex_cb.pack(anchor="w")
         Tooltip(lex_cb, "When enabled, the solver optimizes flexible rules in strict RULES.md order")
 
+    def _make_weight_scale(self, frame, value, maximum, store):
+        """Pack a weight scale and its value label into frame.
+
+        The label shows a StringVar that follows the scale's DoubleVar through
+        a write trace, so no per-motion scale callback is needed. The same
+        throttled refresh passes the new value to store, however the scale
+        was moved (mouse or keyboard).
+
+        Returns:
+            (scale, DoubleVar bound to the scale)
+        """
+        var = tk.DoubleVar(self, value=value)
+        text_var = tk.StringVar(self, value=f"{value:.1f}")
+        scale = ttk.Scale(frame, from_=0, to=maximum, orient="horizontal", variable=var)
+        scale.pack(side="left", fill="x", expand=True, padx=10)
+        ttk.Label(frame, textvariable=text_var).pack(side="left", padx=10)
+        var.trace_add("write", lambda *_: self._queue_label_update(var, text_var, store))
+        return scale, var
+
+    def _queue_label_update(self, var, text_var, store):
+        """Mark a value label dirty and schedule one coalesced refresh."""
+        self._dirty_labels[text_var] = (var, store)
+        if not self._label_flush_pending:
+            self._label_flush_pending = True
+            self.after(self.LABEL_REFRESH_MS, self._flush_weight_labels)
+
+    def _flush_weight_labels(self):
+        """Write the current scale values into all dirty labels and store them."""
+        self._label_flush_pending = False
+        for text_var, (var, store) in self._dirty_labels.items():
+            value = var.get()
+            text_var.set(f"{value:.1f}")
+            store(value)
+        self._dirty_labels.clear()
+
     def update_weight(self, stat, value):
         self.app.scheduler.set_equity_weight(stat, value)
 
+    def update_dow_weight(self, value):
+        self.app.scheduler.dow_equity_weight = value
+
     def update_lexicographic(self):
         self.app.scheduler.lexicographic_mode = bool(self.app.lexicographic_var.get())
 
@@ -508,6 +685,7 @@ class TestingTab(ttk.Frame):
                                 logger.warning(f"Failed to add vacation for {worker_name} on {vacation_date} (row {row_num})")
             
             # Update UI
+            self.app._invalidate_worker_caches()
             self.app.update_worker_stats()
             self.app.status_var.set(f"Vacations loaded: {added_count} vacation days added")
             messagebox.showinfo("Vacations Loaded", f"Successfully loaded {added_count} vacation days from {file_path}")
@@ -523,8 +701,7 @@ class TestingTab(ttk.Frame):
             return
 
         # Check if any schedules already exist in the next 12 months
-        current_month = list(month_name).index(self.app.month_var.get())
-        current_year = self.app.year_var.get()
+        current_year, current_month = self.app._selected_period()
         
         existing_schedules = []
         for i in range(12):
@@ -646,9 +823,7 @@ class TestingTab(ttk.Frame):
                 fieldnames = ['worker', 'date', 'shift', 'duration', 'year', 'month']
                 writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
                 writer.writeheader()
-                
-                for assignment in all_assignments:
-                    writer.writerow(assignment)
+                writer.writerows(all_assignments)
             
             # Calculate stats from assignments
             worker_stats = self._calculate_stats_from_assignments(all_assignments)
@@ -686,7 +861,7 @@ class TestingTab(ttk.Frame):
             # Get holidays for this month (cache them)
             month_key = (year, month)
             if month_key not in holiday_cache:
-                holiday_cache[month_key] = set(self.app.scheduler.get_holidays(year, month))
+                holiday_cache[month_key] = set(self.app._holidays(year, month))
             holidays = holiday_cache[month_key]
             
             # Calculate stats using the same logic
@@ -750,11 +925,10 @@ class TestingTab(ttk.Frame):
                 writer.writerow(['Worker'] + stat_columns)
                 
                 # Write data for each worker
-                for worker_name in sorted(worker_stats.keys()):
-                    row = [worker_name]
-                    for stat in stat_columns:
-                        row.append(worker_stats[worker_name][stat])
-                    writer.writerow(row)
+                writer.writerows(
+                    [worker_name] + [worker_stats[worker_name][stat] for stat in stat_columns]
+                    for worker_name in sorted(worker_stats)
+                )
             
             logger.info(f"Worker stats file saved to: {stats_file}")
             
@@ -825,8 +999,7 @@ class TestingTab(ttk.Frame):
         max_unavailable = total_workers - min_available
 
         # Get current month/year
-        current_month = list(month_name).index(self.app.month_var.get())
-        current_year = self.app.year_var.get()
+        current_year, current_month = self.app._selected_period()
 
         # Ask for save location
         file_path = filedialog.asksaveasfilename(
@@ -847,9 +1020,7 @@ class TestingTab(ttk.Frame):
             
             # Write to CSV
             with open(file_path, 'w', newline='') as csvfile:
-                writer = csv.writer(csvfile)
-                for worker_name, vacation_date in vacations:
-                    writer.writerow([worker_name, vacation_date])
+                csv.writer(csvfile).writerows(vacations)
             
             messagebox.showinfo("Success", f"Sample vacations file created with {len(vacations)} vacation days.\n\nFile saved to: {file_path}")
             
@@ -1057,29 +1228,85 @@ class ShiftSchedulerApp:
         self.worker_listbox: Any = None
         self.unavailable_list: Any = None
         self.required_list: Any = None
-        self.schedule_grid_frame: Any = None  # Custom grid frame for schedule display
-        self.schedule_canvas: Any = None  # Canvas for scrollable schedule
+        self.schedule_canvas: Any = None  # Canvas the schedule grid is drawn on
         self.schedule_legend_frame: Any = None  # Legend frame for worker colors
-        self._schedule_cells = {}  # Store cell labels for editing
+        # [row, col] -> (rectangle id, text id) on the canvas, one row per drawn day
+        self._schedule_item_ids = np.zeros((0, len(SCHEDULE_COLUMNS), 2), dtype=np.int64)
+        # [row, col] -> code of the (text, bg, fg) spec currently drawn
+        self._schedule_drawn = np.zeros((0, len(SCHEDULE_COLUMNS)), dtype=np.int32)
+        self._cell_spec_codes = {}  # (text, bg, fg) spec -> code, so drawn grids diff as arrays
+        self._cell_specs = []       # code -> spec
         self._schedule_data = []   # Store row data for export/save
+        self._schedule_display_key: Optional[tuple] = None  # Inputs of the schedule shown, None once edited
+        self._schedule_rows = []   # Per-row (text, bg, fg) cell specs for rendering
+        self._schedule_headers = []  # Header (rectangle id, text id) pairs, created once
+        self._rebuild_scheduled = False  # True while a grid rebuild is queued on idle
+        # Fixed row geometry lets clicks map straight to row indices
+        self._schedule_row_height = self.body_font.metrics("linespace") + 8
+        self._schedule_header_height = self.heading_font.metrics("linespace") + 6
+        self._schedule_canvas_width = 0
+        self._schedule_col_widths: list[int] = []
+        self._schedule_edges: list[float] = []  # Column x boundaries, len(columns) + 1
+        self._schedule_layout_widths: Optional[list[int]] = None  # Minimum widths the items were placed for
+        self._schedule_scrollregion: Optional[tuple] = None  # Scrollregion last set on the canvas
+        self._schedule_layout_width: Optional[int] = None  # Canvas width awaiting a coalesced layout
+        self._set_schedule_col_widths(SCHEDULE_COL_WIDTHS)
+        self._schedule_widths_index: Optional[list[tuple[str, str, str]]] = None  # Color index the widths fit
+        self._worker_cell_specs: dict[str, tuple[str, str, str]] = {}  # name -> (name, bg, fg) cell spec
+        self._worker_color_index: Optional[list[tuple[str, str, str]]] = None  # [(name, bg, fg)]
+        self._worker_index: dict[str, int] = {}  # name -> position in the worker list
+        # Pooled legend widgets: (frame, swatch canvas, swatch item, name label)
+        self._legend_items: list[tuple[Any, Any, int, Any]] = []
+        self._legend_index: Optional[list[tuple[str, str, str]]] = None
+        self._legend_shown: list[tuple[str, str]] = []  # (name, color) each pooled entry shows
+        self._legend_visible = 0  # Pooled entries currently packed
+        self._workers_cache: Optional[list[dict]] = None
+        self._unavail_cache: Optional[dict[str, list[str]]] = None
+        self._req_cache: Optional[dict[str, list[str]]] = None
         self.reports_tree: Any = None
         self.holidays_var: Any = None  # Initialize to None
         
         # Last schedule result for dashboard updates
         self._last_result: Optional[ScheduleResult] = None
-
-    # Property aliases for backwards compatibility with tab classes
+        self._generating = False  # True while the solver runs on a background thread
+        self._ui_queue: queue.Queue = queue.Queue()  # (callback, arg) posted by _run_io threads
+        self._background_jobs = 0  # _run_io threads that haven't been handled yet
+        self._holidays_refresh_pending = False
+        self._selected_period_cache: Optional[tuple[int, int]] = None  # (year, month)
+        self._holidays_cache: dict[tuple[int, int], list[int]] = {}
+        # RULES.md contents, read on first use
+        self._rules_cache: Optional[str] = None
+        self.worker_tab: Any = None
+        self.reports_tab: Any = None
+        # Key of the inputs behind the most recently requested dashboard figure
+        self._dashboard_key: Optional[tuple] = None
+        # Bars of the figure on screen, reused while its layout is unchanged
+        self._dashboard_layout: tuple = ()  # _dashboard_layout_state() of the figure on screen
+        self._dashboard_after_id: Optional[str] = None  # Pending coalesced refresh
+        self._dashboard_axes: dict[str, Any] = {}
+        self._dashboard_bars: dict[str, Any] = {}  # stat -> PolyCollection of its bars
+        self._dashboard_over: Any = None  # Per-stat imbalance highlight currently shown
+        self._dashboard_backgrounds: dict[str, Any] = {}  # stat -> axes background for blitting
+
+    # Property aliases for backwards compatibility with tab classes.
+    # Views are cached until _invalidate_worker_caches() is called.
     @property
     def workers(self):
-        return [w.to_dict() for w in self.scheduler.workers]
+        if self._workers_cache is None:
+            self._workers_cache = [w.to_dict() for w in self.scheduler.workers]
+        return self._workers_cache
 
     @property
     def unavail(self):
-        return {w.name: self.scheduler.get_unavailable(w.name) for w in self.scheduler.workers}
+        if self._unavail_cache is None:
+            self._unavail_cache = {w.name: self.scheduler.get_unavailable(w.name) for w in self.scheduler.workers}
+        return self._unavail_cache
 
     @property
     def req(self):
-        return {w.name: self.scheduler.get_required(w.name) for w in self.scheduler.workers}
+        if self._req_cache is None:
+            self._req_cache = {w.name: self.scheduler.get_required(w.name) for w in self.scheduler.workers}
+        return self._req_cache
 
     @property
     def history(self):
@@ -1089,6 +1316,46 @@ class ShiftSchedulerApp:
     def thresholds(self):
         return self.scheduler.thresholds
 
+    def _build_color_index(self) -> list[tuple[str, str, str]]:
+        """Return [(name, background, foreground), ...] for all workers.
+
+        Built in one pass over the workers per invalidation, together with the
+        name -> cell spec lookup used by the schedule cells and the name ->
+        position lookup used by the edit dialog, and shared with the legend.
+        """
+        if self._worker_color_index is None:
+            index = [(w.name, w.color, get_contrast_color(w.color)) for w in self.scheduler.workers]
+            self._worker_cell_specs = {spec[0]: spec for spec in index}
+            self._worker_index = {name: i for i, (name, _, _) in enumerate(index)}
+            self._worker_color_index = index
+        return self._worker_color_index
+
+    def _schedule_cell_spec(self, name: str, base_bg: str) -> tuple[str, str, str]:
+        """Return the (text, background, foreground) spec of a shift cell.
+
+        Workers get their own colors; other cells keep the row background.
+        """
+        if self._worker_color_index is None:
+            self._build_color_index()
+        return self._worker_cell_specs.get(name) or (name, base_bg, FALLBACK_CELL_FG[bool(name)])
+
+    def _holidays(self, year: int, month: int) -> list[int]:
+        """Return the month's holidays, cached until manual holidays change."""
+        key = (year, month)
+        holidays = self._holidays_cache.get(key)
+        if holidays is None:
+            holidays = self._holidays_cache[key] = self.scheduler.get_holidays(year, month)
+        return holidays
+
+    def _invalidate_worker_caches(self):
+        """Drop cached worker views after workers or their availability change."""
+        self._worker_cell_specs.clear()
+        self._worker_color_index = None
+        self._worker_index.clear()
+        self._workers_cache = None
+        self._unavail_cache = None
+        self._req_cache = None
+
     def setup_status_and_progress(self):
         self.status_var = tk.StringVar(value="Ready")
         status_bar = ttk.Label(self.root, textvariable=self.status_var, relief="sunken", anchor="w", padding=5)
@@ -1130,7 +1397,7 @@ class ShiftSchedulerApp:
         ttk.Label(control_frame, text="Month:").grid(row=0, column=0, padx=10, pady=5)
         self.month_var = tk.StringVar()
         month_combo = ttk.Combobox(control_frame, textvariable=self.month_var,
-                                   values=list(month_name)[1:], state="readonly")
+                                   values=MONTH_NAMES, state="readonly")
         month_combo.grid(row=0, column=1, padx=10, pady=5)
         month_combo.set(datetime.now().strftime("%B"))
         Tooltip(month_combo, "Select the month for the schedule")
@@ -1143,8 +1410,8 @@ class ShiftSchedulerApp:
         year_spin.grid(row=0, column=3, padx=10, pady=5)
         Tooltip(year_spin, "Select or increment the year")
 
-        self.month_var.trace("w", lambda *args: self.update_holidays_display())
-        self.year_var.trace("w", lambda *args: self.update_holidays_display())
+        self.month_var.trace("w", lambda *args: self._on_period_change())
+        self.year_var.trace("w", lambda *args: self._on_period_change())
 
         generate_btn = ttk.Button(control_frame, text="Generate Schedule",
                                   command=self.generate_schedule_wrapper)
@@ -1177,14 +1444,24 @@ class ShiftSchedulerApp:
         reset_btn.grid(row=1, column=4, padx=10, pady=5)
         Tooltip(reset_btn, "Reset the schedule and reload historic data for the selected month")
 
+    def _read_rules(self) -> str:
+        """Return the RULES.md text, reading the file only the first time."""
+        if self._rules_cache is None:
+            with open(RULES_FILE, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    self._rules_cache = ""
+                else:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        self._rules_cache = mm[:].decode('utf-8')
+        return self._rules_cache
+
     def open_rules(self):
         """Open a window displaying the scheduling rules from RULES.md."""
         try:
-            if not os.path.exists(RULES_FILE):
+            if self._rules_cache is None and not os.path.exists(RULES_FILE):
                 messagebox.showwarning("Rules", "Rules file not found: RULES.md")
                 return
-            with open(RULES_FILE, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = self._read_rules()
         except Exception as e:
             logger.error(f"Could not read RULES.md: {e}", exc_info=True)
             messagebox.showerror("Rules", f"Could not read rules file: {e}")
@@ -1202,8 +1479,23 @@ class ShiftSchedulerApp:
         text.pack(side="left", fill="both", expand=True)
         vsb.pack(side="right", fill="y")
 
-        text.insert("1.0", content)
-        text.config(state="disabled")
+        if len(content) <= RULES_CHUNK_CHARS:
+            text.insert("1.0", content)
+            text.config(state="disabled")
+            return
+
+        # Large file: show the window right away and fill it in while idle
+        def insert_chunk(start=0):
+            if not text.winfo_exists():
+                return  # Window closed before loading finished
+            end = start + RULES_CHUNK_CHARS
+            text.insert("end-1c", content[start:end])
+            if end < len(content):
+                self.root.after_idle(insert_chunk, end)
+            else:
+                text.config(state="disabled")
+
+        insert_chunk()
 
     def create_tabbed_content(self):
         self.notebook = ttk.Notebook(self.main_frame)
@@ -1211,15 +1503,19 @@ class ShiftSchedulerApp:
         self.main_frame.rowconfigure(1, weight=1)
 
         self.notebook.add(ScheduleTab(self.notebook, self), text="Schedule")
-        self.notebook.add(WorkerTab(self.notebook, self), text="Workers")
-        self.notebook.add(ReportsTab(self.notebook, self), text="Reports")
+        self.worker_tab = WorkerTab(self.notebook, self)
+        self.notebook.add(self.worker_tab, text="Workers")
+        self.reports_tab = ReportsTab(self.notebook, self)
+        self.notebook.add(self.reports_tab, text="Reports")
         self.notebook.add(SettingsTab(self.notebook, self), text="Settings")
         self.notebook.add(TestingTab(self.notebook, self), text="Testing")
 
     def generate_schedule_wrapper(self):
+        if self._generating:
+            self.status_var.set("Schedule generation already running")
+            return
         try:
-            month = list(month_name).index(self.month_var.get())
-            year = self.year_var.get()
+            year, month = self._selected_period()
         except ValueError:
             messagebox.showerror("Error", "Invalid month or year")
             return
@@ -1239,12 +1535,20 @@ class ShiftSchedulerApp:
         self.progress.start()
         self.status_var.set("Generating schedule...")
 
-        self.root.after(100, lambda: self._run_generate_schedule(year, month))
+        # The solver can run for minutes; keep it off the Tk thread so the
+        # window stays responsive and the progress bar keeps animating. It
+        # works on a snapshot of the inputs; the result is applied back on
+        # the Tk thread, so edits made meanwhile can't mix into the solve
+        logger.info(f"Generating schedule for {month}/{year} with {len(self.scheduler.workers)} workers")
+        request = self.scheduler.prepare_generation(year, month)
+        self._generating = True
+        self._run_io(lambda: self.scheduler.solve(request),
+                     lambda result: self._finish_generate_schedule(year, month, result),
+                     self._generate_schedule_failed)
 
     def view_history_wrapper(self):
         try:
-            month = list(month_name).index(self.month_var.get())
-            year = self.year_var.get()
+            year, month = self._selected_period()
         except ValueError:
             messagebox.showerror("Error", "Invalid month or year")
             return
@@ -1255,11 +1559,10 @@ class ShiftSchedulerApp:
 
         self.root.after(100, lambda: self._run_view_history(year, month))
 
-    def _run_generate_schedule(self, year, month):
-        logger.info(f"Generating schedule for {month}/{year} with {len(self.scheduler.workers)} workers")
-        
-        # Use the scheduler service to generate
-        result = self.scheduler.generate(year, month)
+    def _finish_generate_schedule(self, year, month, result):
+        """Show a generated schedule once the solver thread is done."""
+        self._generating = False
+        self.scheduler.apply_result(result)
         self._last_result = result
 
         self.progress.stop()
@@ -1268,7 +1571,7 @@ class ShiftSchedulerApp:
         if result.success:
             self.status_var.set("Schedule generated")
             logger.info(f"Schedule generated successfully with {len(result.assignments)} assignments")
-            all_holidays = self.scheduler.get_holidays(year, month)
+            all_holidays = self._holidays(year, month)
             self.update_schedule_display(result.schedule, all_holidays)
             self.generate_report()
         else:
@@ -1282,6 +1585,14 @@ class ShiftSchedulerApp:
             
             messagebox.showerror("Error", error_msg)
 
+    def _generate_schedule_failed(self, error):
+        self._generating = False
+        self.progress.stop()
+        self.progress.grid_remove()
+        self.status_var.set("Schedule failed")
+        logger.error(f"Schedule generation raised: {error}")
+        messagebox.showerror("Error", f"Schedule generation failed: {error}")
+
     def _run_view_history(self, year, month):
         logger.info(f"Viewing history for {month}/{year}")
         
@@ -1316,15 +1627,14 @@ class ShiftSchedulerApp:
         self.status_var.set("History loaded")
 
         logger.info(f"History loaded with {len(assignments)} assignments")
-        all_holidays = self.scheduler.get_holidays(year, month)
+        all_holidays = self._holidays(year, month)
         self.update_schedule_display(schedule, all_holidays)
         # Optionally generate report
         # self.generate_report()
 
     def reset_schedule_wrapper(self):
         try:
-            month = list(month_name).index(self.month_var.get())
-            year = self.year_var.get()
+            year, month = self._selected_period()
         except ValueError:
             messagebox.showerror("Error", "Invalid month or year")
             return
@@ -1377,23 +1687,16 @@ class ShiftSchedulerApp:
         # Update the worker_var for compatibility
         self.worker_var.set(worker)
 
-        # Get stats from the service
-        stats = self.scheduler.get_worker_stats(worker)
-
         # Update unavailable list from service
         self.unavailable_list.delete(0, tk.END)
-        for item in self.scheduler.get_unavailable(worker):
-            self.unavailable_list.insert(tk.END, item)
+        self.unavailable_list.insert(tk.END, *self.scheduler.get_unavailable(worker))
 
         # Update required list from service
         self.required_list.delete(0, tk.END)
-        for item in self.scheduler.get_required(worker):
-            self.required_list.insert(tk.END, item)
+        self.required_list.insert(tk.END, *self.scheduler.get_required(worker))
         
         # Update shift allocation percentages display
-        worker_tab = self.notebook.nametowidget(self.notebook.tabs()[1])
-        if hasattr(worker_tab, 'update_allocation_display'):
-            worker_tab.update_allocation_display(worker)
+        self.worker_tab.update_allocation_display(worker)
 
     def generate_report(self):
         self.reports_tree.delete(*self.reports_tree.get_children())
@@ -1405,49 +1708,206 @@ class ShiftSchedulerApp:
 
         # Use the service to generate all worker stats
         all_stats = self.scheduler.generate_all_worker_stats(weeks_lookback=52)
-        
-        for stats in all_stats:
-            self.reports_tree.insert("", "end", values=(
-                stats.name, stats.total_hours, stats.day_shifts, stats.night_shifts,
-                stats.weekend_holiday_shifts, stats.sat_night, stats.sat_day,
-                stats.sun_holiday_night, stats.sun_holiday_day, stats.fri_night
-            ))
+        rows = [
+            (stats.name, stats.total_hours, stats.day_shifts, stats.night_shifts,
+             stats.weekend_holiday_shifts, stats.sat_night, stats.sat_day,
+             stats.sun_holiday_night, stats.sun_holiday_day, stats.fri_night)
+            for stats in all_stats
+        ]
+
+        # Hide the columns while inserting so the tree redraws once at the end
+        tree = self.reports_tree
+        tree.configure(displaycolumns=())
+        insert = tree.insert
+        for row in rows:
+            insert("", "end", values=row)
+        tree.configure(displaycolumns="#all")
+        self._schedule_dashboard()
+
+    def _schedule_dashboard(self):
+        """Request a dashboard refresh, coalescing requests within DASHBOARD_REFRESH_MS."""
+        if self._dashboard_after_id is None:
+            self._dashboard_after_id = self.root.after(DASHBOARD_REFRESH_MS, self._flush_dashboard)
+
+    def _flush_dashboard(self):
+        self._dashboard_after_id = None
         self.update_dashboard()
 
     def update_dashboard(self):
         if self._last_result is None or not self._last_result.current_stats:
             return
 
-        workers_names = self.scheduler.worker_names
+        workers_names = list(self.scheduler.worker_names)
         equity_totals = self.scheduler.get_equity_totals()
         
         if not equity_totals:
             return
-            
-        fig = self.notebook.nametowidget(self.notebook.tabs()[2]).figure  # Get figure from ReportsTab
-        fig.clear()
 
+        # Gather everything the plot needs here on the Tk thread; the worker
+        # thread only ever touches its own Figure.
+        n_workers = len(workers_names)
+        default_totals = [0] * n_workers
+        # One row of bar heights (integer shift counts) per equity stat
+        heights = np.array(
+            [equity_totals.get(stat, default_totals) for stat in EQUITY_STATS],
+            dtype=np.int32,
+        ).reshape(len(EQUITY_STATS), n_workers)
+        thresholds = np.array([self.scheduler.thresholds.get(stat, 5) for stat in EQUITY_STATS], dtype=float)
+        key = (tuple(workers_names), heights.tobytes(), thresholds.tobytes())
+        if key == self._dashboard_key:
+            return  # Same inputs as the figure already shown (or being built)
+        self._dashboard_key = key
+
+        if n_workers:
+            over_threshold = (heights.max(axis=1) - heights.min(axis=1)) > thresholds
+        else:
+            over_threshold = np.zeros(len(EQUITY_STATS), dtype=bool)
+
+        if self._dashboard_axes and self._dashboard_layout_state(workers_names) == self._dashboard_layout:
+            # Same layout as the figure on screen: only the bar heights change
+            self._update_dashboard_bars(heights, over_threshold)
+            return
+
+        self.reports_tab.ensure_dashboard()
+        size = tuple(self.reports_tab.figure.get_size_inches())
+        self._run_io(
+            lambda: self._plot_dashboard(key, workers_names, heights, over_threshold, size),
+            lambda figure: self._swap_dashboard_figure(*figure),
+            lambda e: logger.error(f"Failed to build the dashboard: {e}"),
+        )
+
+    @staticmethod
+    def _dashboard_layout_state(workers_names) -> tuple:
+        """Everything that decides the dashboard's axes, ticks and labels.
+
+        While this is unchanged, updates only touch the bars and skip all
+        layout work.
+        """
+        return (tuple(workers_names), tuple(EQUITY_STATS))
+
+    def _plot_dashboard(self, key, workers_names, heights, over_threshold, size):
+        """Build the dashboard on a fresh Figure off the Tk thread.
+
+        The figure gets a plain Agg canvas for layout; it is moved onto the
+        Tk canvas only when it is swapped in.
+
+        Returns:
+            Arguments for _swap_dashboard_figure
+        """
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.collections import PolyCollection
+
+        fig = Figure(figsize=size, dpi=100)
+        FigureCanvasAgg(fig)
+        axes = {}
+        bars = {}
+
+        x = np.arange(len(workers_names))
         rows, cols = 4, 3  # For 10 stats (4 rows x 3 cols = 12 slots)
         for idx, stat in enumerate(EQUITY_STATS):
             ax = fig.add_subplot(rows, cols, idx + 1)
-            totals = equity_totals.get(stat, [0] * len(workers_names))
-            ax.bar(workers_names, totals, color='skyblue')
+            axes[stat] = ax
+            # All bars of a stat are one collection artist; it is animated so it
+            # can be blitted over a cached axes background
+            bars[stat] = PolyCollection(bar_polygons(heights[idx]), facecolors='skyblue', animated=True)
+            ax.add_collection(bars[stat], autolim=False)
+            ax.set_xlim(-0.5, len(workers_names) - 0.5)
+            ax.set_ylim(*bar_ylim(heights[idx]))
+            ax.set_xticks(x)
+            ax.set_xticklabels(workers_names, rotation=45)
             ax.set_title(stat.replace('_', ' ').title())
-            ax.tick_params(axis='x', rotation=45)
-            imbalance = max(totals) - min(totals) if totals else 0
-            threshold = self.scheduler.thresholds.get(stat, 5)
-            if imbalance > threshold:
+            if over_threshold[idx]:
                 ax.set_facecolor('lightcoral')
             ax.set_ylabel('Count')
 
         fig.tight_layout()
-        self.notebook.nametowidget(self.notebook.tabs()[2]).canvas.draw()
+        return key, fig, tuple(workers_names), axes, bars, over_threshold
+
+    def _swap_dashboard_figure(self, key, fig, workers_names, axes, bars, over_threshold):
+        """Show a figure built by _plot_dashboard (runs on the Tk thread)."""
+        if key != self._dashboard_key:
+            return  # Superseded by a newer request
+        canvas = self.reports_tab.canvas
+        fig.set_canvas(canvas)
+        canvas.figure = fig
+        self.reports_tab.figure = fig
+        self._dashboard_layout = self._dashboard_layout_state(workers_names)
+        self._dashboard_axes = axes
+        self._dashboard_bars = bars
+        self._dashboard_over = over_threshold
+        self._dashboard_backgrounds = {}
+        # Event callbacks live on the figure, so connect for every new figure
+        canvas.mpl_connect('draw_event', self._on_dashboard_draw)
+        canvas.draw_idle()
+
+    def _on_dashboard_draw(self, event):
+        """After a full redraw, cache each axes background and paint the bars."""
+        canvas = self.reports_tab.canvas
+        for stat, ax in self._dashboard_axes.items():
+            self._dashboard_backgrounds[stat] = canvas.copy_from_bbox(ax.bbox)
+            ax.draw_artist(self._dashboard_bars[stat])
+
+    def _update_dashboard_bars(self, heights, over_threshold):
+        """Update the existing dashboard bars in place.
+
+        When no axes limits or highlights change, only the bars are repainted
+        by blitting them over the cached axes backgrounds; otherwise a full
+        redraw is requested with draw_idle.
+        """
+        from matplotlib import rcParams
+
+        full_redraw = not self._dashboard_backgrounds
+        for idx, stat in enumerate(EQUITY_STATS):
+            self._dashboard_bars[stat].set_verts(bar_polygons(heights[idx]))
+            ax = self._dashboard_axes[stat]
+            if over_threshold[idx] != self._dashboard_over[idx]:
+                ax.set_facecolor('lightcoral' if over_threshold[idx] else rcParams['axes.facecolor'])
+                full_redraw = True
+            ylim = bar_ylim(heights[idx])
+            if tuple(ax.get_ylim()) != ylim:
+                ax.set_ylim(*ylim)
+                full_redraw = True
+        self._dashboard_over = over_threshold
+
+        canvas = self.reports_tab.canvas
+        if full_redraw:
+            canvas.draw_idle()
+            return
+        for stat, ax in self._dashboard_axes.items():
+            canvas.restore_region(self._dashboard_backgrounds[stat])
+            ax.draw_artist(self._dashboard_bars[stat])
+            canvas.blit(ax.bbox)
+
+    def _selected_period(self) -> tuple[int, int]:
+        """Return the (year, month) picked in the controls, parsed once per change.
+
+        Raises:
+            ValueError: If the month or year is not valid
+        """
+        if self._selected_period_cache is None:
+            self._selected_period_cache = (int(self.year_var.get()), month_index(self.month_var.get()))
+        return self._selected_period_cache
+
+    def _on_period_change(self):
+        self._selected_period_cache = None
+        self._request_holidays_refresh()
+
+    def _request_holidays_refresh(self):
+        """Coalesce month/year changes into one holidays refresh when idle."""
+        if self._holidays_refresh_pending:
+            return
+        self._holidays_refresh_pending = True
+        self.root.after_idle(self._flush_holidays_display)
+
+    def _flush_holidays_display(self):
+        self._holidays_refresh_pending = False
+        self.update_holidays_display()
 
     def update_holidays_display(self):
         try:
-            month = list(month_name).index(self.month_var.get())
-            year = self.year_var.get()
-            all_holidays = self.scheduler.get_holidays(year, month)
+            year, month = self._selected_period()
+            all_holidays = self._holidays(year, month)
             if all_holidays:
                 display = ", ".join(map(str, all_holidays))
             else:
@@ -1470,13 +1930,19 @@ class ShiftSchedulerApp:
         if not file_path:
             return  # User canceled
 
-        if self.scheduler.load_history(file_path):
+        def loaded(history):
+            self.scheduler.merge_history(history)
             self.status_var.set("Historic data loaded successfully")
             self.update_worker_stats()  # Refresh UI if needed
             self.generate_report()  # Optional: Refresh reports
-        else:
+
+        def failed(e):
+            logger.error(f"Failed to load history: {e}")
             messagebox.showerror("Error", "Failed to load history file")
 
+        self.status_var.set("Loading historic data...")
+        self._run_io(lambda: read_history_file(file_path), loaded, failed)
+
     def save_schedule(self):
         if not self.scheduler.history:
             messagebox.showwarning("Warning", "No schedule data to save")
@@ -1491,11 +1957,53 @@ class ShiftSchedulerApp:
         if not file_path:
             return  # User canceled
 
-        if self.scheduler.save_history(file_path):
+        def saved(_):
+            logger.info(f"History saved to {file_path}")
             self.status_var.set("Schedule saved successfully")
-        else:
+
+        def failed(e):
+            logger.error(f"Failed to save history: {e}")
             messagebox.showerror("Error", "Failed to save schedule file")
 
+        # Serialize here: the history may change while the thread writes
+        data = dumps_json(self.scheduler.history)
+        self.status_var.set("Saving schedule...")
+        self._run_io(lambda: write_history_file(file_path, data), saved, failed)
+
+    def _run_io(self, work, on_done, on_error):
+        """Run work() on a background thread so slow work doesn't block the UI.
+
+        Its result is passed to on_done, or the exception it raised to
+        on_error, back on the Tk thread. The thread never touches Tk: it
+        posts to a queue that the Tk thread polls while jobs are running.
+        """
+        def run():
+            try:
+                result = work()
+            except Exception as e:
+                self._ui_queue.put((on_error, e))
+            else:
+                self._ui_queue.put((on_done, result))
+
+        self._background_jobs += 1
+        if self._background_jobs == 1:
+            self.root.after(UI_QUEUE_POLL_MS, self._drain_ui_queue)
+        threading.Thread(target=run, daemon=True).start()
+
+    def _drain_ui_queue(self):
+        """Run the callbacks posted by _run_io threads; poll again while any are still running."""
+        try:
+            while True:
+                try:
+                    callback, arg = self._ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                self._background_jobs -= 1
+                callback(arg)
+        finally:
+            if self._background_jobs:
+                self.root.after(UI_QUEUE_POLL_MS, self._drain_ui_queue)
+
     def save_workers_config(self):
         """Save current workers and thresholds to config.yaml file."""
         if self.scheduler.save_config():
@@ -1594,13 +2102,9 @@ class ShiftSchedulerApp:
         file = filedialog.askopenfilename(filetypes=[("CSV files", "*.csv")])
         if file:
             logger.info(f"Importing workers from {file}")
-            with open(file, 'r') as f:
-                reader = csv.reader(f)
-                new_names = [row[0] for row in reader if row]
-            added_count = 0
-            for name in new_names:
-                if self.scheduler.add_worker(name):
-                    added_count += 1
+            with open(file, 'r', newline='') as f:
+                added_count = len(self.scheduler.add_workers(row[0] for row in csv.reader(f) if row))
+            self._invalidate_worker_caches()
             self.update_worker_listbox()
             self.status_var.set(f"Workers imported: {added_count} new workers added")
 
@@ -1620,11 +2124,11 @@ class ShiftSchedulerApp:
         file = filedialog.askopenfilename(filetypes=[("CSV files", "*.csv")])
         if file:
             self.scheduler.clear_manual_holidays()
-            with open(file, 'r') as f:
-                reader = csv.reader(f)
-                for row in reader:
-                    if row:
-                        self.scheduler.add_manual_holiday(int(row[0]))
+            self._holidays_cache.clear()
+            # One day number per line: read the first field directly rather than through csv
+            with open(file, 'r', buffering=1 << 20) as f:
+                fields = (line.partition(',')[0].strip().strip('"') for line in f)
+                self.scheduler.add_manual_holidays(int(day) for day in fields if day)
             self.update_schedule_columns()  # Refresh
             self.update_holidays_display()
             self.status_var.set("Holidays imported")
@@ -1655,6 +2159,7 @@ class ShiftSchedulerApp:
                         vacation_date = row[1].strip()
                         if self.scheduler.add_unavailable(worker_name, vacation_date):
                             added_count += 1
+            self._invalidate_worker_caches()
             self.update_worker_stats()  # Refresh UI
             self.status_var.set(f"Vacations imported: {added_count} vacation days added")
 
@@ -1663,34 +2168,50 @@ class ShiftSchedulerApp:
         file = filedialog.asksaveasfilename(filetypes=formats)
         if file:
             ext = file.split('.')[-1]
-            columns = ["Day", "M1", "M2", "Night"]
-            if ext == 'pdf':
-                from reportlab.lib.pagesizes import letter
-                from reportlab.pdfgen import canvas
-                c = canvas.Canvas(file, pagesize=letter)
-                c.drawString(100, 750, "Schedule Export")
-                y = 700
-                for row in self._schedule_data:
-                    c.drawString(100, y, ' | '.join(str(v) for v in row))
-                    y -= 20
-                c.save()
-            elif ext == 'xlsx':
-                import openpyxl
-                wb = openpyxl.Workbook()
-                ws = wb.active
-                ws.append(columns)  # type: ignore
-                for row in self._schedule_data:
-                    ws.append(row)  # type: ignore
-                wb.save(file)
-            elif ext == 'csv':
-                import csv
-                with open(file, 'w', newline='') as f:
-                    writer = csv.writer(f)
-                    writer.writerow(columns)
-                    for row in self._schedule_data:
-                        writer.writerow(row)
-            self.status_var.set(f"Schedule exported to {file}")
-            messagebox.showinfo("Info", f"Exported to {file}")
+            # Snapshot the rows; edits made while the file is written don't leak in
+            rows = tuple(map(tuple, self._schedule_data))
+
+            def exported(_):
+                self.status_var.set(f"Schedule exported to {file}")
+                messagebox.showinfo("Info", f"Exported to {file}")
+
+            def failed(e):
+                messagebox.showerror("Error", f"Failed to export schedule: {e}")
+
+            self.status_var.set(f"Exporting schedule to {file}...")
+            self._run_io(lambda: self._write_schedule_export(file, ext, rows), exported, failed)
+
+    @staticmethod
+    def _write_schedule_export(file, ext, rows):
+        """Write schedule rows to a PDF, XLSX or CSV file (runs off the Tk thread)."""
+        columns = ["Day", "M1", "M2", "Night"]
+        if ext == 'pdf':
+            from reportlab.lib import colors
+            from reportlab.lib.pagesizes import letter
+            from reportlab.lib.styles import getSampleStyleSheet
+            from reportlab.platypus import Paragraph, SimpleDocTemplate, Table, TableStyle
+            # The table is split across pages, repeating the header row on each
+            table = Table([columns, *rows], repeatRows=1)
+            table.setStyle(TableStyle([
+                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+                ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+            ]))
+            doc = SimpleDocTemplate(file, pagesize=letter)
+            doc.build([Paragraph("Schedule Export", getSampleStyleSheet()['Title']), table])
+        elif ext == 'xlsx':
+            import openpyxl
+            # Write-only workbooks stream rows to disk instead of keeping the sheet in memory
+            wb = openpyxl.Workbook(write_only=True)
+            ws = wb.create_sheet("Schedule")
+            ws.append(columns)
+            for row in rows:
+                ws.append(row)
+            wb.save(file)
+        elif ext == 'csv':
+            with open(file, 'w', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(columns)
+                writer.writerows(rows)
 
     def set_today(self):
         now = datetime.now()
@@ -1706,11 +2227,11 @@ class ShiftSchedulerApp:
         top.grab_set()
 
         try:
-            month = list(month_name).index(self.month_var.get())
-            year = int(self.year_var.get())
+            year, month = self._selected_period()
         except (ValueError, TypeError):
             month, year = datetime.now().month, datetime.now().year
 
+        from tkcalendar import Calendar
         cal = Calendar(top, selectmode="day", year=year, month=month, date_pattern="yyyy-mm-dd")
         cal.pack(pady=10, padx=10)
 
@@ -1722,6 +2243,7 @@ class ShiftSchedulerApp:
 
             day = int(selected_date.split('-')[2])
             self.scheduler.add_manual_holiday(day)
+            self._holidays_cache.clear()
             self.update_schedule_columns()  # Refresh
             self.update_holidays_display()
             top.destroy()
@@ -1736,12 +2258,13 @@ class ShiftSchedulerApp:
             title="Export History"
         )
         if file_path:
-            try:
-                with open(file_path, 'w') as f:
-                    json.dump(self.scheduler._history, f, indent=2)
-                messagebox.showinfo("Success", "History exported successfully")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to export history: {e}")
+            # Serialize here: the history may change while the thread writes
+            data = dumps_json(self.scheduler._history)
+            self._run_io(
+                lambda: write_history_file(file_path, data),
+                lambda _: messagebox.showinfo("Success", "History exported successfully"),
+                lambda e: messagebox.showerror("Error", f"Failed to export history: {e}"),
+            )
 
     def import_history(self):
         file_path = filedialog.askopenfilename(
@@ -1749,15 +2272,17 @@ class ShiftSchedulerApp:
             title="Import History"
         )
         if file_path:
-            try:
-                with open(file_path, 'r') as f:
-                    loaded_history = json.load(f)
+            def imported(loaded_history):
                 self.scheduler._history = loaded_history
                 messagebox.showinfo("Success", "History imported successfully")
                 # Optionally refresh the display
                 self.update_holidays_display()
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to import history: {e}")
+
+            self._run_io(
+                lambda: read_history_file(file_path),
+                imported,
+                lambda e: messagebox.showerror("Error", f"Failed to import history: {e}"),
+            )
 
     def add_worker(self):
         top = tk.Toplevel(self.root)
@@ -1770,6 +2295,7 @@ class ShiftSchedulerApp:
         def confirm():
             name = name_var.get().strip()
             if name and self.scheduler.add_worker(name):
+                self._invalidate_worker_caches()
                 self.worker_var.set(name)
                 self.update_worker_listbox()
                 # Select the newly added worker
@@ -1785,6 +2311,7 @@ class ShiftSchedulerApp:
         worker = self.worker_var.get()
         if worker and messagebox.askyesno("Confirm", f"Remove {worker}?"):
             self.scheduler.remove_worker(worker)
+            self._invalidate_worker_caches()
             names = self.scheduler.worker_names
             self.worker_var.set(names[0] if names else "")
             self.update_worker_listbox()
@@ -1794,8 +2321,7 @@ class ShiftSchedulerApp:
 
     def update_worker_listbox(self):
         self.worker_listbox.delete(0, tk.END)
-        for name in self.scheduler.worker_names:
-            self.worker_listbox.insert(tk.END, name)
+        self.worker_listbox.insert(tk.END, *self.scheduler.worker_names)
         # Don't call update_worker_stats here as there might not be a selection
 
     def add_shift_availability(self, mode):
@@ -1811,11 +2337,12 @@ class ShiftSchedulerApp:
         top.grab_set()
 
         try:
-            month = list(month_name).index(self.month_var.get())
-            year = int(self.year_var.get())
+            year, month = self._selected_period()
         except (ValueError, TypeError):
             month, year = datetime.now().month, datetime.now().year
 
+        from tkcalendar import DateEntry
+
         # Start date
         ttk.Label(top, text="Start Date:").grid(row=0, column=0, padx=10, pady=5, sticky="w")
         cal_start = DateEntry(top, selectmode="day", year=year, month=month, date_pattern="yyyy-mm-dd")
@@ -1859,11 +2386,8 @@ class ShiftSchedulerApp:
         ttk.Checkbutton(shift_frame, text="Night", variable=night_var).grid(row=0, column=2, padx=5)
 
         target_list = self.unavailable_list if mode == "unavailable" else self.required_list
-        add_func = self.scheduler.add_unavailable if mode == "unavailable" else self.scheduler.add_required
-
-        def daterange(start_date, end_date):
-            for n in range(int((end_date - start_date).days) + 1):
-                yield start_date + timedelta(n)
+        add_entries = (self.scheduler.add_unavailable_entries if mode == "unavailable"
+                       else self.scheduler.add_required_entries)
 
         def confirm():
             start_dt = cal_start.get_date()  # Returns date object
@@ -1890,18 +2414,13 @@ class ShiftSchedulerApp:
             if night_var.get():
                 shifts.append("N")  # Logic uses 'N' for night
 
-            for dt in daterange(start_dt, end_dt):
-                selected_date = dt.strftime("%Y-%m-%d")
-                if not shifts:
-                    entry = selected_date
-                    if add_func(worker, entry):
-                        target_list.insert(tk.END, entry)
-                else:
-                    for sh in shifts:
-                        entry = f"{selected_date} {sh}"
-                        if add_func(worker, entry):
-                            target_list.insert(tk.END, entry)
+            dates = [(start_dt + timedelta(n)).isoformat() for n in range((end_dt - start_dt).days + 1)]
+            entries = [f"{d} {sh}" for d in dates for sh in shifts] if shifts else dates
+            added = add_entries(worker, entries)
+            if added:
+                target_list.insert(tk.END, *added)
 
+            self._invalidate_worker_caches()
             top.destroy()
 
         ttk.Button(top, text="Confirm", command=confirm).grid(row=4, column=0, columnspan=2, pady=5)
@@ -1917,6 +2436,7 @@ class ShiftSchedulerApp:
             idx = selected[0]
             remove_func = self.scheduler.remove_unavailable if mode == "unavailable" else self.scheduler.remove_required
             if remove_func(worker, idx):
+                self._invalidate_worker_caches()
                 target_list.delete(idx)
         else:
             messagebox.showwarning("Warning", "Please select an entry to remove")
@@ -1948,16 +2468,14 @@ class ShiftSchedulerApp:
 
         ttk.Label(top, text="Select Workers:").pack(pady=5)
         worker_list = tk.Listbox(top, selectmode="multiple", height=10, font=self.body_font)
-        worker_names = self.scheduler.worker_names
-        for name in worker_names:
-            worker_list.insert(tk.END, name)
+        color_index = self._build_color_index()
+        worker_list.insert(tk.END, *(name for name, _, _ in color_index))
         worker_list.pack(pady=5, padx=10, fill="both", expand=True)
 
         # Pre-select current workers if any
-        current_worker = self._schedule_data[row_index][col_index]
-        for i, name in enumerate(worker_names):
-            if name == current_worker:
-                worker_list.select_set(i)
+        i = self._worker_index.get(self._schedule_data[row_index][col_index])
+        if i is not None:
+            worker_list.select_set(i)
 
         def confirm():
             selected = [worker_list.get(i) for i in worker_list.curselection()]
@@ -1966,28 +2484,14 @@ class ShiftSchedulerApp:
             # Update the data
             self._schedule_data[row_index][col_index] = new_value
             
-            # Update the cell display
-            cell_key = (row_index, col_index)
-            if cell_key in self._schedule_cells:
-                cell_label = self._schedule_cells[cell_key]
-                worker_colors = {w.name: w.color for w in self.scheduler.workers}
-                
-                if new_value and new_value in worker_colors:
-                    bg_color = worker_colors[new_value]
-                    fg_color = get_contrast_color(bg_color)
-                    cell_label.configure(text=new_value, background=bg_color, foreground=fg_color)
-                else:
-                    # Determine row background
-                    is_odd = row_index % 2 == 1
-                    day_text = self._schedule_data[row_index][0]
-                    weekday = day_text.split('(')[1].rstrip(')') if '(' in day_text else ''
-                    if weekday in ['Sat', 'Sun']:
-                        bg = '#e0f7fa'
-                    elif is_odd:
-                        bg = '#f0f0f0'
-                    else:
-                        bg = '#ffffff'
-                    cell_label.configure(text=new_value, background=bg, foreground='red' if not new_value else '#000000')
+            # Update the cell spec; the row background is the Day column's background
+            spec = self._schedule_cell_spec(new_value, self._schedule_rows[row_index][0][1])
+            self._schedule_rows[row_index][col_index] = spec
+            self._schedule_display_key = None
+            
+            # Update the cell display if it has been drawn
+            if row_index < len(self._schedule_item_ids):
+                self._paint_schedule_cell(row_index, col_index, spec)
             
             self.status_var.set(f"Updated {shift} shift for Day {day}")
             top.destroy()
@@ -2002,83 +2506,31 @@ class ShiftSchedulerApp:
 
     def update_schedule_columns(self):
         """Initialize or reset the schedule grid with headers."""
-        # Clear existing grid content
-        for widget in self.schedule_grid_frame.winfo_children():
-            widget.destroy()
-        
-        self._schedule_cells = {}
+        self._schedule_display_key = None
         self._schedule_data = []
-        
-        # Define column headers
-        columns = ["Day", "M1", "M2", "Night"]
-        col_widths = [120, 150, 150, 150]
-        
-        # Create header row with style
-        for col_idx, (col_name, width) in enumerate(zip(columns, col_widths)):
-            header = tk.Label(
-                self.schedule_grid_frame,
-                text=col_name,
-                font=self.heading_font,
-                relief="raised",
-                borderwidth=1,
-                width=width // 10,  # Approximate character width
-                anchor="center",
-                bg="#d0d0d0"
-            )
-            header.grid(row=0, column=col_idx, sticky="nsew", padx=1, pady=1)
-            self.schedule_grid_frame.columnconfigure(col_idx, weight=1, minsize=width)
+        rows = []
 
         try:
-            month = list(month_name).index(self.month_var.get())
-            year = int(self.year_var.get())
+            year, month = self._selected_period()
             _, num_days = monthrange(year, month)
         except (ValueError, TypeError):
             month, year, num_days = datetime.now().month, datetime.now().year, 31
 
-        all_holidays = self.scheduler.get_holidays(year, month)
+        all_holidays = self._holidays(year, month)
+        month_days = np.datetime64(f"{year:04d}-{month:02d}-01") + np.arange(num_days)
+        day_numbers, weekdays, row_bgs = schedule_calendar(month_days, all_holidays)
 
-        for row_idx, day in enumerate(range(1, num_days + 1)):
-            dt = datetime(year, month, day)
-            weekday = day_name[dt.weekday()][:3]
-            day_text = f"{day} ({weekday})"
-            
-            # Determine row background color
-            is_odd = row_idx % 2 == 1
-            if weekday in ['Sat', 'Sun']:
-                row_bg = '#e0f7fa'  # Light cyan for weekends
-            elif day in all_holidays:
-                row_bg = '#ffebee'  # Light red for holidays
-            elif is_odd:
-                row_bg = '#f0f0f0'  # Alternating gray
-            else:
-                row_bg = '#ffffff'  # White
-            
-            row_data = [day_text, "", "", ""]
-            self._schedule_data.append(row_data)
-            
-            # Create cells for this row
-            for col_idx in range(4):
-                cell_text = day_text if col_idx == 0 else ""
-                cell = tk.Label(
-                    self.schedule_grid_frame,
-                    text=cell_text,
-                    font=self.body_font,
-                    relief="solid",
-                    borderwidth=1,
-                    anchor="center",
-                    bg=row_bg,
-                    padx=5,
-                    pady=3
-                )
-                cell.grid(row=row_idx + 1, column=col_idx, sticky="nsew", padx=0, pady=0)
-                self._schedule_cells[(row_idx, col_idx)] = cell
-                
-                # Bind double-click for editing (except Day column)
-                if col_idx > 0:
-                    cell.bind("<Double-1>", lambda e, r=row_idx, c=col_idx: self.edit_shift(r, c))
+        for day, weekday, row_bg in zip(day_numbers, weekdays, row_bgs):
+            day_text = f"{day} ({WEEKDAY_ABBRS[weekday]})"
+            self._schedule_data.append([day_text, "", "", ""])
+            rows.append([(day_text, row_bg, '#000000')] + [("", row_bg, '#000000')] * 3)
+        
+        color_index = self._build_color_index()
+        self._fit_schedule_columns(color_index)
+        self._set_schedule_rows(rows)
         
         # Update worker color legend
-        self._update_worker_legend()
+        self._update_worker_legend(color_index)
 
     def sort_schedule_grid(self, col_name, reverse=False):
         """Sort the schedule grid by column (placeholder for future implementation)."""
@@ -2092,129 +2544,288 @@ class ShiftSchedulerApp:
             schedule: Dictionary mapping date strings to shift assignments
             all_holidays: Set of holiday days in the month
         """
-        # Clear existing grid content
-        for widget in self.schedule_grid_frame.winfo_children():
-            widget.destroy()
-        
-        self._schedule_cells = {}
+        color_index = self._build_color_index()
+        # Sort schedule by date once (ISO date strings sort chronologically);
+        # day numbers and weekdays come from one vectorised parse of the keys
+        sorted_items = sorted(schedule.items())
+        key = ([(day_str, dict(shifts)) for day_str, shifts in sorted_items], list(all_holidays), color_index)
+        if key == self._schedule_display_key:
+            return  # The grid already shows exactly this schedule
+        self._schedule_display_key = key
+
         self._schedule_data = []
+        rows = []
+        worker_specs = self._worker_cell_specs
+        day_numbers, weekdays, row_bgs = schedule_calendar([day_str for day_str, _ in sorted_items], all_holidays)
         
-        # Build a mapping of worker names to colors
-        worker_colors = {w.name: w.color for w in self.scheduler.workers}
-        
-        # Define column headers
-        columns = ["Day", "M1", "M2", "Night"]
-        col_widths = [120, 150, 150, 150]
-        
-        # Create header row
-        for col_idx, (col_name, width) in enumerate(zip(columns, col_widths)):
-            header = tk.Label(
-                self.schedule_grid_frame,
-                text=col_name,
-                font=self.heading_font,
-                relief="raised",
-                borderwidth=1,
-                width=width // 10,
-                anchor="center",
-                bg="#d0d0d0"
-            )
-            header.grid(row=0, column=col_idx, sticky="nsew", padx=1, pady=1)
-            self.schedule_grid_frame.columnconfigure(col_idx, weight=1, minsize=width)
-        
-        # Sort schedule by date
-        sorted_days = sorted(schedule.keys())
-        
-        for row_idx, day_str in enumerate(sorted_days):
-            dt = datetime.fromisoformat(day_str)
-            day = dt.day
-            weekday = day_name[dt.weekday()][:3]
-            day_text = f"{day} ({weekday})"
+        for (_, shifts), day, weekday, base_bg in zip(sorted_items, day_numbers, weekdays, row_bgs):
+            day_text = f"{day} ({WEEKDAY_ABBRS[weekday]})"
             
             # Get worker names for each shift
-            m1_name = schedule[day_str].get('M1', '')
-            m2_name = schedule[day_str].get('M2', '')
-            n_name = schedule[day_str].get('N', '')
+            m1_name = shifts.get('M1', '')
+            m2_name = shifts.get('M2', '')
+            n_name = shifts.get('N', '')
             
             # Store row data for export/editing
             row_data = [day_text, m1_name, m2_name, n_name]
             self._schedule_data.append(row_data)
             
-            # Determine base row background color (for Day column)
-            is_odd = row_idx % 2 == 1
-            if weekday in ['Sat', 'Sun']:
-                base_bg = '#e0f7fa'  # Light cyan for weekends
-            elif day in all_holidays:
-                base_bg = '#ffebee'  # Light red for holidays
-            elif is_odd:
-                base_bg = '#f0f0f0'  # Alternating gray
-            else:
-                base_bg = '#ffffff'  # White
-            
-            # Create cells for this row
-            cell_data = [
-                (day_text, base_bg, '#000000'),  # Day column
-                (m1_name, worker_colors.get(m1_name, base_bg) if m1_name else base_bg, None),
-                (m2_name, worker_colors.get(m2_name, base_bg) if m2_name else base_bg, None),
-                (n_name, worker_colors.get(n_name, base_bg) if n_name else base_bg, None),
-            ]
-            
-            for col_idx, (text, bg_color, fg_override) in enumerate(cell_data):
-                # Calculate foreground color for contrast
-                if fg_override:
-                    fg_color = fg_override
-                elif text and col_idx > 0 and text in worker_colors:
-                    fg_color = get_contrast_color(bg_color)
-                elif not text and col_idx > 0:
-                    # Empty shift cell - mark as understaffed
-                    fg_color = 'red'
-                else:
-                    fg_color = '#000000'
-                
-                cell = tk.Label(
-                    self.schedule_grid_frame,
-                    text=text,
-                    font=self.body_font,
-                    relief="solid",
-                    borderwidth=1,
-                    anchor="center",
-                    bg=bg_color,
-                    fg=fg_color,
-                    padx=5,
-                    pady=3
-                )
-                cell.grid(row=row_idx + 1, column=col_idx, sticky="nsew", padx=0, pady=0)
-                self._schedule_cells[(row_idx, col_idx)] = cell
-                
-                # Bind double-click for editing (except Day column)
-                if col_idx > 0:
-                    cell.bind("<Double-1>", lambda e, r=row_idx, c=col_idx: self.edit_shift(r, c))
+            # Cell specs for this row: (text, background, foreground). Workers'
+            # specs are prebuilt; other cells keep the row background, and
+            # empty ones are marked as understaffed
+            rows.append([(day_text, base_bg, '#000000')] + [
+                worker_specs.get(name) or (name, base_bg, FALLBACK_CELL_FG[bool(name)])
+                for name in (m1_name, m2_name, n_name)
+            ])
+        
+        self._fit_schedule_columns(color_index)
+        self._set_schedule_rows(rows)
         
         # Update the worker color legend
-        self._update_worker_legend()
+        self._update_worker_legend(color_index)
 
-    def _update_worker_legend(self):
-        """Update the worker color legend in the Schedule tab."""
-        if not hasattr(self, 'schedule_legend_frame'):
-            return
+    def _set_schedule_rows(self, rows):
+        """Replace the grid's cell specs and schedule a re-render.
         
-        # Clear existing legend items
-        for widget in self.schedule_legend_frame.winfo_children():
-            widget.destroy()
+        The specs are stored immediately so editing and export see the new
+        data; the canvas work is coalesced into one idle callback, so several
+        updates in the same event (e.g. columns reset then display) render once.
         
-        # Create legend items for each worker
-        for i, worker in enumerate(self.scheduler.workers):
-            # Create a frame for each worker entry
-            worker_frame = ttk.Frame(self.schedule_legend_frame)
+        Args:
+            rows: One list per day of (text, background, foreground) cell specs
+        """
+        self._schedule_rows = rows
+        self._request_schedule_rebuild()
+
+    def _request_schedule_rebuild(self):
+        """Schedule a grid rebuild on idle unless one is already pending."""
+        if not self._rebuild_scheduled:
+            self._rebuild_scheduled = True
+            self.root.after_idle(self._do_schedule_rebuild)
+
+    def _cell_spec_code(self, spec):
+        """Return the interned code of a (text, bg, fg) cell spec."""
+        code = self._cell_spec_codes.get(spec)
+        if code is None:
+            code = self._cell_spec_codes[spec] = len(self._cell_specs)
+            self._cell_specs.append(spec)
+        return code
+
+    def _do_schedule_rebuild(self):
+        """Bring the canvas items in line with the current row specs.
+        
+        Items are kept across rebuilds. The new specs are encoded as an
+        array of spec codes and compared with the drawn one, so only cells
+        whose spec changed are reconfigured; items for rows that no longer
+        exist are deleted and new rows get fresh items.
+        """
+        self._rebuild_scheduled = False
+        canvas = self.schedule_canvas
+        rows = self._schedule_rows
+        ids = self._schedule_item_ids
+
+        self._ensure_schedule_headers()
+
+        codes = np.array([[self._cell_spec_code(spec) for spec in row] for row in rows],
+                         dtype=np.int32).reshape(len(rows), len(SCHEDULE_COLUMNS))
+        kept = min(len(ids), len(rows))
+        if len(ids) > kept:
+            canvas.delete(*ids[kept:].ravel().tolist())
+
+        for row_idx, col_idx in zip(*np.nonzero(codes[:kept] != self._schedule_drawn[:kept])):
+            self._paint_schedule_cell(row_idx, col_idx, rows[row_idx][col_idx])
+
+        columns = self._schedule_column_geometry()
+        row_height = self._schedule_row_height
+        new_ids = np.zeros((len(rows) - kept, len(SCHEDULE_COLUMNS), 2), dtype=np.int64)
+        for row_idx in range(kept, len(rows)):
+            y0 = self._schedule_header_height + row_idx * row_height
+            y1, cy = y0 + row_height, y0 + row_height / 2
+            new_ids[row_idx - kept] = [
+                (canvas.create_rectangle(x0, y0, x1, y1, fill=bg_color, outline="black", tags=SCHEDULE_GRID_TAG),
+                 canvas.create_text(cx, cy, text=text, fill=fg_color, font=self.body_font, tags=SCHEDULE_GRID_TAG))
+                for (x0, x1, cx), (text, bg_color, fg_color) in zip(columns, rows[row_idx])
+            ]
+
+        self._schedule_item_ids = np.concatenate((ids[:kept], new_ids))
+        self._schedule_drawn = codes
+        self._update_schedule_scrollregion()
+
+    def _paint_schedule_cell(self, row_idx, col_idx, spec):
+        """Recolor and relabel one drawn cell.
+
+        Only the options that differ from what the cell shows are sent to Tk.
+        """
+        text, bg_color, fg_color = spec
+        old_text, old_bg, old_fg = self._cell_specs[self._schedule_drawn[row_idx, col_idx]]
+        rect, label = self._schedule_item_ids[row_idx, col_idx].tolist()
+        if bg_color != old_bg:
+            self.schedule_canvas.itemconfigure(rect, fill=bg_color)
+        label_options = {}
+        if text != old_text:
+            label_options['text'] = text
+        if fg_color != old_fg:
+            label_options['fill'] = fg_color
+        if label_options:
+            self.schedule_canvas.itemconfigure(label, **label_options)
+        self._schedule_drawn[row_idx, col_idx] = self._cell_spec_code(spec)
+
+    def _update_schedule_scrollregion(self):
+        total_height = self._schedule_header_height + len(self._schedule_rows) * self._schedule_row_height
+        region = (0, 0, self._schedule_edges[-1], total_height)
+        if region != self._schedule_scrollregion:
+            self._schedule_scrollregion = region
+            self.schedule_canvas.configure(scrollregion=region)
+
+    def _fit_schedule_columns(self, color_index):
+        """Widen the shift columns to fit the longest worker name.
+
+        Names are measured once per color index; the Day column keeps its
+        fixed width.
+        """
+        if color_index is self._schedule_widths_index:
+            return
+        self._schedule_widths_index = color_index
+        day_width, shift_width = SCHEDULE_COL_WIDTHS[0], SCHEDULE_COL_WIDTHS[1]
+        if color_index:
+            # Leave some padding around the text inside the cell
+            name_width = max(self.body_font.measure(name) for name, _bg, _fg in color_index) + 16
+            shift_width = max(shift_width, name_width)
+        widths = [day_width] + [shift_width] * (len(SCHEDULE_COLUMNS) - 1)
+        if widths != self._schedule_col_widths:
+            self._set_schedule_col_widths(widths)
+
+    def _set_schedule_col_widths(self, widths):
+        """Set the minimum column widths and lay the grid out to match."""
+        self._schedule_col_widths = list(widths)
+        self._layout_schedule()
+
+    def _request_schedule_layout(self, canvas_width):
+        """Coalesce canvas resizes into one layout pass when idle."""
+        if self._schedule_layout_width is None:
+            self.root.after_idle(self._flush_schedule_layout)
+        self._schedule_layout_width = canvas_width
+
+    def _flush_schedule_layout(self):
+        canvas_width, self._schedule_layout_width = self._schedule_layout_width, None
+        self._layout_schedule(canvas_width)
+
+    def _layout_schedule(self, canvas_width=None):
+        """Compute column edges for the canvas width and move all items to them.
+
+        Columns keep their minimum-width proportions and stretch to fill the
+        canvas, but the grid never gets narrower than the minimum widths.
+        Nothing is moved when the edges come out unchanged (e.g. on a
+        height-only resize, or once the grid is at its minimum width).
+        """
+        if canvas_width is not None:
+            self._schedule_canvas_width = canvas_width
+        widths = self._schedule_col_widths
+        scale = max(self._schedule_canvas_width, sum(widths)) / sum(widths)
+        edges = [0.0]
+        for width in widths:
+            edges.append(edges[-1] + width * scale)
+        if edges == self._schedule_edges:
+            return
+        old_edges, self._schedule_edges = self._schedule_edges, edges
+        if self.schedule_canvas is None:
+            return  # Grid not built yet
+
+        canvas = self.schedule_canvas
+        if widths == self._schedule_layout_widths:
+            # Only the stretch factor changed: one command rescales every tagged item
+            canvas.scale(SCHEDULE_GRID_TAG, 0, 0, edges[-1] / old_edges[-1], 1.0)
+            self._update_schedule_scrollregion()
+            return
+        self._schedule_layout_widths = list(widths)
+
+        columns = self._schedule_column_geometry()
+        header_height = self._schedule_header_height
+        for (x0, x1, cx), (rect, label) in zip(columns, self._schedule_headers):
+            canvas.coords(rect, x0, 0, x1, header_height)
+            canvas.coords(label, cx, header_height / 2)
+        row_height = self._schedule_row_height
+        for row_idx, row_ids in enumerate(self._schedule_item_ids.tolist()):
+            y0 = header_height + row_idx * row_height
+            y1, cy = y0 + row_height, y0 + row_height / 2
+            for (x0, x1, cx), (rect, label) in zip(columns, row_ids):
+                canvas.coords(rect, x0, y0, x1, y1)
+                canvas.coords(label, cx, cy)
+        self._update_schedule_scrollregion()
+
+    def _schedule_column_geometry(self):
+        """(left, right, center) x of each column for the current edges."""
+        edges = self._schedule_edges
+        return [(x0, x1, (x0 + x1) / 2) for x0, x1 in zip(edges, edges[1:])]
+
+    def _ensure_schedule_headers(self):
+        """Draw the header row once; it is repositioned by _layout_schedule."""
+        if self._schedule_headers:
+            return
+        edges = self._schedule_edges
+        header_height = self._schedule_header_height
+        for col_idx, col_name in enumerate(SCHEDULE_COLUMNS):
+            x0, x1 = edges[col_idx], edges[col_idx + 1]
+            rect = self.schedule_canvas.create_rectangle(x0, 0, x1, header_height, fill="#d0d0d0", outline="gray",
+                                                         tags=SCHEDULE_GRID_TAG)
+            label = self.schedule_canvas.create_text((x0 + x1) / 2, header_height / 2, text=col_name,
+                                                     font=self.heading_font, tags=SCHEDULE_GRID_TAG)
+            self._schedule_headers.append((rect, label))
+
+    def _on_schedule_double_click(self, event):
+        """Open the shift editor for the grid cell under the pointer."""
+        x = self.schedule_canvas.canvasx(event.x)
+        y = self.schedule_canvas.canvasy(event.y) - self._schedule_header_height
+        col_idx = bisect_right(self._schedule_edges, x) - 1
+        if y < 0 or not 0 <= col_idx < len(SCHEDULE_COLUMNS):
+            return  # Header or outside the grid
+        self.edit_shift(int(y // self._schedule_row_height), col_idx)
+
+    def _update_worker_legend(self, color_index):
+        """Update the worker color legend in the Schedule tab.
+
+        Legend entries are reused between updates; only colors and names
+        that changed are reconfigured, and surplus entries are hidden.
+
+        Args:
+            color_index: [(name, background, foreground), ...] from _build_color_index
+        """
+        if self.schedule_legend_frame is None or color_index is self._legend_index:
+            return
+        self._legend_index = color_index
+
+        shown = self._legend_shown
+        for i, (name, bg_color, _fg) in enumerate(color_index):
+            if i < len(self._legend_items):
+                worker_frame, color_canvas, swatch, name_label = self._legend_items[i]
+                old_name, old_color = shown[i]
+                if bg_color != old_color:
+                    color_canvas.itemconfigure(swatch, fill=bg_color, outline=bg_color)
+                if name != old_name:
+                    name_label.configure(text=name)
+                shown[i] = (name, bg_color)
+                if i < self._legend_visible:
+                    continue  # Already packed in place
+            else:
+                # Create a frame for each worker entry
+                worker_frame = ttk.Frame(self.schedule_legend_frame)
+
+                # Create a colored label (using a small canvas for the color box)
+                color_canvas = tk.Canvas(worker_frame, width=16, height=16, highlightthickness=1, highlightbackground="gray")
+                swatch = color_canvas.create_rectangle(0, 0, 16, 16, fill=bg_color, outline=bg_color)
+                color_canvas.pack(side="left", padx=(0, 3))
+
+                # Worker name label
+                name_label = ttk.Label(worker_frame, text=name, font=("TkDefaultFont", 9))
+                name_label.pack(side="left")
+                self._legend_items.append((worker_frame, color_canvas, swatch, name_label))
+                shown.append((name, bg_color))
             worker_frame.pack(side="left", padx=5, pady=2)
-            
-            # Create a colored label (using a small canvas for the color box)
-            color_canvas = tk.Canvas(worker_frame, width=16, height=16, highlightthickness=1, highlightbackground="gray")
-            color_canvas.create_rectangle(0, 0, 16, 16, fill=worker.color, outline=worker.color)
-            color_canvas.pack(side="left", padx=(0, 3))
-            
-            # Worker name label
-            name_label = ttk.Label(worker_frame, text=worker.name, font=("TkDefaultFont", 9))
-            name_label.pack(side="left")
+
+        # Hide pooled entries for workers that no longer exist
+        for worker_frame, *_ in self._legend_items[len(color_index):self._legend_visible]:
+            worker_frame.pack_forget()
+        self._legend_visible = len(color_index)
 
 if __name__ == "__main__":
     root = tk.Tk()
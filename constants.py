@@ -1,15 +1,49 @@
-# Shift configurations
-SHIFTS = {
-    'M1': {'start_hour': 8, 'end_hour': 20, 'dur': 12, 'night': False},
-    'M2': {'start_hour': 8, 'end_hour': 23, 'dur': 15, 'night': False},
-    'N': {'start_hour': 20, 'end_hour': 32, 'dur': 12, 'night': True},  # 32 = 8 AM next day
-}
+from enum import IntEnum
+from types import MappingProxyType
+
+__all__ = [
+    'SHIFTS', 'SHIFT_TYPES', 'SHIFT_DURATIONS', 'SHIFT_START_HOURS', 'SHIFT_END_HOURS', 'SHIFT_NIGHT_FLAGS',
+    'SHIFT_DUR_ARR', 'SHIFT_START_ARR', 'SHIFT_END_ARR', 'SHIFT_NIGHT_ARR', 'SHIFT_DISPLAY_NAMES',
+    'Shift', 'DAY_SHIFTS_MASK', 'NIGHT_SHIFTS_MASK',
+    'EQUITY_STATS', 'EQUITY_STAT_INDEX', 'EQUITY_WEIGHTS', 'DOW_EQUITY_WEIGHT', 'MONTHLY_SHIFT_BALANCE_WEIGHT',
+    'OBJECTIVE_WEIGHT_LOAD', 'OBJECTIVE_FLEX_WEIGHTS', 'OBJECTIVE_FLEX_WEIGHTS_INT',
+    'SOLVER_TIMEOUT_SECONDS', 'SOLVER_MIN_TIME_SECONDS', 'SOLVER_NO_IMPROVEMENT_SECONDS',
+    'SOLVER_IMPROVEMENT_THRESHOLD', 'MIN_REST_HOURS', 'CONSECUTIVE_SHIFT_PENALTY_RANGE', 'MAX_STAT_VALUE',
+    'NIGHT_SHIFT_MIN_INTERVAL_HOURS', 'NIGHT_SHIFT_CONSECUTIVE_MIN_HOURS',
+    'WEEKLY_LOADS', 'PAST_REPORT_WEEKS',
+    'FIXED_HOLIDAYS', 'FIXED_HOLIDAY_SET', 'MOVABLE_HOLIDAY_OFFSETS',
+]
+
+# Shift configurations (read-only; the tables below are derived from them)
+SHIFTS = MappingProxyType({
+    'M1': MappingProxyType({'start_hour': 8, 'end_hour': 20, 'dur': 12, 'night': False}),
+    'M2': MappingProxyType({'start_hour': 8, 'end_hour': 23, 'dur': 15, 'night': False}),
+    'N': MappingProxyType({'start_hour': 20, 'end_hour': 32, 'dur': 12, 'night': True}),  # 32 = 8 AM next day
+})
+
+SHIFT_TYPES = tuple(SHIFTS)
+SHIFT_DURATIONS = MappingProxyType({k: v['dur'] for k, v in SHIFTS.items()})
+SHIFT_START_HOURS = MappingProxyType({k: v['start_hour'] for k, v in SHIFTS.items()})
+SHIFT_END_HOURS = MappingProxyType({k: v['end_hour'] for k, v in SHIFTS.items()})
+SHIFT_NIGHT_FLAGS = MappingProxyType({k: v['night'] for k, v in SHIFTS.items()})
+
+# The same values indexed by shift ordinal (position in SHIFT_TYPES), for inner loops
+SHIFT_DUR_ARR = tuple(SHIFT_DURATIONS[k] for k in SHIFT_TYPES)
+SHIFT_START_ARR = tuple(SHIFT_START_HOURS[k] for k in SHIFT_TYPES)
+SHIFT_END_ARR = tuple(SHIFT_END_HOURS[k] for k in SHIFT_TYPES)
+SHIFT_NIGHT_ARR = tuple(SHIFT_NIGHT_FLAGS[k] for k in SHIFT_TYPES)
 
-SHIFT_TYPES = list(SHIFTS.keys())
-SHIFT_DURATIONS = {k: v['dur'] for k, v in SHIFTS.items()}
-SHIFT_START_HOURS = {k: v['start_hour'] for k, v in SHIFTS.items()}
-SHIFT_END_HOURS = {k: v['end_hour'] for k, v in SHIFTS.items()}
-SHIFT_NIGHT_FLAGS = {k: v['night'] for k, v in SHIFTS.items()}
+
+class Shift(IntEnum):
+    """Shift ordinals; member names and order match SHIFT_TYPES."""
+    M1 = 0
+    M2 = 1
+    N = 2
+
+
+# Bitmasks over shift ordinals: (1 << ordinal) & mask tests membership
+DAY_SHIFTS_MASK = (1 << Shift.M1) | (1 << Shift.M2)
+NIGHT_SHIFTS_MASK = 1 << Shift.N
 
 # UI display names for shifts (e.g., 'N' displays as 'Night')
 SHIFT_DISPLAY_NAMES = {'M1': 'M1', 'M2': 'M2', 'N': 'Night'}
@@ -35,7 +69,7 @@ SHIFT_DISPLAY_NAMES = {'M1': 'M1', 'M2': 'M2', 'N': 'Night'}
 #   - Holiday on Saturday: M1/M2 count as Holiday M1/M2; N counts as Saturday N (not double-counted).
 #   - Holiday on Sunday: counts in the "Sunday or Holiday" category.
 #   - Holiday on a weekday (Mon–Fri): counts in the "Sunday or Holiday" category for equity purposes.
-EQUITY_STATS = [
+EQUITY_STATS = (
     'sun_holiday_m2',           # Priority 1: Sunday or Holiday M2
     'sat_n',                    # Priority 2: Saturday Night
     'sat_m2',                   # Priority 3: Saturday M2
@@ -48,7 +82,9 @@ EQUITY_STATS = [
     'monday_day',               # Priority 10: Monday M1 or M2
     'weekday_not_mon_day',      # Priority 11: Weekday (not Monday) M1 or M2
     'weekday_m2',               # Priority 12: Weekday M2 (Mon-Fri, non-holiday) - for allocation control
-]
+)
+# Position of each stat in EQUITY_STATS (column index in stat matrices)
+EQUITY_STAT_INDEX = MappingProxyType({stat: i for i, stat in enumerate(EQUITY_STATS)})
 
 # Weights for equity objectives in the optimization model.
 # Each weight multiplies the imbalance (max - min) for the corresponding stat in EQUITY_STATS.
@@ -57,7 +93,8 @@ EQUITY_STATS = [
 # If changed:
 # - Increasing a weight: Makes the schedule fairer for that specific metric but may worsen other aspects like load balancing.
 # - Decreasing a weight: Allows more flexibility in assignments, potentially improving overall feasibility or other objectives, but may lead to unfair distributions.
-EQUITY_WEIGHTS = {
+# Read-only: per-scheduler overrides work on a copy (see SchedulerService.equity_weights).
+EQUITY_WEIGHTS = MappingProxyType({
     # Weights ordered by EQUITY_STATS priority (highest priority = highest weight)
     'sun_holiday_m2': 8000.0,   # Priority 1: Sunday or Holiday M2
     'sat_n': 7600.0,             # Priority 2: Saturday N
@@ -71,7 +108,7 @@ EQUITY_WEIGHTS = {
     'monday_day': 250.0,         # Priority 10: Monday M1 or M2
     'weekday_not_mon_day': 50.0, # Priority 11: Weekday (not Monday) M1 or M2
     'weekday_m2': 40.0,          # Priority 12: Weekday M2 (low weight, mainly for allocation control)
-}
+})
 
 # Weight for day-of-week equity (balances shifts per specific weekday across workers).
 # Similar to EQUITY_WEIGHTS: higher value penalizes imbalances in shifts on Mondays, Tuesdays, etc.
@@ -90,7 +127,7 @@ MONTHLY_SHIFT_BALANCE_WEIGHT = 5000.0
 # Higher value prioritizes meeting exact weekly loads; lower allows more variance if needed for other constraints.
 OBJECTIVE_WEIGHT_LOAD = 1
 
-OBJECTIVE_FLEX_WEIGHTS = [8000, 8000, 4000, 800, 0, 1, 0.1, 0.01, 0.001, 0.0001, 100, 500, 500]
+OBJECTIVE_FLEX_WEIGHTS = (8000, 8000, 4000, 800, 0, 1, 0.1, 0.01, 0.001, 0.0001, 100, 500, 500)
 # Flexible rule weights in order of importance (higher index = lower priority):
 # [0]: Saturday Preference - prioritize weekday (Mon-Fri) as first shift, else Saturday M1/M2 over Sunday/N.
 # [1]: Three-Day Weekend Worker Minimization - minimize unique workers during 3-day weekends.
@@ -102,6 +139,10 @@ OBJECTIVE_FLEX_WEIGHTS = [8000, 8000, 4000, 800, 0, 1, 0.1, 0.01, 0.001, 0.0001,
 # [11]: Night Shift Min Interval - penalizes night shifts within 48h of each other.
 # [12]: Consecutive Night Shift Avoidance - penalizes night-to-night sequences (next shift after a night being a night).
 
+# Integer copies for the CP-SAT objective, which works on integer coefficients. The rules in use
+# all have whole-number weights, so no scaling is needed; the unused placeholders [5-9] round to 0 or 1.
+OBJECTIVE_FLEX_WEIGHTS_INT = tuple(int(round(w)) for w in OBJECTIVE_FLEX_WEIGHTS)
+
 # Solver and constraint parameters
 SOLVER_TIMEOUT_SECONDS = 240.0  # Maximum time; early stopping may end sooner
 SOLVER_MIN_TIME_SECONDS = 20.0  # Minimum time before early stopping kicks in
@@ -130,6 +171,8 @@ FIXED_HOLIDAYS = {
     11: [1],  # All Saints' Day
     12: [1, 8, 25]  # Restoration of Independence, Immaculate Conception, Christmas
 }
+# (month, day) pairs of the fixed holidays, for O(1) membership tests
+FIXED_HOLIDAY_SET = frozenset((m, d) for m, days in FIXED_HOLIDAYS.items() for d in days)
 MOVABLE_HOLIDAY_OFFSETS = {  # Days relative to Easter
     'carnival': -47,
     'good_friday': -2,
@@ -11,10 +11,15 @@ This aids debugging and helps users understand why a schedule cannot be generate
 
 from __future__ import annotations
 
+import io
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import cached_property
 from datetime import date, timedelta
 from typing import Any
 
+import numpy as np
 from ortools.sat.python import cp_model
 
 from constants import MIN_REST_HOURS, SHIFT_TYPES, SHIFTS
@@ -67,51 +72,53 @@ class DiagnosticReport:
 
     def format_report(self) -> str:
         """Format the report as a human-readable string."""
-        lines = ["=" * 60, "CONSTRAINT DIAGNOSTIC REPORT", "=" * 60, ""]
+        buf = io.StringIO()
+        write = buf.write
+        write("=" * 60 + "\nCONSTRAINT DIAGNOSTIC REPORT\n" + "=" * 60 + "\n\n")
 
         if self.is_feasible:
-            lines.append("✓ Schedule is FEASIBLE")
+            write("✓ Schedule is FEASIBLE\n")
         else:
-            lines.append("✗ Schedule is INFEASIBLE")
+            write("✗ Schedule is INFEASIBLE\n")
 
-        lines.append("")
+        write("\n")
 
         errors = self.get_errors()
         warnings = self.get_warnings()
 
         if errors:
-            lines.append(f"ERRORS ({len(errors)}):")
-            lines.append("-" * 40)
+            write(f"ERRORS ({len(errors)}):\n")
+            write("-" * 40 + "\n")
             for v in errors:
-                lines.append(f"  • [{v.category}] {v.message}")
+                write(f"  • [{v.category}] {v.message}\n")
                 if v.details:
                     for k, val in v.details.items():
-                        lines.append(f"      {k}: {val}")
-            lines.append("")
+                        write(f"      {k}: {val}\n")
+            write("\n")
 
         if warnings:
-            lines.append(f"WARNINGS ({len(warnings)}):")
-            lines.append("-" * 40)
+            write(f"WARNINGS ({len(warnings)}):\n")
+            write("-" * 40 + "\n")
             for v in warnings:
-                lines.append(f"  • [{v.category}] {v.message}")
-            lines.append("")
+                write(f"  • [{v.category}] {v.message}\n")
+            write("\n")
 
         if self.relaxation_results:
-            lines.append("RELAXATION ANALYSIS:")
-            lines.append("-" * 40)
+            write("RELAXATION ANALYSIS:\n")
+            write("-" * 40 + "\n")
             for constraint, feasible in self.relaxation_results.items():
                 status = "✓ feasible" if feasible else "✗ still infeasible"
-                lines.append(f"  Without '{constraint}': {status}")
-            lines.append("")
+                write(f"  Without '{constraint}': {status}\n")
+            write("\n")
 
         if self.summary:
-            lines.append("SUMMARY:")
-            lines.append("-" * 40)
-            lines.append(f"  {self.summary}")
-            lines.append("")
+            write("SUMMARY:\n")
+            write("-" * 40 + "\n")
+            write(f"  {self.summary}\n")
+            write("\n")
 
-        lines.append("=" * 60)
-        return "\n".join(lines)
+        write("=" * 60)
+        return buf.getvalue()
 
 
 class ConstraintDiagnostics:
@@ -133,12 +140,95 @@ class ConstraintDiagnostics:
         self.shifts = shifts
         self.shifts_by_day = shifts_by_day
         self.iso_weeks = iso_weeks
-        self.unav_parsed = unav_parsed
-        self.req_parsed = req_parsed
-        self.holiday_set = holiday_set
+        # Read-only from here on
+        self.unav_parsed = tuple(frozenset(entries) for entries in unav_parsed)
+        self.req_parsed = tuple(frozenset(entries) for entries in req_parsed)
+        self.holiday_set = frozenset(holiday_set)
         self.num_workers = len(workers)
         self.num_shifts = len(shifts)
 
+    # Availability masks, built from the parsed sets on first use:
+    # - unav_day[w, d]: worker w is unavailable all day on day index d
+    # - unav_shift[w, s]: worker w is unavailable for shift s (whole day or that type)
+    # - shift_blocked[w, s]: as unav_shift, or s is a night shift w cannot work
+    # - is_night[s] / can_night[w]: night shifts and night-capable workers
+
+    @cached_property
+    def _day_index(self) -> dict[date, int]:
+        """Day -> mask column: self.days first, then other days the shifts or ISO weeks refer to."""
+        days = list(self.days)
+        days += [shift["day"] for shift in self.shifts]
+        for week in self.iso_weeks.values():
+            days += week.get("weekdays_for_distribution", [])
+        day_index = {}
+        for d in days:
+            day_index.setdefault(d, len(day_index))
+        return day_index
+
+    @cached_property
+    def _shifts_on(self) -> dict[tuple[date, str | None], list[int]]:
+        """Shifts matched by an unavailability entry: (day, None) -> all of the day's, (day, type) -> that type's."""
+        shifts_on = {}
+        for s, shift in enumerate(self.shifts):
+            shifts_on.setdefault((shift["day"], None), []).append(s)
+            shifts_on.setdefault((shift["day"], shift["type"]), []).append(s)
+        return shifts_on
+
+    @cached_property
+    def unav_day(self) -> np.ndarray:
+        unav_day = np.zeros((self.num_workers, len(self._day_index)), dtype=bool)
+        for w, entries in enumerate(self.unav_parsed):
+            for d, sh in entries:
+                if sh is None and d in self._day_index:
+                    unav_day[w, self._day_index[d]] = True
+        return unav_day
+
+    @cached_property
+    def unav_shift(self) -> np.ndarray:
+        unav_shift = np.zeros((self.num_workers, self.num_shifts), dtype=bool)
+        for w, entries in enumerate(self.unav_parsed):
+            for entry in entries:
+                unav_shift[w, self._shifts_on.get(entry, [])] = True
+        return unav_shift
+
+    @cached_property
+    def is_night(self) -> np.ndarray:
+        return np.array([shift.get("night", False) for shift in self.shifts], dtype=bool)
+
+    @cached_property
+    def can_night(self) -> np.ndarray:
+        return np.array([worker.get("can_night", True) for worker in self.workers], dtype=bool)
+
+    @cached_property
+    def shift_blocked(self) -> np.ndarray:
+        return self.unav_shift | (~self.can_night[:, None] & self.is_night[None, :])
+
+    @cached_property
+    def _rest_spans(self) -> list[tuple[int, int]]:
+        """(start, size) of each shift plus its rest period, in integer minutes from the earliest start."""
+        if not self.shifts:
+            return []
+        origin = min(shift["start"] for shift in self.shifts)
+        rest = MIN_REST_HOURS * 60
+        return [
+            (int((shift["start"] - origin).total_seconds()) // 60,
+             int((shift["end"] - shift["start"]).total_seconds()) // 60 + rest)
+            for shift in self.shifts
+        ]
+
+    def _weekly_eligible(self, weekdays: list[date]) -> np.ndarray:
+        """Workers available on at least one of the given weekdays (bool per worker)."""
+        idx = [self._day_index[wd] for wd in weekdays]
+        return (~self.unav_day[:, idx]).any(axis=1)
+
+    @cached_property
+    def _weekly_eligible_workers(self) -> dict[Any, np.ndarray]:
+        """ISO week key -> indices of workers available on at least one of its weekdays."""
+        return {
+            key: np.flatnonzero(self._weekly_eligible(week.get("weekdays_for_distribution", [])))
+            for key, week in self.iso_weeks.items()
+        }
+
     def analyze_pre_solve(self) -> DiagnosticReport:
         """Analyze constraints before solving to detect obvious issues."""
         report = DiagnosticReport(is_feasible=True)
@@ -167,19 +257,12 @@ class ConstraintDiagnostics:
             for s_idx in self.shifts_by_day[day]:
                 shift = self.shifts[s_idx]
                 shift_type = shift["type"]
-                is_night = shift.get("night", False)
-
-                available_workers = []
-                for w_idx, worker in enumerate(self.workers):
-                    # Check unavailability
-                    if (day, None) in self.unav_parsed[w_idx]:
-                        continue
-                    if (day, shift_type) in self.unav_parsed[w_idx]:
-                        continue
-                    # Check night capability
-                    if is_night and not worker.get("can_night", True):
-                        continue
-                    available_workers.append(worker["name"])
+                is_night = bool(self.is_night[s_idx])
+
+                # Workers neither unavailable nor barred from nights
+                available_workers = [
+                    self.workers[w_idx]["name"] for w_idx in np.flatnonzero(~self.shift_blocked[:, s_idx])
+                ]
 
                 if len(available_workers) == 0:
                     report.add_violation(ConstraintViolation(
@@ -203,8 +286,9 @@ class ConstraintDiagnostics:
 
     def _check_worker_availability(self, report: DiagnosticReport) -> None:
         """Check if workers have reasonable availability."""
-        for w_idx, worker in enumerate(self.workers):
-            unavail_days = sum(1 for d in self.days if (d, None) in self.unav_parsed[w_idx])
+        # The first len(self.days) day indices are self.days
+        unavail_counts = self.unav_day[:, :len(self.days)].sum(axis=1).tolist()
+        for worker, unavail_days in zip(self.workers, unavail_counts):
             total_days = len(self.days)
             avail_ratio = (total_days - unavail_days) / total_days if total_days > 0 else 0
 
@@ -222,7 +306,7 @@ class ConstraintDiagnostics:
 
     def _check_night_shift_coverage(self, report: DiagnosticReport) -> None:
         """Check if there are enough night-capable workers."""
-        night_capable = [w for w in self.workers if w.get("can_night", True)]
+        night_capable = [self.workers[w] for w in np.flatnonzero(self.can_night)]
 
         if len(night_capable) == 0:
             report.add_violation(ConstraintViolation(
@@ -289,15 +373,12 @@ class ConstraintDiagnostics:
         from constants import MIN_REST_HOURS
         
         for key, week in self.iso_weeks.items():
-            weekdays = week.get("weekdays_for_distribution", [])
             week_shifts = week.get("shifts", [])
 
             # Count workers with at least one available weekday
-            eligible_workers = []
-            for w_idx, worker in enumerate(self.workers):
-                avail_weekdays = [wd for wd in weekdays if (wd, None) not in self.unav_parsed[w_idx]]
-                if avail_weekdays:
-                    eligible_workers.append((w_idx, worker["name"]))
+            eligible_workers = [
+                (w_idx, self.workers[w_idx]["name"]) for w_idx in self._weekly_eligible_workers[key]
+            ]
 
             # Check 1: pigeonhole principle
             if len(eligible_workers) > len(week_shifts):
@@ -314,33 +395,9 @@ class ConstraintDiagnostics:
                 ))
 
             # Check 2: Can each eligible worker take at least one shift?
-            # Consider: unavailability, night restrictions, 24h rest between shifts
-            workers_with_zero_options = []
-            for w_idx, w_name in eligible_workers:
-                worker = self.workers[w_idx]
-                can_night = worker.get("can_night", True)
-                
-                available_shifts = 0
-                for s_idx in week_shifts:
-                    shift = self.shifts[s_idx]
-                    shift_day = shift["day"]
-                    shift_type = shift["type"]
-                    is_night = shift.get("night", False)
-                    
-                    # Check unavailability
-                    if (shift_day, None) in self.unav_parsed[w_idx]:
-                        continue
-                    if (shift_day, shift_type) in self.unav_parsed[w_idx]:
-                        continue
-                    
-                    # Check night capability
-                    if is_night and not can_night:
-                        continue
-                    
-                    available_shifts += 1
-                
-                if available_shifts == 0:
-                    workers_with_zero_options.append(w_name)
+            # Consider: unavailability and night restrictions
+            open_shifts = (~self.shift_blocked[:, week_shifts]).sum(axis=1)
+            workers_with_zero_options = [w_name for w_idx, w_name in eligible_workers if open_shifts[w_idx] == 0]
             
             if workers_with_zero_options:
                 report.add_violation(ConstraintViolation(
@@ -354,39 +411,80 @@ class ConstraintDiagnostics:
                     }
                 ))
 
-    def run_relaxation_analysis(self, logger=None) -> DiagnosticReport:
-        """Run diagnostic solves with relaxed constraints to identify the cause."""
-        report = self.analyze_pre_solve()
-
-        # Define constraint groups to test relaxation
-        constraint_groups = [
-            ("weekly_participation", self._build_model_without_weekly_participation),
-            ("24h_rest_interval", self._build_model_without_rest_interval),
-            ("one_shift_per_day", self._build_model_without_one_per_day),
-            ("night_restrictions", self._build_model_without_night_restrictions),
-        ]
+    def run_relaxation_analysis(
+        self, logger=None, force_relaxation: bool = False, find_conflicts: bool = False
+    ) -> DiagnosticReport:
+        """Run diagnostic solves with relaxed constraints to identify the cause.
 
-        for constraint_name, builder_func in constraint_groups:
+        Pre-solve errors already prove infeasibility, so the solves are
+        skipped when there are any, unless force_relaxation is set.
+        With find_conflicts, a minimal conflict set is also searched for
+        (see find_conflicting_constraints) when no single relaxation helps.
+        """
+        report = self.analyze_pre_solve()
+        if report.get_errors() and not force_relaxation:
+            report.summary = "Pre-solve detected hard violations; skipping relaxation analysis."
+            return report
+
+        # Constraint groups to test relaxation, in report order
+        for constraint_name in ("weekly_participation", "24h_rest_interval",
+                                "one_shift_per_day", "night_restrictions"):
+            report.relaxation_results[constraint_name] = False
+
+        # One shared model instead of one rebuild per relaxation: every group
+        # is gated by a literal, and each solve assumes all groups on except
+        # the relaxed one.
+        relaxation_ran = False
+        try:
+            model, assigned = self._build_base_model()
+            active = {}
+            for constraint_name, add_group in (
+                ("weekly_participation", self._add_weekly_participation),
+                ("24h_rest_interval", self._add_rest_interval),
+                ("one_shift_per_day", self._add_one_shift_per_day),
+                ("night_restrictions", self._add_night_restrictions),
+            ):
+                active[constraint_name] = model.NewBoolVar(f"diag_active_{constraint_name}")
+                add_group(model, assigned, [[active[constraint_name]]] * self.num_workers)
+
+            # The solves are independent and CP-SAT releases the GIL while
+            # searching, so run them side by side on their own model copies
+            relaxed_models = {}
+            for constraint_name in active:
+                relaxed_models[constraint_name] = model.Clone()
+                relaxed_models[constraint_name].AddAssumptions([
+                    lit.Not() if name == constraint_name else lit for name, lit in active.items()
+                ])
+            with ThreadPoolExecutor(max_workers=len(relaxed_models)) as pool:
+                futures = {
+                    constraint_name: pool.submit(self._solve_relaxed, relaxed_model, constraint_name, logger)
+                    for constraint_name, relaxed_model in relaxed_models.items()
+                }
+            for constraint_name, future in futures.items():
+                report.relaxation_results[constraint_name] = future.result()
+            relaxation_ran = True
+        except Exception as e:
+            if logger:
+                logger.warning(f"Relaxation tests failed to build the diagnostic model: {e}")
+
+        # A feasible relaxation already names the culprit; only search for a
+        # conflict set when the relaxations ran and none of them helped
+        conflicts = []
+        if find_conflicts and relaxation_ran and not any(report.relaxation_results.values()):
             try:
-                model, assigned = builder_func()
-                solver = cp_model.CpSolver()
-                solver.parameters.max_time_in_seconds = 5.0
-                solver.parameters.log_search_progress = False
-                status = solver.Solve(model)
-                is_feasible = status in (cp_model.OPTIMAL, cp_model.FEASIBLE)
-                report.relaxation_results[constraint_name] = is_feasible
-
-                if is_feasible and logger:
-                    logger.info(f"Relaxation test: removing '{constraint_name}' makes model feasible")
+                conflicts = self.find_conflicting_constraints(logger)
             except Exception as e:
-                report.relaxation_results[constraint_name] = False
                 if logger:
-                    logger.warning(f"Relaxation test for '{constraint_name}' failed: {e}")
+                    logger.warning(f"Conflict analysis failed: {e}")
+        for violation in conflicts:
+            report.add_violation(violation)
 
         # Update summary based on relaxation results
         feasible_when_relaxed = [k for k, v in report.relaxation_results.items() if v]
         if feasible_when_relaxed:
             report.summary = f"Model becomes feasible when relaxing: {', '.join(feasible_when_relaxed)}"
+        elif conflicts:
+            report.summary = f"Found {len(conflicts)} constraints that cannot all hold. See conflict_set errors above."
         elif report.get_errors():
             report.summary = "Pre-solve analysis found constraint violations. See errors above."
         else:
@@ -394,120 +492,185 @@ class ConstraintDiagnostics:
 
         return report
 
-    def _build_base_model(self):
-        """Build a base model with only shift coverage constraints."""
-        model = cp_model.CpModel()
-        assigned = [
-            [model.NewBoolVar(f"diag_ass_w{w}_s{s}") for s in range(self.num_shifts)]
-            for w in range(self.num_workers)
-        ]
+    def find_conflicting_constraints(self, logger=None, time_budget: float = 30.0) -> list[ConstraintViolation]:
+        """Find a minimal set of worker-level constraints that cannot all hold.
 
-        # Each shift exactly one worker (always required)
-        for s in range(self.num_shifts):
-            model.AddExactlyOne(assigned[w][s] for w in range(self.num_workers))
-
-        # Unavailability constraints (always required)
-        for w in range(self.num_workers):
-            for d, sh in self.unav_parsed[w]:
-                if sh is None:
-                    if d in self.shifts_by_day:
-                        for s in self.shifts_by_day[d]:
-                            model.Add(assigned[w][s] == 0)
-                else:
-                    if d in self.shifts_by_day:
-                        for s in self.shifts_by_day[d]:
-                            if self.shifts[s]["type"] == sh:
-                                model.Add(assigned[w][s] == 0)
-
-        return model, assigned
+        Each unavailability entry and each worker's night restriction, one
+        shift per day, rest interval and weekly participation get their own
+        enforcement literal, assumed on. If that model is infeasible, CP-SAT's
+        sufficient assumptions give a conflicting subset, which is shrunk by
+        deletion until every remaining constraint is needed.
+        Shift coverage stays hard. Returns [] if the model is feasible.
 
-    def _build_model_without_weekly_participation(self):
-        """Build model without weekly participation constraints."""
-        model, assigned = self._build_base_model()
-
-        # Add all constraints except weekly participation
-        self._add_one_shift_per_day(model, assigned)
-        self._add_night_restrictions(model, assigned)
-        self._add_rest_interval(model, assigned)
-
-        return model, assigned
-
-    def _build_model_without_rest_interval(self):
-        """Build model without 24h rest interval constraints."""
-        model, assigned = self._build_base_model()
-
-        self._add_one_shift_per_day(model, assigned)
-        self._add_night_restrictions(model, assigned)
-        self._add_weekly_participation(model, assigned)
-
-        return model, assigned
-
-    def _build_model_without_one_per_day(self):
-        """Build model without one-shift-per-day constraints."""
-        model, assigned = self._build_base_model()
+        All solves share time_budget seconds. If it runs out during the
+        shrinking, the conflicting subset found so far is returned, which
+        may not be minimal.
+        """
+        deadline = time.monotonic() + time_budget
+        model, assigned = self._build_base_model(with_unavailability=False)
+        tagged = {}  # literal index -> (literal, violation)
+
+        for w, entries in enumerate(self.unav_parsed):
+            name = self.workers[w]["name"]
+            for d, sh in sorted(entries, key=str):
+                blocked = self._shifts_on.get((d, sh), [])
+                if not blocked:
+                    continue
+                lit = model.NewBoolVar(f"diag_soft_unav_w{w}_{d}_{sh or 'day'}")
+                for s in blocked:
+                    model.Add(assigned[w][s] == 0).OnlyEnforceIf(lit)
+                tagged[lit.Index()] = (lit, ConstraintViolation(
+                    category="conflict_set",
+                    severity="error",
+                    message=f"Worker '{name}' is unavailable on {d}" + (f" for {sh}" if sh else ""),
+                    details={"worker": name, "constraint": "unavailability", "date": str(d), "shift_type": sh or "all"},
+                ))
 
-        self._add_night_restrictions(model, assigned)
-        self._add_rest_interval(model, assigned)
-        self._add_weekly_participation(model, assigned)
+        for constraint_name, add_group, description in (
+            ("one_shift_per_day", self._add_one_shift_per_day, "works at most one shift per day"),
+            ("night_restrictions", self._add_night_restrictions, "cannot work nights"),
+            ("24h_rest_interval", self._add_rest_interval, f"needs {MIN_REST_HOURS}h rest between shifts"),
+            ("weekly_participation", self._add_weekly_participation, "needs at least one shift per week"),
+        ):
+            lits = [model.NewBoolVar(f"diag_soft_{constraint_name}_w{w}") for w in range(self.num_workers)]
+            add_group(model, assigned, [[lit] for lit in lits])
+            for worker, lit in zip(self.workers, lits):
+                tagged[lit.Index()] = (lit, ConstraintViolation(
+                    category="conflict_set",
+                    severity="error",
+                    message=f"Worker '{worker['name']}' {description}",
+                    details={"worker": worker["name"], "constraint": constraint_name},
+                ))
 
-        return model, assigned
+        solver = cp_model.CpSolver()
+        solver.parameters.num_search_workers = 8
+        solver.parameters.log_search_progress = False
+        solver.parameters.stop_after_first_solution = True
+
+        def infeasible_under(indices) -> bool:
+            solver.parameters.max_time_in_seconds = max(0.0, min(5.0, deadline - time.monotonic()))
+            model.ClearAssumptions()
+            model.AddAssumptions([tagged[i][0] for i in indices])
+            return solver.Solve(model) == cp_model.INFEASIBLE
+
+        if not infeasible_under(tagged):
+            return []
+        core = [i for i in solver.SufficientAssumptionsForInfeasibility() if i in tagged]
+
+        # Deletion filter: drop every constraint the conflict does not need
+        minimal = True
+        for index in list(core):
+            if time.monotonic() >= deadline:
+                minimal = False
+                break
+            trial = [i for i in core if i != index]
+            if infeasible_under(trial):
+                core = trial
+
+        if logger:
+            logger.info(f"Conflict analysis: {len(core)} constraints cannot all hold"
+                        + ("" if minimal else " (time budget reached, set may not be minimal)"))
+        return [violation for i, (_, violation) in tagged.items() if i in core]
+
+    def _build_base_model(self, with_unavailability=True):
+        """Build a base model with only shift coverage (and unavailability) constraints."""
+        model = cp_model.CpModel()
+        # Created per shift; assigned[w][s] is a per-worker view of the same vars
+        assigned_by_shift = [
+            [model.NewBoolVar(f"diag_ass_w{w}_s{s}") for w in range(self.num_workers)]
+            for s in range(self.num_shifts)
+        ]
+        assigned = [list(row) for row in zip(*assigned_by_shift)] or [[] for _ in range(self.num_workers)]
 
-    def _build_model_without_night_restrictions(self):
-        """Build model without night shift restrictions."""
-        model, assigned = self._build_base_model()
+        # Each shift exactly one worker (always required)
+        for column in assigned_by_shift:
+            model.AddExactlyOne(column)
 
-        self._add_one_shift_per_day(model, assigned)
-        self._add_rest_interval(model, assigned)
-        self._add_weekly_participation(model, assigned)
+        # Unavailability constraints (always required)
+        if with_unavailability:
+            for w, s in zip(*np.nonzero(self.unav_shift)):
+                model.Add(assigned[w][s] == 0)
 
         return model, assigned
 
-    def _add_one_shift_per_day(self, model, assigned):
+    def _solve_relaxed(self, model, constraint_name, logger=None) -> bool:
+        """Solve one relaxation model (under its assumptions); True if feasible."""
+        try:
+            solver = cp_model.CpSolver()
+            solver.parameters.max_time_in_seconds = 5.0
+            solver.parameters.num_search_workers = 2
+            solver.parameters.log_search_progress = False
+            # Only feasibility matters: stop at the first solution and skip the
+            # probing, symmetry and LP work that pays off for optimisation
+            solver.parameters.stop_after_first_solution = True
+            solver.parameters.cp_model_probing_level = 0
+            solver.parameters.symmetry_level = 0
+            solver.parameters.linearization_level = 0
+            solver.parameters.presolve_bve_threshold = 100
+            status = solver.Solve(model)
+            is_feasible = status in (cp_model.OPTIMAL, cp_model.FEASIBLE)
+
+            if is_feasible and logger:
+                logger.info(f"Relaxation test: removing '{constraint_name}' makes model feasible")
+            return is_feasible
+        except Exception as e:
+            if logger:
+                logger.warning(f"Relaxation test for '{constraint_name}' failed: {e}")
+            return False
+
+    # The _add_* helpers take an optional per-worker list of enforcement
+    # literals: worker w's constraints only hold if all of enforce[w] hold.
+
+    def _add_one_shift_per_day(self, model, assigned, enforce=None):
         """Add constraint: max one shift per worker per day."""
         for w in range(self.num_workers):
             for d in self.shifts_by_day:
-                model.Add(sum(assigned[w][s] for s in self.shifts_by_day[d]) <= 1)
+                model.Add(sum(assigned[w][s] for s in self.shifts_by_day[d]) <= 1).OnlyEnforceIf(
+                    enforce[w] if enforce else []
+                )
 
-    def _add_night_restrictions(self, model, assigned):
+    def _add_night_restrictions(self, model, assigned, enforce=None):
         """Add constraint: some workers cannot work nights."""
+        night_shifts = np.flatnonzero(self.is_night)
+        for w in np.flatnonzero(~self.can_night):
+            for s in night_shifts:
+                model.Add(assigned[w][s] == 0).OnlyEnforceIf(enforce[w] if enforce else [])
+
+    def _add_rest_interval(self, model, assigned, enforce=None):
+        """Add constraint: 24h rest between shifts.
+
+        A shift taken by a worker occupies [start, end + MIN_REST_HOURS) of
+        that worker's time, so one no-overlap constraint per worker forbids
+        both overlapping shifts and shifts closer than the rest interval.
+        No-overlap cannot take enforcement literals, so when gated the
+        intervals hang off presence literals that must follow the
+        assignment only while enforce holds.
+        """
+        if not self.num_shifts:
+            return
+        spans = self._rest_spans
         for w in range(self.num_workers):
-            if not self.workers[w].get("can_night", True):
+            if enforce:
+                presence = [model.NewBoolVar(f"diag_rest_on_w{w}_s{s}") for s in range(self.num_shifts)]
                 for s in range(self.num_shifts):
-                    if self.shifts[s].get("night", False):
-                        model.Add(assigned[w][s] == 0)
-
-    def _add_rest_interval(self, model, assigned):
-        """Add constraint: 24h rest between shifts."""
-        for w in range(self.num_workers):
-            for i in range(self.num_shifts):
-                for j in range(i + 1, self.num_shifts):
-                    si = self.shifts[i]
-                    sj = self.shifts[j]
-                    start_i, end_i = si["start"], si["end"]
-                    start_j, end_j = sj["start"], sj["end"]
-
-                    if max(start_i, start_j) < min(end_i, end_j):
-                        model.AddBoolOr(assigned[w][i].Not(), assigned[w][j].Not())
-                    else:
-                        if start_j >= end_i:
-                            delta = (start_j - end_i).total_seconds() / 3600
-                            if delta < MIN_REST_HOURS:
-                                model.AddBoolOr(assigned[w][i].Not(), assigned[w][j].Not())
-                        elif start_i >= end_j:
-                            delta = (start_i - end_j).total_seconds() / 3600
-                            if delta < MIN_REST_HOURS:
-                                model.AddBoolOr(assigned[w][i].Not(), assigned[w][j].Not())
-
-    def _add_weekly_participation(self, model, assigned):
+                    model.AddImplication(presence[s], assigned[w][s])
+                    model.AddImplication(assigned[w][s], presence[s]).OnlyEnforceIf(enforce[w])
+            else:
+                presence = assigned[w]
+            model.AddNoOverlap([
+                model.NewOptionalFixedSizeIntervalVar(start, size, presence[s], f"diag_rest_w{w}_s{s}")
+                for s, (start, size) in enumerate(spans)
+            ])
+
+    def _add_weekly_participation(self, model, assigned, enforce=None):
         """Add constraint: each eligible worker gets at least one shift per week."""
         for key, week in self.iso_weeks.items():
-            weekdays = week.get("weekdays_for_distribution", [])
             week_shifts = week.get("shifts", [])
 
-            for w in range(self.num_workers):
-                avail_weekdays = [wd for wd in weekdays if (wd, None) not in self.unav_parsed[w]]
-                if avail_weekdays:
-                    model.Add(sum(assigned[w][s] for s in week_shifts) >= 1)
+            for w in self._weekly_eligible_workers[key]:
+                model.Add(sum(assigned[w][s] for s in week_shifts) >= 1).OnlyEnforceIf(
+                    enforce[w] if enforce else []
+                )
 
 
 def run_diagnostics(
@@ -521,6 +684,7 @@ def run_diagnostics(
     holiday_set: set[date],
     logger=None,
     full_analysis: bool = True,
+    find_conflicts: bool = False,
 ) -> DiagnosticReport:
     """
     Run constraint diagnostics and return a report.
@@ -535,7 +699,10 @@ def run_diagnostics(
         req_parsed: Parsed required shifts per worker
         holiday_set: Set of holiday dates
         logger: Optional logger for output
-        full_analysis: If True, run relaxation analysis (slower but more informative)
+        full_analysis: If True, run relaxation analysis (slower but more informative).
+            Skipped anyway when the pre-solve checks already find errors.
+        find_conflicts: If True, also search for a minimal conflict set when
+            no single relaxation is feasible (slower still).
 
     Returns:
         DiagnosticReport with violations and analysis results
@@ -552,7 +719,7 @@ def run_diagnostics(
     )
 
     if full_analysis:
-        report = diagnostics.run_relaxation_analysis(logger)
+        report = diagnostics.run_relaxation_analysis(logger, find_conflicts=find_conflicts)
     else:
         report = diagnostics.analyze_pre_solve()
 
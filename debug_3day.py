@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """Debug script for three-day weekend handling."""
-from scheduling_engine import generate_schedule
+from debug_cache import cached_generate_schedule
 from datetime import date
 from collections import defaultdict
 
@@ -13,7 +13,7 @@ unavail = {w['name']: [] for w in workers}
 required = {w['name']: [] for w in workers}
 history = {}
 
-schedule, weekly, assignments, stats, current_stats = generate_schedule(
+schedule, weekly, assignments, stats, current_stats = cached_generate_schedule(
     2026, 3, unavail, required, history, workers, holidays=None
 )
 
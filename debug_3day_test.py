@@ -1,6 +1,6 @@
 """Debug script to test three-day weekend handling in transition weeks."""
 
-from scheduling_engine import generate_schedule
+from debug_cache import cached_generate_schedule
 from datetime import date, timedelta
 from utils import compute_holidays
 import calendar
@@ -68,7 +68,7 @@ history = {}
 
 print("Generating schedule for March 2026 with 15 workers...")
 
-schedule_march, weekly_march, assignments_march, stats_march, _ = generate_schedule(
+schedule_march, weekly_march, assignments_march, stats_march, _ = cached_generate_schedule(
     2026, 3, unavail, required, history, workers, holidays=None
 )
 
@@ -97,7 +97,7 @@ print(f"History keys after March: {list(history_after_march.keys())[:5]}...")
 
 print("Generating schedule for April 2026...")
 
-schedule_april, weekly_april, assignments_april, stats_april, _ = generate_schedule(
+schedule_april, weekly_april, assignments_april, stats_april, _ = cached_generate_schedule(
     2026, 4, unavail, required, history_after_march, workers, holidays=None
 )
 
@@ -0,0 +1,38 @@
+"""On-disk cache of generate_schedule results for the debug scripts.
+
+Repeated runs of a debug script with the same inputs skip the CP-SAT solve.
+The key covers the inputs and the source of every module in the project, so
+editing any of them invalidates old entries. Delete .schedule_cache/ to clear.
+"""
+import hashlib
+import pickle
+from pathlib import Path
+
+from scheduling_engine import generate_schedule
+
+ROOT = Path(__file__).resolve().parent
+CACHE_DIR = ROOT / ".schedule_cache"
+
+
+def _engine_fingerprint() -> bytes:
+    # Every top-level module: generate_schedule imports some of them lazily
+    # (e.g. constraint_diagnostics), so a hand-kept list goes stale
+    digest = hashlib.sha1()
+    for path in sorted(ROOT.glob("*.py")):
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.digest()
+
+
+def cached_generate_schedule(*args, **kwargs):
+    """generate_schedule(*args, **kwargs), reusing a cached result when the inputs match."""
+    key = hashlib.sha1(_engine_fingerprint() + pickle.dumps((args, sorted(kwargs.items())))).hexdigest()
+    path = CACHE_DIR / f"{key}.pkl"
+    if path.exists():
+        print(f"Using cached schedule {path.name}")
+        return pickle.loads(path.read_bytes())
+
+    result = generate_schedule(*args, **kwargs)
+    CACHE_DIR.mkdir(exist_ok=True)
+    path.write_bytes(pickle.dumps(result))
+    return result
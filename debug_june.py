@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 """Debug script to understand June 2026 infeasibility."""
 
-import sys
 from datetime import date, timedelta
+import numpy as np
 from ortools.sat.python import cp_model
 
 # Import from the project
@@ -10,6 +10,22 @@ from scheduler_service import SchedulerService
 from history_view import HistoryView
 from constants import SHIFTS, MIN_REST_HOURS
 
+def max_matching(allowed):
+    """Size of a maximum matching of columns (shifts) to distinct rows (workers) of a bool matrix."""
+    worker_shift = {}
+
+    def augment(s, seen):
+        for w in np.flatnonzero(allowed[:, s]):
+            if w not in seen:
+                seen.add(w)
+                if w not in worker_shift or augment(worker_shift[w], seen):
+                    worker_shift[w] = s
+                    return True
+        return False
+
+    return sum(augment(s, set()) for s in range(allowed.shape[1]))
+
+
 def main():
     service = SchedulerService()
     service.load_config("config.yaml")
@@ -19,6 +35,7 @@ def main():
     # Get history
     history = service._history
     hv = HistoryView(history)
+    fixed = hv.fixed_shifts()
     
     print("=" * 60)
     print("HISTORY ANALYSIS FOR JUNE 2026")
@@ -34,7 +51,7 @@ def main():
         print(f"\n  {d} ({d.strftime('%A')}):")
         found = False
         for worker in service.workers:
-            shift = hv.fixed_shift_for(worker.name, d)
+            shift = fixed.get((worker.name, d))
             if shift:
                 found = True
                 shift_cfg = SHIFTS.get(shift, {})
@@ -52,28 +69,25 @@ def main():
     shift_types = ['M1', 'M2', 'N']
     
     blocked_workers = {st: [] for st in shift_types}
-    
-    for worker in service.workers:
-        for hist_day in [june1 - timedelta(days=1), june1 - timedelta(days=2)]:
-            hist_shift = hv.fixed_shift_for(worker.name, hist_day)
-            if hist_shift:
-                hist_cfg = SHIFTS.get(hist_shift)
-                if not hist_cfg:
-                    continue
-                
-                import datetime as dt
-                hist_end = dt.datetime.combine(hist_day, dt.time()) + timedelta(hours=hist_cfg['end_hour'])
-                
-                for st in shift_types:
-                    shift_cfg = SHIFTS[st]
-                    shift_start = dt.datetime.combine(june1, dt.time()) + timedelta(hours=shift_cfg['start_hour'])
-                    
-                    if shift_start <= hist_end:
-                        blocked_workers[st].append((worker.name, hist_day, hist_shift, "overlap"))
-                    else:
-                        delta_hours = (shift_start - hist_end).total_seconds() / 3600
-                        if delta_hours < MIN_REST_HOURS:
-                            blocked_workers[st].append((worker.name, hist_day, hist_shift, f"{delta_hours:.1f}h rest"))
+
+    # Hours from June 1 00:00 at which each worker's history shift on the
+    # two previous days ends (NaN: no usable shift), against June 1 starts
+    hist_days = [june1 - timedelta(days=1), june1 - timedelta(days=2)]
+    hist_shifts = [[fixed.get((worker.name, hist_day)) for hist_day in hist_days] for worker in service.workers]
+    hist_end_hours = np.array([
+        [SHIFTS[sh]['end_hour'] - 24 * (d + 1) if sh in SHIFTS else np.nan for d, sh in enumerate(row)]
+        for row in hist_shifts
+    ], dtype=float).reshape(len(service.workers), len(hist_days))
+    shift_start_hours = np.array([SHIFTS[st]['start_hour'] for st in shift_types], dtype=float)
+    rest_hours = shift_start_hours[None, None, :] - hist_end_hours[:, :, None]
+    history_blocks = rest_hours < MIN_REST_HOURS  # NaN compares False
+
+    for w, d, st_idx in np.argwhere(history_blocks):
+        delta_hours = rest_hours[w, d, st_idx]
+        reason = "overlap" if delta_hours <= 0 else f"{delta_hours:.1f}h rest"
+        blocked_workers[shift_types[st_idx]].append(
+            (service.workers[w].name, hist_days[d], hist_shifts[w][d], reason)
+        )
     
     for st in shift_types:
         print(f"\n  {st} shift on June 1 (starts at hour {SHIFTS[st]['start_hour']}):")
@@ -111,8 +125,6 @@ def main():
     print("SIMPLE FEASIBILITY TEST FOR WEEK 23 ONLY")
     print("=" * 60)
     
-    # Build a minimal model for just week 23
-    model = cp_model.CpModel()
     num_workers = len(service.workers)
     workers = [w.to_dict() for w in service.workers]
     
@@ -121,18 +133,44 @@ def main():
     shifts_per_day = 3
     num_shifts = len(week_days) * shifts_per_day
     
+    # Quick necessary check before building the CP-SAT model: each day's
+    # three shifts need three different workers (one shift per day) who may
+    # take them
+    allowed = np.ones((num_workers, num_shifts), dtype=bool)
+    no_nights = [w for w in range(num_workers) if not workers[w]["can_night"]]
+    allowed[np.ix_(no_nights, range(2, num_shifts, 3))] = False
+    for w, _d, st_idx in np.argwhere(history_blocks):
+        allowed[w, st_idx] = False
+    uncovered = [
+        day for d_idx, day in enumerate(week_days)
+        if max_matching(allowed[:, d_idx * 3:d_idx * 3 + 3]) < 3
+    ]
+    if uncovered:
+        # Same report as the CP-SAT branch below. Coverage doesn't involve
+        # weekly participation, so the probe without it is infeasible too
+        print(f"\n  Status: INFEASIBLE (no full coverage on {', '.join(str(d) for d in uncovered)})")
+        print("\n  WEEK 23 IS INFEASIBLE!")
+        print("\n  Testing without weekly participation...")
+        print("  Without weekly participation: INFEASIBLE (shifts cannot all be covered)")
+        return
+
+    # Build a minimal model for just week 23
+    model = cp_model.CpModel()
+    
     # assigned[w][s] = 1 if worker w is assigned shift s
     assigned = [[model.NewBoolVar(f"a_w{w}_s{s}") for s in range(num_shifts)] for w in range(num_workers)]
     
-    # Each shift exactly one worker
-    for s in range(num_shifts):
-        model.AddExactlyOne(assigned[w][s] for w in range(num_workers))
-    
-    # One shift per day per worker
+    # worker_of[s] = the worker covering shift s, channeled to assigned, so
+    # each shift has exactly one worker by construction
+    worker_of = [model.NewIntVar(0, num_workers - 1, f"wos_{s}") for s in range(num_shifts)]
     for w in range(num_workers):
-        for d_idx in range(len(week_days)):
-            day_shifts = [d_idx * 3 + i for i in range(3)]
-            model.Add(sum(assigned[w][s] for s in day_shifts) <= 1)
+        for s in range(num_shifts):
+            model.Add(worker_of[s] == w).OnlyEnforceIf(assigned[w][s])
+            model.Add(worker_of[s] != w).OnlyEnforceIf(assigned[w][s].Not())
+    
+    # One shift per day per worker: a day's shifts go to different workers
+    for d_idx in range(len(week_days)):
+        model.AddAllDifferent([worker_of[d_idx * 3 + i] for i in range(3)])
     
     # Night restrictions
     for w in range(num_workers):
@@ -143,57 +181,29 @@ def main():
     
     # 24h rest constraint (simplified for this week)
     # After a shift ends, can't start another within 24h
-    import datetime as dt
-    shift_times = []
-    for d_idx, day in enumerate(week_days):
-        for st_idx, st in enumerate(['M1', 'M2', 'N']):
-            cfg = SHIFTS[st]
-            start = dt.datetime.combine(day, dt.time()) + timedelta(hours=cfg['start_hour'])
-            end = dt.datetime.combine(day, dt.time()) + timedelta(hours=cfg['end_hour'])
-            shift_times.append((start, end))
-    
+    # Shift times in minutes from the week start. Two shifts conflict if they
+    # overlap or leave less than MIN_REST_HOURS between them, i.e. if they
+    # overlap once each is extended by the rest period: one no-overlap per
+    # worker over those extended shifts
+    starts = np.array([d_idx * 1440 + SHIFTS[st]['start_hour'] * 60
+                       for d_idx in range(len(week_days)) for st in ['M1', 'M2', 'N']], dtype=np.int64)
+    ends = np.array([d_idx * 1440 + SHIFTS[st]['end_hour'] * 60
+                     for d_idx in range(len(week_days)) for st in ['M1', 'M2', 'N']], dtype=np.int64)
+    sizes = ends - starts + MIN_REST_HOURS * 60
+
     for w in range(num_workers):
-        for i in range(num_shifts):
-            for j in range(i + 1, num_shifts):
-                start_i, end_i = shift_times[i]
-                start_j, end_j = shift_times[j]
-                
-                if max(start_i, start_j) < min(end_i, end_j):
-                    model.AddBoolOr([assigned[w][i].Not(), assigned[w][j].Not()])
-                elif start_j >= end_i:
-                    delta = (start_j - end_i).total_seconds() / 3600
-                    if delta < MIN_REST_HOURS:
-                        model.AddBoolOr([assigned[w][i].Not(), assigned[w][j].Not()])
-                elif start_i >= end_j:
-                    delta = (start_i - end_j).total_seconds() / 3600
-                    if delta < MIN_REST_HOURS:
-                        model.AddBoolOr([assigned[w][i].Not(), assigned[w][j].Not()])
-    
-    # Apply history-based blocks for June 1
-    for w, worker in enumerate(workers):
-        w_name = worker["name"]
-        for hist_day in [june1 - timedelta(days=1), june1 - timedelta(days=2)]:
-            hist_shift = hv.fixed_shift_for(w_name, hist_day)
-            if not hist_shift:
-                continue
-            hist_cfg = SHIFTS.get(hist_shift)
-            if not hist_cfg:
-                continue
-            
-            hist_end = dt.datetime.combine(hist_day, dt.time()) + timedelta(hours=hist_cfg['end_hour'])
-            
-            # Block conflicting shifts on June 1 (day index 0)
-            for st_idx, st in enumerate(['M1', 'M2', 'N']):
-                shift_idx = st_idx  # First day
-                shift_start = shift_times[shift_idx][0]
-                
-                if shift_start <= hist_end:
-                    model.Add(assigned[w][shift_idx] == 0)
-                else:
-                    delta = (shift_start - hist_end).total_seconds() / 3600
-                    if delta < MIN_REST_HOURS:
-                        model.Add(assigned[w][shift_idx] == 0)
-    
+        model.AddNoOverlap([
+            model.NewOptionalFixedSizeIntervalVar(int(starts[s]), int(sizes[s]), assigned[w][s], f"rest_w{w}_s{s}")
+            for s in range(num_shifts)
+        ])
+    
+    # Apply history-based blocks for June 1 (shifts 0-2 are June 1's M1, M2, N)
+    for w, _d, st_idx in np.argwhere(history_blocks):
+        model.Add(assigned[w][st_idx] == 0)
+
+    # Everything but weekly participation, kept for the fallback test below
+    model_without_participation = model.Clone()
+
     # Weekly participation: each worker gets at least 1 shift
     for w in range(num_workers):
         model.Add(sum(assigned[w][s] for s in range(num_shifts)) >= 1)
@@ -201,6 +211,9 @@ def main():
     # Solve
     solver = cp_model.CpSolver()
     solver.parameters.max_time_in_seconds = 10
+    # Feasibility probe: no objective, any solution will do
+    solver.parameters.num_search_workers = 8
+    solver.parameters.stop_after_first_solution = True
     status = solver.Solve(model)
     
     status_names = {
@@ -219,72 +232,14 @@ def main():
         for d_idx, day in enumerate(week_days):
             print(f"\n  {day} ({day.strftime('%A')}):")
             for st_idx, st in enumerate(['M1', 'M2', 'N']):
-                shift_idx = d_idx * 3 + st_idx
-                for w in range(num_workers):
-                    if solver.Value(assigned[w][shift_idx]) == 1:
-                        print(f"    {st}: {workers[w]['name']}")
-                        break
+                w = solver.Value(worker_of[d_idx * 3 + st_idx])
+                print(f"    {st}: {workers[w]['name']}")
     else:
         print("\n  WEEK 23 IS INFEASIBLE!")
         print("\n  Testing without weekly participation...")
         
-        # Remove weekly participation and try again
-        model2 = cp_model.CpModel()
-        assigned2 = [[model2.NewBoolVar(f"a2_w{w}_s{s}") for s in range(num_shifts)] for w in range(num_workers)]
-        
-        for s in range(num_shifts):
-            model2.AddExactlyOne(assigned2[w][s] for w in range(num_workers))
-        
-        for w in range(num_workers):
-            for d_idx in range(len(week_days)):
-                day_shifts = [d_idx * 3 + i for i in range(3)]
-                model2.Add(sum(assigned2[w][s] for s in day_shifts) <= 1)
-        
-        for w in range(num_workers):
-            if not workers[w]["can_night"]:
-                for d_idx in range(len(week_days)):
-                    night_shift = d_idx * 3 + 2
-                    model2.Add(assigned2[w][night_shift] == 0)
-        
-        for w in range(num_workers):
-            for i in range(num_shifts):
-                for j in range(i + 1, num_shifts):
-                    start_i, end_i = shift_times[i]
-                    start_j, end_j = shift_times[j]
-                    
-                    if max(start_i, start_j) < min(end_i, end_j):
-                        model2.AddBoolOr([assigned2[w][i].Not(), assigned2[w][j].Not()])
-                    elif start_j >= end_i:
-                        delta = (start_j - end_i).total_seconds() / 3600
-                        if delta < MIN_REST_HOURS:
-                            model2.AddBoolOr([assigned2[w][i].Not(), assigned2[w][j].Not()])
-                    elif start_i >= end_j:
-                        delta = (start_i - end_j).total_seconds() / 3600
-                        if delta < MIN_REST_HOURS:
-                            model2.AddBoolOr([assigned2[w][i].Not(), assigned2[w][j].Not()])
-        
-        # Apply history blocks
-        for w, worker in enumerate(workers):
-            w_name = worker["name"]
-            for hist_day in [june1 - timedelta(days=1), june1 - timedelta(days=2)]:
-                hist_shift = hv.fixed_shift_for(w_name, hist_day)
-                if not hist_shift:
-                    continue
-                hist_cfg = SHIFTS.get(hist_shift)
-                if not hist_cfg:
-                    continue
-                hist_end = dt.datetime.combine(hist_day, dt.time()) + timedelta(hours=hist_cfg['end_hour'])
-                for st_idx in range(3):
-                    shift_idx = st_idx
-                    shift_start = shift_times[shift_idx][0]
-                    if shift_start <= hist_end:
-                        model2.Add(assigned2[w][shift_idx] == 0)
-                    else:
-                        delta = (shift_start - hist_end).total_seconds() / 3600
-                        if delta < MIN_REST_HOURS:
-                            model2.Add(assigned2[w][shift_idx] == 0)
-        
-        status2 = solver.Solve(model2)
+        # Same model, without weekly participation
+        status2 = solver.Solve(model_without_participation)
         print(f"  Without weekly participation: {status_names.get(status2, status2)}")
 
 if __name__ == "__main__":
@@ -1,30 +1,32 @@
 #!/usr/bin/env python3
 """Debug script to identify which constraint causes infeasibility with history."""
 
-from datetime import date, timedelta
-from ortools.sat.python import cp_model
-
-from scheduler_service import SchedulerService
-from scheduling_engine import (
-    _setup_holidays_and_days,
-    _create_shifts,
-    _group_shifts_by_day,
-    _setup_iso_weeks,
-    _define_stat_indices,
-    _create_model,
-    _define_assigned_vars,
-    _add_basic_constraints,
-    _parse_unavail_and_req,
-    _add_unavail_req_constraints,
-    _add_24h_interval_constraints,
-    _add_cross_week_interval_constraints,
-    _add_weekly_participation_constraints,
-    _fix_previous_assignments,
-)
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from history_view import HistoryView
 
 
 def main():
+    # Heavy imports (OR-Tools, the engine) are deferred so importing this
+    # module stays cheap
+    from ortools.sat.python import cp_model
+
+    from scheduler_service import SchedulerService
+    from scheduling_engine import (
+        _setup_holidays_and_days,
+        _create_shifts,
+        _group_shifts_by_day,
+        _setup_iso_weeks,
+        _create_model,
+        _define_assigned_vars,
+        _add_basic_constraints,
+        _parse_unavail_and_req,
+        _add_unavail_req_constraints,
+        _add_24h_interval_constraints,
+        _add_cross_week_interval_constraints,
+        _add_weekly_participation_constraints,
+    )
+
     service = SchedulerService()
     service.load_config("config.yaml")
     
@@ -61,7 +63,7 @@ def main():
     print(f"History has {len(scheduled_dates)} scheduled dates")
     
     # Check history for May 30-31
-    hv = HistoryView(history)
+    fixed = HistoryView(history).fixed_shifts()
     first_day = days[0]
     print(f"\nFirst scheduling day: {first_day}")
     
@@ -69,7 +71,7 @@ def main():
     for d in [first_day - timedelta(days=2), first_day - timedelta(days=1)]:
         print(f"  {d}:")
         for worker in workers:
-            shift = hv.fixed_shift_for(worker["name"], d)
+            shift = fixed.get((worker["name"], d))
             if shift:
                 print(f"    {worker['name']}: {shift}")
     
@@ -78,9 +80,13 @@ def main():
     print("INCREMENTAL CONSTRAINT TESTING")
     print("=" * 70)
     
-    def test_model(name, model, assigned):
+    def test_model(model):
         solver = cp_model.CpSolver()
         solver.parameters.max_time_in_seconds = 10.0
+        # Feasibility probe: no objective, any solution will do. Probes run
+        # side by side, so each gets a couple of search workers.
+        solver.parameters.num_search_workers = 2
+        solver.parameters.stop_after_first_solution = True
         status = solver.Solve(model)
         status_str = {
             cp_model.OPTIMAL: "OPTIMAL",
@@ -89,73 +95,56 @@ def main():
             cp_model.MODEL_INVALID: "MODEL_INVALID",
             cp_model.UNKNOWN: "UNKNOWN/TIMEOUT",
         }.get(status, f"STATUS_{status}")
-        print(f"  {name}: {status_str}")
-        return status in (cp_model.OPTIMAL, cp_model.FEASIBLE)
+        return status_str, status in (cp_model.OPTIMAL, cp_model.FEASIBLE)
     
+    # One model grows step by step; each step only adds its own constraints
+    # and is probed on a snapshot: (heading, name, model)
+    stages = []
+
     # Step 1: Base model (shift coverage + one-per-day + night restrictions)
-    print("\n[1] Base model (coverage + one-per-day + night restrictions):")
     model = _create_model()
     assigned = _define_assigned_vars(model, num_workers, num_shifts)
     model = _add_basic_constraints(model, assigned, num_workers, num_shifts, shifts_by_day, workers, shifts)
-    test_model("Base", model, assigned)
+    stages.append(("[1] Base model (coverage + one-per-day + night restrictions):", "Base", model.Clone()))
     
     # Step 2: Add unavailability
-    print("\n[2] + Unavailability/requests:")
-    model = _create_model()
-    assigned = _define_assigned_vars(model, num_workers, num_shifts)
-    model = _add_basic_constraints(model, assigned, num_workers, num_shifts, shifts_by_day, workers, shifts)
     unav_parsed, req_parsed = _parse_unavail_and_req(unavail_data, required_data, workers)
     model = _add_unavail_req_constraints(model, assigned, unav_parsed, req_parsed, shifts_by_day, shifts, num_workers)
-    test_model("+ Unavail", model, assigned)
+    stages.append(("[2] + Unavailability/requests:", "+ Unavail", model.Clone()))
     
     # Step 3: Add 24h interval
-    print("\n[3] + 24h interval:")
-    model = _create_model()
-    assigned = _define_assigned_vars(model, num_workers, num_shifts)
-    model = _add_basic_constraints(model, assigned, num_workers, num_shifts, shifts_by_day, workers, shifts)
-    unav_parsed, req_parsed = _parse_unavail_and_req(unavail_data, required_data, workers)
-    model = _add_unavail_req_constraints(model, assigned, unav_parsed, req_parsed, shifts_by_day, shifts, num_workers)
     model = _add_24h_interval_constraints(model, assigned, shifts, num_shifts, num_workers)
-    test_model("+ 24h", model, assigned)
+    stages.append(("[3] + 24h interval:", "+ 24h", model.Clone()))
+    # Snapshot for step 5b, which skips the cross-week constraints
+    model_without_cross_week = model.Clone()
     
     # Step 4: Add cross-week interval
-    print("\n[4] + Cross-week interval (from history):")
-    model = _create_model()
-    assigned = _define_assigned_vars(model, num_workers, num_shifts)
-    model = _add_basic_constraints(model, assigned, num_workers, num_shifts, shifts_by_day, workers, shifts)
-    unav_parsed, req_parsed = _parse_unavail_and_req(unavail_data, required_data, workers)
-    model = _add_unavail_req_constraints(model, assigned, unav_parsed, req_parsed, shifts_by_day, shifts, num_workers)
-    model = _add_24h_interval_constraints(model, assigned, shifts, num_shifts, num_workers)
     model = _add_cross_week_interval_constraints(model, assigned, shifts, workers, days, history)
-    feasible = test_model("+ Cross-week", model, assigned)
+    stages.append(("[4] + Cross-week interval (from history):", "+ Cross-week", model.Clone()))
     
     # Step 5: Add weekly participation
-    print("\n[5] + Weekly participation:")
-    model = _create_model()
-    assigned = _define_assigned_vars(model, num_workers, num_shifts)
-    model = _add_basic_constraints(model, assigned, num_workers, num_shifts, shifts_by_day, workers, shifts)
-    unav_parsed, req_parsed = _parse_unavail_and_req(unavail_data, required_data, workers)
-    model = _add_unavail_req_constraints(model, assigned, unav_parsed, req_parsed, shifts_by_day, shifts, num_workers)
-    model = _add_24h_interval_constraints(model, assigned, shifts, num_shifts, num_workers)
-    model = _add_cross_week_interval_constraints(model, assigned, shifts, workers, days, history)
     model = _add_weekly_participation_constraints(model, assigned, iso_weeks, unav_parsed, num_workers)
-    feasible = test_model("+ Participation", model, assigned)
+    stages.append(("[5] + Weekly participation:", "+ Participation", model))
+
+    # The probes are independent and CP-SAT releases the GIL while searching
+    with ThreadPoolExecutor(max_workers=len(stages)) as pool:
+        results = list(pool.map(test_model, [stage_model for _, _, stage_model in stages]))
+    for (heading, name, _), (status_str, _) in zip(stages, results):
+        print(f"\n{heading}")
+        print(f"  {name}: {status_str}")
     
-    if not feasible:
+    # Step 5 (weekly participation) is the last stage
+    _, full_model_feasible = results[-1]
+    if not full_model_feasible:
         print("\n*** INFEASIBLE at step 5 - weekly participation with cross-week constraints ***")
         
         # Try without cross-week to confirm
         print("\n[5b] Without cross-week (participation only):")
-        model = _create_model()
-        assigned = _define_assigned_vars(model, num_workers, num_shifts)
-        model = _add_basic_constraints(model, assigned, num_workers, num_shifts, shifts_by_day, workers, shifts)
-        unav_parsed, req_parsed = _parse_unavail_and_req(unavail_data, required_data, workers)
-        model = _add_unavail_req_constraints(model, assigned, unav_parsed, req_parsed, shifts_by_day, shifts, num_workers)
-        model = _add_24h_interval_constraints(model, assigned, shifts, num_shifts, num_workers)
-        # NO cross-week
-        model = _add_weekly_participation_constraints(model, assigned, iso_weeks, unav_parsed, num_workers)
-        test_model("No cross-week", model, assigned)
-
+        model = _add_weekly_participation_constraints(
+            model_without_cross_week, assigned, iso_weeks, unav_parsed, num_workers
+        )
+        status_str, _ = test_model(model)
+        print(f"  No cross-week: {status_str}")
 
 if __name__ == "__main__":
     main()
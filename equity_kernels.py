@@ -0,0 +1,168 @@
+"""Vectorised equity and report stat counting.
+
+An assignment's contribution to the equity stats (and to the worker report
+stats) depends only on its shift type, weekday and whether it falls on a
+holiday, so every combination is classified once at import into a lookup
+table. Counting a history then reduces to tallying combinations per worker
+(np.bincount) and one matrix product with that table.
+"""
+
+import numpy as np
+
+from constants import EQUITY_STAT_INDEX, SHIFT_TYPES
+
+# Column of each stat in the count matrices
+STAT_INDEX = EQUITY_STAT_INDEX
+
+# Position of each shift type in SHIFT_TYPES
+SHIFT_INDEX = {shift: i for i, shift in enumerate(SHIFT_TYPES)}
+
+# Shift ordinal used for shift types outside SHIFT_TYPES: counted per weekday only
+UNKNOWN_SHIFT = len(SHIFT_TYPES)
+
+_NUM_COMBOS = (len(SHIFT_TYPES) + 1) * 7 * 2
+
+# WorkerStats count fields, in the column order of compute_report_counts
+REPORT_STATS = (
+    'day_shifts',
+    'night_shifts',
+    'weekend_holiday_shifts',
+    'sat_night',
+    'sat_day',
+    'sun_holiday_night',
+    'sun_holiday_day',
+    'fri_night',
+)
+REPORT_INDEX = {stat: i for i, stat in enumerate(REPORT_STATS)}
+
+
+def classify_shift(shift: str, weekday: int, is_holiday: bool) -> list[str]:
+    """Return the equity stats one assignment counts towards.
+
+    Follows the RULES.md holiday counting rules: a night on a Saturday
+    holiday counts as Saturday N, day shifts on any holiday count as
+    Sunday or Holiday, and weekday_m2 is tracked alongside the other stats.
+    """
+    is_night = shift == 'N'
+    is_m1 = shift == 'M1'
+    is_m2 = shift == 'M2'
+    is_day_shift = is_m1 or is_m2
+    is_saturday = weekday == 5
+    is_sunday = weekday == 6
+    is_monday = weekday == 0
+    is_friday = weekday == 4
+    is_weekday = weekday < 5
+    is_weekday_holiday = is_holiday and is_weekday
+    is_saturday_holiday = is_holiday and is_saturday
+
+    stats = []
+    if is_saturday and is_night:
+        stats.append('sat_n')
+    elif is_m2 and (is_sunday or is_weekday_holiday or is_saturday_holiday):
+        stats.append('sun_holiday_m2')
+    elif is_m1 and (is_sunday or is_weekday_holiday or is_saturday_holiday):
+        stats.append('sun_holiday_m1')
+    elif is_night and (is_sunday or is_weekday_holiday):
+        stats.append('sun_holiday_n')
+    elif is_saturday and is_m2 and not is_holiday:
+        stats.append('sat_m2')
+    elif is_saturday and is_m1 and not is_holiday:
+        stats.append('sat_m1')
+    elif is_weekday and is_night and not is_holiday:
+        stats.append('weekday_n')
+        stats.append('fri_night' if is_friday else 'weekday_not_fri_n')
+    elif is_monday and is_day_shift and not is_holiday:
+        stats.append('monday_day')
+    elif is_weekday and not is_monday and is_day_shift and not is_holiday:
+        stats.append('weekday_not_mon_day')
+
+    # Tracked independently: overlaps with monday_day / weekday_not_mon_day
+    if is_weekday and is_m2 and not is_holiday:
+        stats.append('weekday_m2')
+    return stats
+
+
+def classify_report_shift(shift: str, weekday: int, is_holiday: bool) -> list[str]:
+    """Return the worker report stats one assignment counts towards.
+
+    Unknown shift types only count as weekend/holiday shifts.
+    """
+    is_day = shift in ('M1', 'M2')
+    is_night = shift == 'N'
+
+    stats = []
+    if is_day:
+        stats.append('day_shifts')
+    if is_night:
+        stats.append('night_shifts')
+    if weekday >= 5 or is_holiday:
+        stats.append('weekend_holiday_shifts')
+    if weekday == 5:  # Saturday
+        if is_night:
+            stats.append('sat_night')
+        if is_day:
+            stats.append('sat_day')
+    if weekday == 6 or is_holiday:  # Sunday or holiday
+        if is_night:
+            stats.append('sun_holiday_night')
+        if is_day:
+            stats.append('sun_holiday_day')
+    if weekday == 4 and is_night:  # Friday night
+        stats.append('fri_night')
+    return stats
+
+
+def _build_table(classify, index) -> np.ndarray:
+    """(shift ordinal, weekday, is_holiday) -> per-stat increments, flattened.
+
+    The UNKNOWN_SHIFT row is classified as an empty shift type.
+    """
+    table = np.zeros((len(SHIFT_TYPES) + 1, 7, 2, len(index)), dtype=np.int64)
+    for shift_idx, shift in enumerate(SHIFT_TYPES + ('',)):
+        for weekday in range(7):
+            for is_holiday in (0, 1):
+                for stat in classify(shift, weekday, bool(is_holiday)):
+                    table[shift_idx, weekday, is_holiday, index[stat]] += 1
+    return table.reshape(_NUM_COMBOS, len(index))
+
+
+EQUITY_TABLE = _build_table(classify_shift, STAT_INDEX)
+REPORT_TABLE = _build_table(classify_report_shift, REPORT_INDEX)
+
+
+def _tally_combos(worker_idx, shift_idx, weekday, is_holiday, num_workers: int) -> np.ndarray:
+    """Count assignments per worker and (shift, weekday, holiday) combination."""
+    worker_idx = np.asarray(worker_idx, dtype=np.int64)
+    combos = (np.asarray(shift_idx, dtype=np.int64) * 7 + np.asarray(weekday, dtype=np.int64)) * 2
+    combos += np.asarray(is_holiday, dtype=np.int64)
+    tallies = np.bincount(worker_idx * _NUM_COMBOS + combos, minlength=num_workers * _NUM_COMBOS)
+    return tallies.reshape(num_workers, _NUM_COMBOS)
+
+
+def compute_equity_counts(worker_idx, shift_idx, weekday, is_holiday, num_workers: int):
+    """Count equity stats and weekdays per worker for a batch of assignments.
+
+    Args:
+        worker_idx: Worker index (0..num_workers-1) of each assignment
+        shift_idx: Position of the shift in SHIFT_TYPES, or UNKNOWN_SHIFT
+        weekday: Weekday of each assignment (Monday=0)
+        is_holiday: Whether each assignment falls on a holiday
+        num_workers: Number of workers (rows of the result)
+
+    Returns:
+        (stats, dow): int64 arrays of shape (num_workers, len(EQUITY_STATS))
+        and (num_workers, 7)
+    """
+    tallies = _tally_combos(worker_idx, shift_idx, weekday, is_holiday, num_workers)
+    stats = tallies @ EQUITY_TABLE
+    dow = tallies.reshape(num_workers, len(SHIFT_TYPES) + 1, 7, 2).sum(axis=(1, 3))
+    return stats, dow
+
+
+def compute_report_counts(worker_idx, shift_idx, weekday, is_holiday, num_workers: int) -> np.ndarray:
+    """Count the worker report stats per worker for a batch of assignments.
+
+    Takes the same arguments as compute_equity_counts and returns an int64
+    array of shape (num_workers, len(REPORT_STATS)).
+    """
+    return _tally_combos(worker_idx, shift_idx, weekday, is_holiday, num_workers) @ REPORT_TABLE
@@ -71,6 +71,26 @@ class HistoryView:
                 return sh if isinstance(sh, str) else None
         return None
 
+    def fixed_shifts(self) -> Dict[Tuple[str, date], Optional[str]]:
+        """Return mapping (worker_name, day) -> fixed_shift_for(worker_name, day).
+
+        Built in one pass, for callers that look up many (worker, day) pairs.
+        Pairs without a historical assignment are absent.
+        """
+        fixed: Dict[Tuple[str, date], Optional[str]] = {}
+        for worker_name, month_key, ass in self.iter_assignments():
+            d_str = ass.get("date")
+            # fixed_shift_for only looks in the day's own month bucket
+            if not isinstance(d_str, str) or d_str[:7] != month_key:
+                continue
+            try:
+                d = date.fromisoformat(d_str)
+            except ValueError:
+                continue
+            sh = ass.get("shift")
+            fixed.setdefault((worker_name, d), sh if isinstance(sh, str) else None)
+        return fixed
+
     def assignments_by_date(self) -> Dict[str, List[Dict[str, Any]]]:
         """Return mapping date_str -> list[{worker, shift, dur}]."""
         by_date: Dict[str, List[Dict[str, Any]]] = {}
@@ -103,42 +103,46 @@ def add_24h_interval_constraints(model, assigned, shifts, num_shifts, num_worker
         # For each shift, only check shifts within 48 hours (beyond that, 24h rest is guaranteed)
         MAX_CHECK_HOURS = 48
         
-        constraints_added = 0
-        for w in range(num_workers):
-            for idx_i, i in enumerate(sorted_indices):
-                si = shifts[i]
-                start_i = si["start"]
-                end_i = si["end"]
+        # Shift times as integer minutes from the earliest start, so the pair
+        # scan below compares ints instead of building timedeltas
+        origin = shifts[sorted_indices[0]]["start"] if shifts else None
+        minute = timedelta(minutes=1)
+        start_min = [(sh["start"] - origin) // minute for sh in shifts]
+        end_min = [(sh["end"] - origin) // minute for sh in shifts]
+        max_check = MAX_CHECK_HOURS * 60
+        min_rest = MIN_REST_HOURS * 60
+        
+        # Conflicting pairs don't depend on the worker: find them once
+        conflicts = []
+        for idx_i, i in enumerate(sorted_indices):
+            start_i = start_min[i]
+            end_i = end_min[i]
+            
+            # Only check subsequent shifts within MAX_CHECK_HOURS
+            for idx_j in range(idx_i + 1, len(sorted_indices)):
+                j = sorted_indices[idx_j]
+                start_j = start_min[j]
+                end_j = end_min[j]
                 
-                # Only check subsequent shifts within MAX_CHECK_HOURS
-                for idx_j in range(idx_i + 1, len(sorted_indices)):
-                    j = sorted_indices[idx_j]
-                    sj = shifts[j]
-                    start_j = sj["start"]
-                    end_j = sj["end"]
-                    
-                    # If shift j starts more than MAX_CHECK_HOURS after shift i ends,
-                    # no need to check further shifts (they're sorted by start time)
-                    hours_apart = (start_j - end_i).total_seconds() / 3600
-                    if hours_apart >= MAX_CHECK_HOURS:
-                        break
-                    
-                    # Check for overlap
-                    if max(start_i, start_j) < min(end_i, end_j):
-                        model.AddBoolOr([assigned[w][i].Not(), assigned[w][j].Not()])
-                        constraints_added += 1
-                    else:
-                        # Check rest interval
-                        if start_j >= end_i:
-                            delta = (start_j - end_i).total_seconds() / 3600
-                            if delta < MIN_REST_HOURS:
-                                model.AddBoolOr([assigned[w][i].Not(), assigned[w][j].Not()])
-                                constraints_added += 1
-                        elif start_i >= end_j:
-                            delta = (start_i - end_j).total_seconds() / 3600
-                            if delta < MIN_REST_HOURS:
-                                model.AddBoolOr([assigned[w][i].Not(), assigned[w][j].Not()])
-                                constraints_added += 1
+                # If shift j starts more than MAX_CHECK_HOURS after shift i ends,
+                # no need to check further shifts (they're sorted by start time)
+                if start_j - end_i >= max_check:
+                    break
+                
+                # Overlap, or too little rest between them in either order
+                if max(start_i, start_j) < min(end_i, end_j):
+                    conflicts.append((i, j))
+                elif start_j >= end_i:
+                    if start_j - end_i < min_rest:
+                        conflicts.append((i, j))
+                elif start_i >= end_j:
+                    if start_i - end_j < min_rest:
+                        conflicts.append((i, j))
+        
+        for w in range(num_workers):
+            for i, j in conflicts:
+                model.AddBoolOr([assigned[w][i].Not(), assigned[w][j].Not()])
+        constraints_added = len(conflicts) * num_workers
         
         _mc_logger.debug(f"24h interval constraints added: {constraints_added}")
 
@@ -1080,6 +1080,8 @@ def add_tiebreak_objective(model, obj, assigned, num_workers, num_shifts, worker
 
 
 def add_saturday_preference_objective(model, obj, weight_flex, iso_weeks, assigned, num_workers, shifts, unav_parsed, holiday_set):
+    # Tiers 2-6 cost 1%-5% of the rule weight; rounded once so the objective keeps integer coefficients
+    w2, w3, w4, w5, w6 = (int(round(weight_flex * pct / 100)) for pct in (1, 2, 3, 4, 5))
     for key in iso_weeks:
         week = iso_weeks[key]
         sat = week["monday"] + timedelta(days=5)
@@ -1157,7 +1159,7 @@ def add_saturday_preference_objective(model, obj, weight_flex, iso_weeks, assign
                 model.Add(tier2 <= has_weekday_night)
                 model.Add(tier2 <= has_any_shift)
                 model.Add(tier2 >= has_weekday_day.Not() + has_weekday_night + has_any_shift - 2)
-                obj += (weight_flex * 0.01) * tier2
+                obj += w2 * tier2
                 continue  # Skip all Sat/Sun penalties
 
             tier2 = model.NewBoolVar(f"t2_w{w}_k{key}")
@@ -1165,7 +1167,7 @@ def add_saturday_preference_objective(model, obj, weight_flex, iso_weeks, assign
             model.Add(tier2 <= has_weekday_night)
             model.Add(tier2 <= has_any_shift)
             model.Add(tier2 >= has_weekday_day.Not() + has_weekday_night + has_any_shift - 2)
-            obj += (weight_flex * 0.01) * tier2
+            obj += w2 * tier2
 
             tier3 = model.NewBoolVar(f"t3_w{w}_k{key}")
             model.Add(tier3 <= has_weekday_day.Not())
@@ -1173,7 +1175,7 @@ def add_saturday_preference_objective(model, obj, weight_flex, iso_weeks, assign
             model.Add(tier3 <= has_sat_day)
             model.Add(tier3 <= has_any_shift)
             model.Add(tier3 >= has_weekday_day.Not() + has_weekday_night.Not() + has_sat_day + has_any_shift - 3)
-            obj += (weight_flex * 0.02) * tier3
+            obj += w3 * tier3
 
             tier4 = model.NewBoolVar(f"t4_w{w}_k{key}")
             model.Add(tier4 <= has_weekday_day.Not())
@@ -1182,7 +1184,7 @@ def add_saturday_preference_objective(model, obj, weight_flex, iso_weeks, assign
             model.Add(tier4 <= has_sat_night)
             model.Add(tier4 <= has_any_shift)
             model.Add(tier4 >= has_weekday_day.Not() + has_weekday_night.Not() + has_sat_day.Not() + has_sat_night + has_any_shift - 4)
-            obj += (weight_flex * 0.03) * tier4
+            obj += w4 * tier4
 
             tier5 = model.NewBoolVar(f"t5_w{w}_k{key}")
             model.Add(tier5 <= has_weekday_day.Not())
@@ -1192,7 +1194,7 @@ def add_saturday_preference_objective(model, obj, weight_flex, iso_weeks, assign
             model.Add(tier5 <= has_sun_day)
             model.Add(tier5 <= has_any_shift)
             model.Add(tier5 >= has_weekday_day.Not() + has_weekday_night.Not() + has_sat_day.Not() + has_sat_night.Not() + has_sun_day + has_any_shift - 5)
-            obj += (weight_flex * 0.04) * tier5
+            obj += w5 * tier5
 
             tier6 = model.NewBoolVar(f"t6_w{w}_k{key}")
             model.Add(tier6 <= has_weekday_day.Not())
@@ -1203,6 +1205,6 @@ def add_saturday_preference_objective(model, obj, weight_flex, iso_weeks, assign
             model.Add(tier6 <= has_sun_night)
             model.Add(tier6 <= has_any_shift)
             model.Add(tier6 >= has_weekday_day.Not() + has_weekday_night.Not() + has_sat_day.Not() + has_sat_night.Not() + has_sun_day.Not() + has_sun_night + has_any_shift - 6)
-            obj += (weight_flex * 0.05) * tier6
+            obj += w6 * tier6
 
     return obj
@@ -12,7 +12,15 @@ import calendar
 import datetime
 from datetime import date, timedelta
 
-from constants import SHIFTS, SHIFT_TYPES
+from constants import (
+    DAY_SHIFTS_MASK,
+    SHIFT_DUR_ARR,
+    SHIFT_END_ARR,
+    SHIFT_NIGHT_ARR,
+    SHIFT_START_ARR,
+    SHIFT_TYPES,
+    Shift,
+)
 
 
 def setup_holidays_and_days(year: int, month: int, holidays) -> tuple[set[date], list[date]]:
@@ -57,26 +65,31 @@ def setup_holidays_and_days(year: int, month: int, holidays) -> tuple[set[date],
 
 
 def create_shifts(days: list[date]):
+    # Per-shift-type offsets and attributes, computed once rather than per day
+    shift_specs = [
+        (st, Shift(i), timedelta(hours=start), timedelta(hours=end), dur, night)
+        for i, (st, start, end, dur, night) in enumerate(zip(
+            SHIFT_TYPES, SHIFT_START_ARR, SHIFT_END_ARR, SHIFT_DUR_ARR, SHIFT_NIGHT_ARR
+        ))
+    ]
     shifts = []
     for day in days:
         d_dt = datetime.datetime.combine(day, datetime.time())
-        for st in SHIFT_TYPES:
-            config = SHIFTS[st]
+        for st, ordinal, start, end, dur, night in shift_specs:
             shifts.append(
                 {
                     "type": st,
-                    "start": d_dt + timedelta(hours=config["start_hour"]),
-                    "end": d_dt + timedelta(hours=config["end_hour"]),
-                    "dur": config["dur"],
-                    "night": config["night"],
+                    "ordinal": ordinal,
+                    "start": d_dt + start,
+                    "end": d_dt + end,
+                    "dur": dur,
+                    "night": night,
                     "day": day,
+                    "index": len(shifts),
                 }
             )
 
-    num_shifts = len(shifts)
-    for i in range(num_shifts):
-        shifts[i]["index"] = i
-    return shifts, num_shifts
+    return shifts, len(shifts)
 
 
 def group_shifts_by_day(num_shifts: int, shifts: list[dict]) -> dict[date, list[int]]:
@@ -173,13 +186,13 @@ def define_stat_indices(shifts: list[dict], num_shifts: int, holiday_set: set[da
         return shifts[s]["night"]
     
     def is_m1(s):
-        return shifts[s]["type"] == "M1"
+        return shifts[s]["ordinal"] == Shift.M1
     
     def is_m2(s):
-        return shifts[s]["type"] == "M2"
+        return shifts[s]["ordinal"] == Shift.M2
     
     def is_day_shift(s):
-        return is_m1(s) or is_m2(s)
+        return (1 << shifts[s]["ordinal"]) & DAY_SHIFTS_MASK
     
     def is_monday(s):
         return shifts[s]["day"].weekday() == 0
@@ -13,24 +13,76 @@ Benefits:
 
 from __future__ import annotations
 
+import copy
 import json
 import os
+import sys
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
-from typing import Any, Callable, Optional
+from typing import Any, Iterable, Optional
 
+import numpy as np
 import yaml
 
 from ortools.sat.python import cp_model
 
+try:
+    import orjson
+except ImportError:  # Optional: history I/O falls back to the stdlib encoder
+    orjson = None
+
 from constants import DOW_EQUITY_WEIGHT, EQUITY_STATS, EQUITY_WEIGHTS
+from equity_kernels import REPORT_STATS, SHIFT_INDEX, UNKNOWN_SHIFT, compute_report_counts
 from scheduling_engine import _compute_past_stats, generate_schedule, update_history
-from utils import compute_holidays
+from utils import compute_holidays, is_holiday_ordinal
 from logger import get_logger
 
 logger = get_logger('scheduler_service')
 
 
+def dumps_json(obj: Any) -> bytes:
+    """Serialize obj to indented UTF-8 JSON, using orjson when installed.
+
+    History files are meant to be readable by hand, so the output stays
+    indented (orjson only supports 2 spaces; the fallback keeps 4).
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=4, ensure_ascii=False, default=str).encode('utf-8')
+
+
+def loads_json(data: bytes) -> Any:
+    """Parse UTF-8 JSON, using orjson when installed.
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def read_history_file(file_path: str) -> dict:
+    """Read and parse a history JSON file.
+
+    Raises:
+        OSError: If the file cannot be read
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    with open(file_path, 'rb') as f:
+        return loads_json(f.read())
+
+
+def write_history_file(file_path: str, data: bytes) -> None:
+    """Write history already serialized with dumps_json to a file.
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    with open(file_path, 'wb') as f:
+        f.write(data)
+
+
 @dataclass
 class Worker:
     """Represents a worker with scheduling attributes."""
@@ -40,6 +92,15 @@ class Worker:
     can_night: bool = True
     weekly_load: int = 18
 
+    def __post_init__(self):
+        # Names and colors key the UI's per-cell lookups; interned strings
+        # compare by identity against the copies held elsewhere. Non-str
+        # values (e.g. a numeric name from a CSV) are kept as given
+        if isinstance(self.name, str):
+            self.name = sys.intern(self.name)
+        if isinstance(self.color, str):
+            self.color = sys.intern(self.color)
+
     def to_dict(self) -> dict:
         return {
             "name": self.name,
@@ -79,6 +140,22 @@ class ScheduleResult:
         return self.success and bool(self.schedule)
 
 
+@dataclass(frozen=True)
+class ScheduleRequest:
+    """Inputs for one schedule solve, copied from the service state."""
+    year: int
+    month: int
+    unavail: dict[str, list[str]]
+    req: dict[str, list[str]]
+    history: dict[str, dict[str, list[dict]]]
+    workers: list[dict]
+    holidays: list[int]
+    equity_weights: dict[str, float]
+    dow_equity_weight: float
+    lexicographic: bool
+    equity_credits: dict[str, dict[str, int]]
+
+
 @dataclass
 class WorkerStats:
     """Statistics for a single worker."""
@@ -347,6 +424,38 @@ class SchedulerService:
         logger.info(f"Added worker: {name}")
         return worker
 
+    def add_workers(self, names: Iterable[str]) -> list[Worker]:
+        """Add several workers with default settings in one pass.
+
+        Names are stripped; blank names and names that already exist (or
+        repeat earlier in the input) are skipped rather than raising.
+
+        Args:
+            names: Worker names, e.g. streamed from a CSV reader
+
+        Returns:
+            The newly created Workers, in input order
+        """
+        existing = {w.name for w in self._workers}
+        next_num = max((int(w.id[2:]) for w in self._workers), default=0) + 1
+
+        added = []
+        for name in names:
+            name = name.strip()
+            if not name or name in existing:
+                continue
+            existing.add(name)
+            worker = Worker(name=name, id=f"ID{next_num:03d}")
+            next_num += 1
+            self._workers.append(worker)
+            self._unavail[name] = []
+            self._req[name] = []
+            added.append(worker)
+
+        if added:
+            logger.info(f"Added {len(added)} workers")
+        return added
+
     def remove_worker(self, name: str) -> bool:
         """Remove a worker by name.
 
@@ -411,6 +520,37 @@ class SchedulerService:
             return True
         return False
 
+    def add_unavailable_entries(self, worker_name: str, entries: Iterable[str]) -> list[str]:
+        """Add several unavailable entries for a worker in one pass.
+
+        Returns:
+            The entries that were added (existing ones are skipped)
+        """
+        return self._add_entries(self._unavail, worker_name, entries)
+
+    def add_required_entries(self, worker_name: str, entries: Iterable[str]) -> list[str]:
+        """Add several required entries for a worker in one pass.
+
+        Returns:
+            The entries that were added (existing ones are skipped)
+        """
+        return self._add_entries(self._req, worker_name, entries)
+
+    @staticmethod
+    def _add_entries(store: dict[str, list[str]], worker_name: str, entries: Iterable[str]) -> list[str]:
+        """Append entries missing from store[worker_name], checked against a set."""
+        if worker_name not in store:
+            return []
+        current = store[worker_name]
+        existing = set(current)
+        added = []
+        for entry in entries:
+            if entry not in existing:
+                existing.add(entry)
+                added.append(entry)
+        current.extend(added)
+        return added
+
     def remove_unavailable(self, worker_name: str, index: int) -> bool:
         """Remove an unavailable entry by index."""
         if worker_name in self._unavail and 0 <= index < len(self._unavail[worker_name]):
@@ -441,6 +581,26 @@ class SchedulerService:
             return True
         return False
 
+    def add_manual_holidays(self, days: Iterable[int]) -> int:
+        """Add several manual holidays (days of month) in one pass.
+
+        Days already present (or repeated earlier in the input) are skipped.
+
+        Args:
+            days: Days of month, e.g. streamed from an imported file
+
+        Returns:
+            Number of holidays added
+        """
+        existing = set(self._manual_holidays)
+        added = 0
+        for day in days:
+            if day not in existing:
+                existing.add(day)
+                self._manual_holidays.append(day)
+                added += 1
+        return added
+
     def clear_manual_holidays(self) -> None:
         """Clear all manual holidays."""
         self._manual_holidays.clear()
@@ -754,6 +914,8 @@ class SchedulerService:
     def generate(self, year: int, month: int) -> ScheduleResult:
         """Generate a schedule for the given month.
 
+        Equivalent to prepare_generation, solve and apply_result in turn.
+
         Args:
             year: Year to schedule
             month: Month to schedule (1-12)
@@ -761,13 +923,25 @@ class SchedulerService:
         Returns:
             ScheduleResult with schedule data or error information
         """
-        all_holidays = self.get_holidays(year, month)
-        workers_dict = [w.to_dict() for w in self._workers]
+        result = self.solve(self.prepare_generation(year, month))
+        self.apply_result(result)
+        return result
+
+    def prepare_generation(self, year: int, month: int) -> ScheduleRequest:
+        """Copy the inputs for a schedule solve out of the service state.
+
+        The copy is independent of the service, so solve() can run on another
+        thread while workers, availability or history keep changing.
 
-        logger.info(f"Generating schedule for {month}/{year} with {len(self._workers)} workers")
+        Args:
+            year: Year to schedule
+            month: Month to schedule (1-12)
 
+        Returns:
+            ScheduleRequest to pass to solve
+        """
         # Merge manual equity credits with percentage-based credits
-        merged_credits = dict(self._equity_credits)  # Start with manual credits
+        merged_credits = copy.deepcopy(self._equity_credits)  # Start with manual credits
         pct_credits = self.compute_credits_from_percentages(year, month)
         for worker_name, credits in pct_credits.items():
             if worker_name not in merged_credits:
@@ -779,27 +953,52 @@ class SchedulerService:
         if pct_credits:
             logger.info(f"Applied percentage-based credits: {pct_credits}")
 
+        return ScheduleRequest(
+            year=year,
+            month=month,
+            unavail=copy.deepcopy(self._unavail),
+            req=copy.deepcopy(self._req),
+            history=copy.deepcopy(self._history),
+            workers=[w.to_dict() for w in self._workers],
+            holidays=self.get_holidays(year, month),
+            equity_weights=dict(self._equity_weights),
+            dow_equity_weight=self._dow_equity_weight,
+            lexicographic=self._lexicographic,
+            equity_credits=merged_credits,
+        )
+
+    @staticmethod
+    def solve(request: ScheduleRequest) -> ScheduleResult:
+        """Run the solver on a prepared request.
+
+        Reads only the request and leaves the service untouched, so it is safe
+        to call off the UI thread. Pass the result to apply_result afterwards.
+
+        Args:
+            request: Inputs from prepare_generation
+
+        Returns:
+            ScheduleResult with schedule data or error information
+        """
+        year, month = request.year, request.month
+        workers_dict = request.workers
+
+        logger.info(f"Generating schedule for {month}/{year} with {len(workers_dict)} workers")
+
         try:
             schedule, weekly, assignments, stats, current_stats = generate_schedule(
                 year, month,
-                self._unavail,
-                self._req,
-                self._history,
+                request.unavail,
+                request.req,
+                request.history,
                 workers_dict,
-                holidays=all_holidays,
-                equity_weights=self._equity_weights,
-                dow_equity_weight=self._dow_equity_weight,
-                lexicographic=self._lexicographic,
-                equity_credits=merged_credits,
+                holidays=request.holidays,
+                equity_weights=request.equity_weights,
+                dow_equity_weight=request.dow_equity_weight,
+                lexicographic=request.lexicographic,
+                equity_credits=request.equity_credits,
             )
-
-            # Cache stats for later use
-            self._current_stats = current_stats
-            self._past_stats = _compute_past_stats(self._history, workers_dict)
-
-            # Update history with new assignments
-            if assignments:
-                self._history = update_history(assignments, self._history)
+            past_stats = _compute_past_stats(request.history, workers_dict)
 
             status = stats.get("status")
             success = status in (cp_model.OPTIMAL, cp_model.FEASIBLE)
@@ -821,7 +1020,7 @@ class SchedulerService:
                 assignments=assignments,
                 stats=stats,
                 current_stats=current_stats,
-                past_stats=self._past_stats,
+                past_stats=past_stats,
                 error_message=error_msg,
                 diagnostic_report=diagnostic_report,
             )
@@ -833,6 +1032,25 @@ class SchedulerService:
                 error_message=str(e)
             )
 
+    def apply_result(self, result: ScheduleResult) -> None:
+        """Record a solved schedule: cache its stats and add it to history.
+
+        Call on the thread that owns the service, after solve.
+
+        Args:
+            result: ScheduleResult returned by solve
+        """
+        if result.past_stats is None:
+            return  # The solve raised; nothing to record
+
+        # Cache stats for later use
+        self._current_stats = result.current_stats
+        self._past_stats = result.past_stats
+
+        # Update history with new assignments
+        if result.assignments:
+            self._history = update_history(result.assignments, self._history)
+
     def has_schedule_for_month(self, year: int, month: int) -> bool:
         """Check if a schedule already exists for the first complete ISO week of the given month.
 
@@ -955,55 +1173,55 @@ class SchedulerService:
         Returns:
             WorkerStats with aggregated statistics
         """
-        stats = WorkerStats(name=worker_name)
+        return self._report_stats([worker_name])[0]
 
-        if worker_name not in self._history:
-            return stats
+    def _report_stats(self, worker_names: list[str], start_date: Optional[date] = None,
+                      end_date: Optional[date] = None) -> list[WorkerStats]:
+        """Aggregate history into WorkerStats for several workers at once.
 
-        for month_year in self._history[worker_name]:
-            try:
-                year, month = map(int, month_year.split('-'))
-            except ValueError:
-                continue
+        Assignments are encoded as (worker, shift, weekday, holiday) ordinals
+        and counted in one pass by equity_kernels.compute_report_counts.
 
-            holidays = set(compute_holidays(year, month))
+        Args:
+            worker_names: Workers to report on, in result order
+            start_date: If given, skip assignments before this date
+            end_date: If given, skip assignments after this date
 
-            for ass in self._history[worker_name][month_year]:
+        Returns:
+            One WorkerStats per name in worker_names
+        """
+        hours = [0] * len(worker_names)
+        worker_idx, shift_idx, ordinals = [], [], []
+
+        for w, worker_name in enumerate(worker_names):
+            for month_year, assignments in self._history.get(worker_name, {}).items():
                 try:
-                    d = datetime.fromisoformat(ass['date'])
-                    stats.total_hours += ass.get('dur', 0)
-
-                    shift = ass.get('shift', '')
-                    weekday = d.weekday()
-                    day_num = d.day
-                    is_holiday = day_num in holidays
-                    is_weekend_hol = weekday >= 5 or is_holiday
-                    is_day = shift in ['M1', 'M2']
-                    is_night = shift == 'N'
-
-                    if is_day:
-                        stats.day_shifts += 1
-                    if is_night:
-                        stats.night_shifts += 1
-                    if is_weekend_hol:
-                        stats.weekend_holiday_shifts += 1
-                    if weekday == 5:  # Saturday
-                        if is_night:
-                            stats.sat_night += 1
-                        if is_day:
-                            stats.sat_day += 1
-                    if weekday == 6 or is_holiday:  # Sunday or holiday
-                        if is_night:
-                            stats.sun_holiday_night += 1
-                        if is_day:
-                            stats.sun_holiday_day += 1
-                    if weekday == 4 and is_night:  # Friday night
-                        stats.fri_night += 1
-
-                except (ValueError, KeyError):
+                    year, month = map(int, month_year.split('-'))
+                except ValueError:
                     continue
 
-        return stats
+                for ass in assignments:
+                    try:
+                        d = datetime.fromisoformat(ass['date']).date()
+                    except (ValueError, KeyError):
+                        continue
+                    if (start_date and d < start_date) or (end_date and d > end_date):
+                        continue
+
+                    hours[w] += ass.get('dur', 0)
+                    worker_idx.append(w)
+                    shift_idx.append(SHIFT_INDEX.get(ass.get('shift', ''), UNKNOWN_SHIFT))
+                    ordinals.append(d.toordinal())
+
+        # Ordinal 1 (0001-01-01) is a Monday
+        ordinals = np.asarray(ordinals, dtype=np.int32)
+        counts = compute_report_counts(worker_idx, shift_idx, (ordinals - 1) % 7,
+                                       is_holiday_ordinal(ordinals), len(worker_names))
+        return [
+            WorkerStats(name=worker_name, total_hours=total_hours,
+                        **dict(zip(REPORT_STATS, row)))
+            for worker_name, total_hours, row in zip(worker_names, hours, counts.tolist())
+        ]
 
     def generate_all_worker_stats(self, weeks_lookback: int = 52) -> list[WorkerStats]:
         """Generate statistics for all workers within a date range.
@@ -1031,59 +1249,7 @@ class SchedulerService:
             current_date = date.today()
             start_date = current_date - timedelta(weeks=weeks_lookback)
 
-        results = []
-        for worker in sorted(self._workers, key=lambda w: w.name):
-            stats = WorkerStats(name=worker.name)
-
-            if worker.name in self._history:
-                for month_year in self._history[worker.name]:
-                    try:
-                        y, m = map(int, month_year.split('-'))
-                    except ValueError:
-                        continue
-
-                    holidays = set(compute_holidays(y, m))
-
-                    for ass in self._history[worker.name][month_year]:
-                        ass_date_str = ass.get('date')
-                        if not ass_date_str:
-                            continue
-
-                        ass_date = datetime.fromisoformat(ass_date_str).date()
-                        if ass_date < start_date or ass_date > current_date:
-                            continue
-
-                        shift = ass.get('shift', '')
-                        dur = ass.get('dur', 0)
-                        weekday = ass_date.weekday()
-                        is_holiday = ass_date.day in holidays
-                        is_weekend_hol = weekday >= 5 or is_holiday
-                        is_day = shift in ['M1', 'M2']
-                        is_night = shift == 'N'
-
-                        stats.total_hours += dur
-                        if is_day:
-                            stats.day_shifts += 1
-                        if is_night:
-                            stats.night_shifts += 1
-                        if is_weekend_hol:
-                            stats.weekend_holiday_shifts += 1
-                        if weekday == 5:
-                            if is_night:
-                                stats.sat_night += 1
-                            if is_day:
-                                stats.sat_day += 1
-                        if weekday == 6 or is_holiday:
-                            if is_night:
-                                stats.sun_holiday_night += 1
-                            if is_day:
-                                stats.sun_holiday_day += 1
-                        if weekday == 4 and is_night:
-                            stats.fri_night += 1
-
-            results.append(stats)
-
-        return results
+        return self._report_stats(sorted(w.name for w in self._workers), start_date, current_date)
 
     def get_equity_totals(self) -> dict[str, list[int]]:
         """Get combined equity totals (past + current) for all workers.
@@ -1152,26 +1318,7 @@ class SchedulerService:
             True if loaded successfully, False otherwise
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                loaded_history = json.load(f)
-
-            # Merge loaded data
-            for worker, worker_data in loaded_history.items():
-                if worker not in self._history:
-                    self._history[worker] = {}
-
-                for month_year, assignments in worker_data.items():
-                    if month_year not in self._history[worker]:
-                        self._history[worker][month_year] = []
-
-                    existing = {(ass['date'], ass['shift'])
-                                for ass in self._history[worker][month_year]}
-
-                    for ass in assignments:
-                        key = (ass['date'], ass['shift'])
-                        if key not in existing:
-                            self._history[worker][month_year].append(ass)
-
+            self.merge_history(read_history_file(file_path))
             logger.info(f"History loaded from {file_path}")
             return True
 
@@ -1182,6 +1329,32 @@ class SchedulerService:
             logger.error(f"Failed to load history: {e}")
             return False
 
+    def merge_history(self, loaded_history: dict) -> None:
+        """Merge history loaded from a file into the current history.
+
+        Assignments already present for a worker and month are skipped.
+
+        Args:
+            loaded_history: History dictionary, as returned by read_history_file
+        """
+        for worker, worker_data in loaded_history.items():
+            if isinstance(worker, str):
+                worker = sys.intern(worker)  # Shared with Worker.name, see Worker.__post_init__
+            if worker not in self._history:
+                self._history[worker] = {}
+
+            for month_year, assignments in worker_data.items():
+                if month_year not in self._history[worker]:
+                    self._history[worker][month_year] = []
+
+                existing = {(ass['date'], ass['shift'])
+                            for ass in self._history[worker][month_year]}
+
+                for ass in assignments:
+                    key = (ass['date'], ass['shift'])
+                    if key not in existing:
+                        self._history[worker][month_year].append(ass)
+
     def save_history(self, file_path: str) -> bool:
         """Save history to a JSON file.
 
@@ -1196,8 +1369,7 @@ class SchedulerService:
             return False
 
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(self._history, f, indent=4, default=str)
+            write_history_file(file_path, dumps_json(self._history))
             logger.info(f"History saved to {file_path}")
             return True
         except Exception as e:
@@ -1228,14 +1400,8 @@ class SchedulerService:
 
         added = 0
         try:
-            with open(file_path, 'r') as f:
-                reader = csv.reader(f)
-                for row in reader:
-                    if row:
-                        name = row[0].strip()
-                        if name and not any(w.name == name for w in self._workers):
-                            self.add_worker(name)
-                            added += 1
+            with open(file_path, 'r', newline='') as f:
+                added = len(self.add_workers(row[0] for row in csv.reader(f) if row))
             logger.info(f"Imported {added} workers from {file_path}")
         except Exception as e:
             logger.error(f"Failed to import workers: {e}")
@@ -1,14 +1,17 @@
+import numpy as np
 from ortools.sat.python import cp_model
 from datetime import date, timedelta
-from utils import compute_holidays
+from utils import compute_holidays, is_holiday_ordinal
 from constants import (
     DOW_EQUITY_WEIGHT,
+    EQUITY_STATS,
     EQUITY_WEIGHTS,
     MONTHLY_SHIFT_BALANCE_WEIGHT,
-    OBJECTIVE_FLEX_WEIGHTS,
+    OBJECTIVE_FLEX_WEIGHTS_INT,
     OBJECTIVE_WEIGHT_LOAD,
     SHIFT_TYPES,
 )
+from equity_kernels import SHIFT_INDEX, UNKNOWN_SHIFT, compute_equity_counts
 from scheduler_builders import (
     setup_holidays_and_days as _setup_holidays_and_days_pure,
     create_shifts as _create_shifts_pure,
@@ -224,31 +227,26 @@ def _compute_past_stats(history, workers):
       11) Weekday (not Monday) M1 or M2
       12) Weekday M2 (Mon-Fri, non-holiday) - for allocation control
     """
-    past_stats = {w['name']: {
-        'sat_n': 0,
-        'sun_holiday_m2': 0,
-        'sun_holiday_m1': 0,
-        'sun_holiday_n': 0,
-        'sat_m2': 0,
-        'sat_m1': 0,
-        'weekday_n': 0,
-        'fri_night': 0,
-        'weekday_not_fri_n': 0,
-        'monday_day': 0,
-        'weekday_not_mon_day': 0,
-        'weekday_m2': 0,
-        'dow': [0] * 7
-    } for w in workers}
+    names = list(dict.fromkeys(w['name'] for w in workers))
+    worker_index = {name: i for i, name in enumerate(names)}
+    valid_months: dict[str, bool] = {}
+    worker_idx, shift_idx, ordinals = [], [], []
+
     hv = HistoryView(history)
     for worker_name, month_key, ass in hv.iter_assignments():
-        if worker_name not in past_stats:
+        w = worker_index.get(worker_name)
+        if w is None:
             continue
-        try:
-            y, m = map(int, month_key.split('-'))
-        except Exception:
+        valid = valid_months.get(month_key)
+        if valid is None:
+            try:
+                # Keys must be two integers joined by '-', as in YYYY-MM
+                valid = len([int(part) for part in month_key.split('-')]) == 2
+            except Exception:
+                valid = False
+            valid_months[month_key] = valid
+        if not valid:
             continue
-        # compute_holidays returns day numbers; compare with day.day
-        holidays = set(compute_holidays(y, m))
         try:
             day = date.fromisoformat(ass['date'])
         except Exception:
@@ -256,74 +254,24 @@ def _compute_past_stats(history, workers):
         shift = ass.get('shift')
         if not isinstance(shift, str):
             continue
-        
-        is_night = shift == 'N'
-        is_m1 = shift == 'M1'
-        is_m2 = shift == 'M2'
-        is_day_shift = is_m1 or is_m2
-        wd = day.weekday()
-        is_saturday = wd == 5
-        is_sunday = wd == 6
-        is_monday = wd == 0
-        is_friday = wd == 4
-        is_weekday = wd < 5
-        is_holiday = day.day in holidays
-        is_weekday_holiday = is_holiday and is_weekday
-        is_saturday_holiday = is_holiday and is_saturday
-        
-        # Track day-of-week (with bounds check)
-        if 0 <= wd <= 6:
-            past_stats[worker_name]['dow'][wd] += 1
-        else:
-            logger.warning(f"Invalid weekday value {wd} for date {day}")
-        
-        # Priority 1: Saturday N (includes Saturday holidays - N on Sat holiday counts as Sat N)
-        if is_saturday and is_night:
-            past_stats[worker_name]['sat_n'] += 1
-        
-        # Priority 2: Sunday or Holiday M2 (Sunday, or weekday holiday, or Sat holiday for M2)
-        elif is_m2 and (is_sunday or is_weekday_holiday or is_saturday_holiday):
-            past_stats[worker_name]['sun_holiday_m2'] += 1
-        
-        # Priority 3: Sunday or Holiday M1 (Sunday, or weekday holiday, or Sat holiday for M1)
-        elif is_m1 and (is_sunday or is_weekday_holiday or is_saturday_holiday):
-            past_stats[worker_name]['sun_holiday_m1'] += 1
-        
-        # Priority 4: Sunday or Holiday N (Sat holidays excluded - they count as Sat N)
-        elif is_night and (is_sunday or is_weekday_holiday):
-            past_stats[worker_name]['sun_holiday_n'] += 1
-        
-        # Priority 5: Saturday M2 (non-holiday Saturday M2)
-        elif is_saturday and is_m2 and not is_holiday:
-            past_stats[worker_name]['sat_m2'] += 1
-        
-        # Priority 6: Saturday M1 (non-holiday Saturday M1)
-        elif is_saturday and is_m1 and not is_holiday:
-            past_stats[worker_name]['sat_m1'] += 1
-        
-        # Priority 7: Weekday N (all Mon-Fri nights, non-holiday)
-        # Also increment fri_night or weekday_not_fri_n for granular tracking
-        elif is_weekday and is_night and not is_holiday:
-            past_stats[worker_name]['weekday_n'] += 1
-            # Priority 8: Friday N (non-holiday Friday nights)
-            if is_friday:
-                past_stats[worker_name]['fri_night'] += 1
-            # Priority 9: Weekday (not Friday) N (Mon-Thu nights, non-holiday)
-            else:
-                past_stats[worker_name]['weekday_not_fri_n'] += 1
-        
-        # Priority 10: Monday M1 or M2 (non-holiday Mondays)
-        elif is_monday and is_day_shift and not is_holiday:
-            past_stats[worker_name]['monday_day'] += 1
-        
-        # Priority 11: Weekday (not Monday) M1 or M2 (Tue-Fri day shifts, non-holiday)
-        elif is_weekday and not is_monday and is_day_shift and not is_holiday:
-            past_stats[worker_name]['weekday_not_mon_day'] += 1
-        
-        # Priority 12: Weekday M2 (Mon-Fri M2, non-holiday) - tracked separately for allocation control
-        # Note: This is tracked independently, not else-if, since it overlaps with monday_day/weekday_not_mon_day
-        if is_weekday and is_m2 and not is_holiday:
-            past_stats[worker_name]['weekday_m2'] += 1
+
+        worker_idx.append(w)
+        shift_idx.append(SHIFT_INDEX.get(shift, UNKNOWN_SHIFT))
+        ordinals.append(day.toordinal())
+
+    # Weekdays and holiday flags for the whole batch at once (ordinal 1 is a Monday)
+    ordinals = np.asarray(ordinals, dtype=np.int32)
+    weekdays = (ordinals - 1) % 7
+    is_holiday = is_holiday_ordinal(ordinals)
+
+    # Categories follow the RULES.md holiday counting rules (see classify_shift)
+    stats, dow = compute_equity_counts(worker_idx, shift_idx, weekdays, is_holiday, len(names))
+    stats, dow = stats.tolist(), dow.tolist()
+    past_stats = {}
+    for i, name in enumerate(names):
+        worker_stats = dict(zip(EQUITY_STATS, stats[i]))
+        worker_stats['dow'] = dow[i]
+        past_stats[name] = worker_stats
     
     return past_stats
 
@@ -344,7 +292,6 @@ def compute_automatic_equity_credits(unavail_data: dict, workers: list, year: in
         Dict mapping worker_name -> {stat: credit_value}
     """
     from datetime import date, timedelta
-    from constants import EQUITY_STATS
     
     credits = {}
     
@@ -725,22 +672,22 @@ def generate_schedule(
         # Backwards-compatible single-objective weighted-sum mode.
         obj = 0
         obj = _add_load_balancing_objective(model, obj, iso_weeks, shifts, assigned, workers, OBJECTIVE_WEIGHT_LOAD)
-        obj = _add_saturday_preference_objective(model, obj, OBJECTIVE_FLEX_WEIGHTS[0], iso_weeks, assigned, num_workers,
+        obj = _add_saturday_preference_objective(model, obj, OBJECTIVE_FLEX_WEIGHTS_INT[0], iso_weeks, assigned, num_workers,
                                                  shifts, unav_parsed, holiday_set)
-        obj = _add_three_day_weekend_min_objective(model, obj, OBJECTIVE_FLEX_WEIGHTS[1], iso_weeks, holiday_set,
+        obj = _add_three_day_weekend_min_objective(model, obj, OBJECTIVE_FLEX_WEIGHTS_INT[1], iso_weeks, holiday_set,
                                                    shifts_by_day, assigned, num_workers)
-        obj = _add_weekend_shift_limits_objective(model, obj, OBJECTIVE_FLEX_WEIGHTS[2], iso_weeks, holiday_set, assigned,
+        obj = _add_weekend_shift_limits_objective(model, obj, OBJECTIVE_FLEX_WEIGHTS_INT[2], iso_weeks, holiday_set, assigned,
                                                   num_workers, shifts)
-        obj = _add_consecutive_weekend_avoidance_objective(model, obj, OBJECTIVE_FLEX_WEIGHTS[3], iso_weeks, holiday_set,
+        obj = _add_consecutive_weekend_avoidance_objective(model, obj, OBJECTIVE_FLEX_WEIGHTS_INT[3], iso_weeks, holiday_set,
                                                            history, workers, assigned, num_workers, shifts, year, month)
-        obj = _add_m2_priority_objective(model, obj, OBJECTIVE_FLEX_WEIGHTS[4], shifts, num_shifts, assigned, workers)
+        obj = _add_m2_priority_objective(model, obj, OBJECTIVE_FLEX_WEIGHTS_INT[4], shifts, num_shifts, assigned, workers)
         obj = _add_equity_objective(model, obj, equity_weights, past_stats, current_stats, workers, num_workers)
         obj = _add_dow_equity_objective(model, obj, dow_equity_weight, past_stats, current_dow, workers, num_workers)
-        obj = _add_consec_shifts_48h_objective(model, obj, OBJECTIVE_FLEX_WEIGHTS[10], assigned, shifts, num_shifts,
+        obj = _add_consec_shifts_48h_objective(model, obj, OBJECTIVE_FLEX_WEIGHTS_INT[10], assigned, shifts, num_shifts,
                                                num_workers)
-        obj = _add_night_shift_min_interval_objective(model, obj, OBJECTIVE_FLEX_WEIGHTS[11], assigned, shifts, num_shifts,
+        obj = _add_night_shift_min_interval_objective(model, obj, OBJECTIVE_FLEX_WEIGHTS_INT[11], assigned, shifts, num_shifts,
                                                        num_workers)
-        obj = _add_consecutive_night_shift_avoidance_objective(model, obj, OBJECTIVE_FLEX_WEIGHTS[12], assigned, shifts,
+        obj = _add_consecutive_night_shift_avoidance_objective(model, obj, OBJECTIVE_FLEX_WEIGHTS_INT[12], assigned, shifts,
                                                                 num_shifts, num_workers)
         obj = _add_tiebreak_objective(model, obj, assigned, num_workers, num_shifts, workers)
         model.Minimize(obj)
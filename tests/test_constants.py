@@ -13,8 +13,18 @@ from constants import (
     SHIFTS,
     SHIFT_TYPES,
     SHIFT_DURATIONS,
+    SHIFT_DUR_ARR,
+    SHIFT_START_ARR,
+    SHIFT_END_ARR,
+    SHIFT_NIGHT_ARR,
+    Shift,
+    DAY_SHIFTS_MASK,
+    NIGHT_SHIFTS_MASK,
     EQUITY_STATS,
+    EQUITY_STAT_INDEX,
     EQUITY_WEIGHTS,
+    OBJECTIVE_FLEX_WEIGHTS,
+    OBJECTIVE_FLEX_WEIGHTS_INT,
     FIXED_HOLIDAYS,
     MOVABLE_HOLIDAY_OFFSETS,
 )
@@ -55,6 +65,29 @@ class TestShiftConfiguration:
         for shift_type in SHIFT_TYPES:
             assert SHIFT_DURATIONS[shift_type] == SHIFTS[shift_type]['dur']
 
+    def test_ordinal_tables_match_config(self):
+        """Per-ordinal tables should follow SHIFT_TYPES order."""
+        for i, shift_type in enumerate(SHIFT_TYPES):
+            config = SHIFTS[shift_type]
+            assert SHIFT_DUR_ARR[i] == config['dur']
+            assert SHIFT_START_ARR[i] == config['start_hour']
+            assert SHIFT_END_ARR[i] == config['end_hour']
+            assert SHIFT_NIGHT_ARR[i] == config['night']
+
+    def test_shift_enum_matches_shift_types(self):
+        """Shift ordinals should follow SHIFT_TYPES, and the masks split day and night."""
+        assert [s.name for s in Shift] == list(SHIFT_TYPES)
+        for s in Shift:
+            assert bool((1 << s) & NIGHT_SHIFTS_MASK) == SHIFTS[s.name]['night']
+            assert bool((1 << s) & DAY_SHIFTS_MASK) != SHIFTS[s.name]['night']
+
+    def test_shift_config_read_only(self):
+        """Shift configuration should not be modifiable at runtime."""
+        with pytest.raises(TypeError):
+            SHIFTS['M1']['dur'] = 24
+        with pytest.raises(TypeError):
+            SHIFT_DURATIONS['M1'] = 24
+
 
 class TestEquityConfiguration:
     """Tests for equity/fairness configuration."""
@@ -76,6 +109,12 @@ class TestEquityConfiguration:
         for stat in expected_stats:
             assert stat in EQUITY_STATS
 
+    def test_equity_stat_index_matches_order(self):
+        """EQUITY_STAT_INDEX should give each stat's position in EQUITY_STATS."""
+        assert list(EQUITY_STAT_INDEX) == list(EQUITY_STATS)
+        for i, stat in enumerate(EQUITY_STATS):
+            assert EQUITY_STAT_INDEX[stat] == i
+
     def test_equity_weights_for_all_stats(self):
         """Each equity stat should have a weight defined."""
         for stat in EQUITY_STATS:
@@ -86,6 +125,26 @@ class TestEquityConfiguration:
         for stat, weight in EQUITY_WEIGHTS.items():
             assert weight >= 0, f"{stat} has negative weight"
 
+    def test_equity_weights_read_only(self):
+        """Defaults should be read-only; copies are mutable."""
+        with pytest.raises(TypeError):
+            EQUITY_WEIGHTS['sat_n'] = 0.0
+        weights = EQUITY_WEIGHTS.copy()
+        weights['sat_n'] = 0.0
+        assert EQUITY_WEIGHTS['sat_n'] != 0.0
+
+
+class TestObjectiveWeights:
+    """Tests for objective weight constants."""
+
+    def test_flex_weights_int_are_integers(self):
+        """Integer flex weights should be ints matching the whole-number weights."""
+        assert len(OBJECTIVE_FLEX_WEIGHTS_INT) == len(OBJECTIVE_FLEX_WEIGHTS)
+        for w_int, w in zip(OBJECTIVE_FLEX_WEIGHTS_INT, OBJECTIVE_FLEX_WEIGHTS):
+            assert isinstance(w_int, int)
+            if w == int(w):
+                assert w_int == w
+
 
 class TestHolidayConfiguration:
     """Tests for holiday configuration."""
@@ -69,6 +69,17 @@ class TestDiagnosticReport:
         assert len(warnings) == 1
         assert warnings[0].severity == "warning"
 
+    def test_violations_stay_the_source_of_truth(self):
+        """Violations passed in or appended directly should keep their order and be filtered."""
+        first = ConstraintViolation("a", "warning", "Warning 1")
+        report = DiagnosticReport(is_feasible=False, violations=[first])
+        assert report.get_warnings() == [first]
+
+        second = ConstraintViolation("b", "error", "Error 1")
+        report.violations.append(second)
+        assert report.violations == [first, second]
+        assert report.get_errors() == [second]
+
     def test_to_dict(self):
         """Should convert report to dictionary."""
         report = DiagnosticReport(is_feasible=True, summary="All good")
@@ -217,6 +228,177 @@ class TestConstraintDiagnosticsPreSolve:
         assert len(conflict_errors) >= 1
         assert "W1" in conflict_errors[0].message
 
+    def test_relaxation_skipped_after_pre_solve_errors(self):
+        """Relaxation solves should be skipped when pre-solve already found errors."""
+        shifts = self._create_shifts(self.days)
+        shifts_by_day = {d: [i for i, s in enumerate(shifts) if s["day"] == d] for d in self.days}
+        diag = ConstraintDiagnostics(
+            workers=self.workers,
+            days=self.days,
+            shifts=shifts,
+            shifts_by_day=shifts_by_day,
+            iso_weeks={},
+            unav_parsed=[{(self.days[0], None)}] * 3,
+            req_parsed=[set(), set(), set()],
+            holiday_set=set(),
+        )
+
+        report = diag.run_relaxation_analysis()
+        assert report.get_errors()
+        assert report.relaxation_results == {}
+
+        forced = diag.run_relaxation_analysis(force_relaxation=True)
+        assert len(forced.relaxation_results) == 4
+
+    def test_rest_interval_blocks_close_shifts(self):
+        """Rest constraint should forbid shifts less than 24h apart, and allow others."""
+        from ortools.sat.python import cp_model
+
+        shifts = self._create_shifts(self.days)
+        diag = ConstraintDiagnostics(
+            workers=self.workers[:1],
+            days=self.days,
+            shifts=shifts,
+            shifts_by_day={},
+            iso_weeks={},
+            unav_parsed=[set()],
+            req_parsed=[set()],
+            holiday_set=set(),
+        )
+
+        def feasible(i, j):
+            model = cp_model.CpModel()
+            assigned = [[model.NewBoolVar(f"a{s}") for s in range(len(shifts))]]
+            diag._add_rest_interval(model, assigned)
+            model.Add(assigned[0][i] == 1)
+            model.Add(assigned[0][j] == 1)
+            return cp_model.CpSolver().Solve(model) in (cp_model.OPTIMAL, cp_model.FEASIBLE)
+
+        assert not feasible(0, 2)  # Same-day M1 and N overlap
+        assert not feasible(2, 3)  # N ends 08:00, next M1 starts 08:00: no rest
+        assert not feasible(0, 3)  # M1 ends 20:00, next-day M1 at 08:00: 12h rest
+        assert feasible(0, 6)      # M1 on day 1 and M1 on day 3: 36h rest
+
+    def test_availability_masks(self):
+        """Masks should cover whole-day and per-shift unavailability and night restrictions."""
+        shifts = self._create_shifts(self.days)
+        diag = ConstraintDiagnostics(
+            workers=self.workers,
+            days=self.days,
+            shifts=shifts,
+            shifts_by_day={},
+            iso_weeks={},
+            unav_parsed=[{(self.days[0], None)}, {(self.days[1], "M2")}, set()],
+            req_parsed=[set(), set(), set()],
+            holiday_set=set(),
+        )
+
+        assert diag.unav_day[:, :3].tolist() == [[True, False, False], [False] * 3, [False] * 3]
+        assert diag.unav_shift[0].nonzero()[0].tolist() == [0, 1, 2]
+        assert diag.unav_shift[1].nonzero()[0].tolist() == [4]
+        assert diag.shift_blocked[2].nonzero()[0].tolist() == [2, 5, 8]  # W3 cannot work nights
+        assert diag._weekly_eligible([self.days[0]]).tolist() == [False, True, True]
+
+    def test_relaxation_identifies_night_restrictions(self):
+        """Only relaxing night restrictions should make a no-night-worker day feasible."""
+        workers = [{"name": f"W{i}", "can_night": False} for i in range(3)]
+        shifts = self._create_shifts(self.days[:1])
+        diag = ConstraintDiagnostics(
+            workers=workers,
+            days=self.days[:1],
+            shifts=shifts,
+            shifts_by_day={self.days[0]: [0, 1, 2]},
+            iso_weeks={},
+            unav_parsed=[set(), set(), set()],
+            req_parsed=[set(), set(), set()],
+            holiday_set=set(),
+        )
+
+        report = diag.run_relaxation_analysis(force_relaxation=True, find_conflicts=True)
+
+        assert report.relaxation_results == {
+            "weekly_participation": False,
+            "24h_rest_interval": False,
+            "one_shift_per_day": False,
+            "night_restrictions": True,
+        }
+        # The relaxation already names the culprit: no conflict search
+        assert not [v for v in report.get_errors() if v.category == "conflict_set"]
+
+    def test_conflicting_constraints_localize_unavailability(self):
+        """The minimal conflict set should name the worker's unavailability."""
+        shifts = self._create_shifts(self.days[:1])
+        diag = ConstraintDiagnostics(
+            workers=self.workers,
+            days=self.days[:1],
+            shifts=shifts,
+            shifts_by_day={self.days[0]: [0, 1, 2]},
+            iso_weeks={},
+            unav_parsed=[{(self.days[0], None)}, set(), set()],
+            req_parsed=[set(), set(), set()],
+            holiday_set=set(),
+        )
+
+        conflicts = diag.find_conflicting_constraints()
+
+        assert conflicts
+        assert all(v.category == "conflict_set" for v in conflicts)
+        assert {"worker": "W1", "constraint": "unavailability", "date": "2026-01-05", "shift_type": "all"} in [
+            v.details for v in conflicts
+        ]
+
+    def test_conflict_search_is_opt_in(self):
+        """Relaxation analysis should only add a conflict set when asked to."""
+        shifts = self._create_shifts(self.days[:1])
+        diag = ConstraintDiagnostics(
+            workers=self.workers,
+            days=self.days[:1],
+            shifts=shifts,
+            shifts_by_day={self.days[0]: [0, 1, 2]},
+            iso_weeks={},
+            unav_parsed=[{(self.days[0], None)}, set(), set()],
+            req_parsed=[set(), set(), set()],
+            holiday_set=set(),
+        )
+
+        def conflict_set(report):
+            return [v for v in report.get_errors() if v.category == "conflict_set"]
+
+        assert not conflict_set(diag.run_relaxation_analysis(force_relaxation=True))
+        assert conflict_set(diag.run_relaxation_analysis(force_relaxation=True, find_conflicts=True))
+
+    def test_conflict_search_respects_time_budget(self):
+        """With no time left, the conflict search should give up empty-handed."""
+        shifts = self._create_shifts(self.days[:1])
+        diag = ConstraintDiagnostics(
+            workers=self.workers,
+            days=self.days[:1],
+            shifts=shifts,
+            shifts_by_day={self.days[0]: [0, 1, 2]},
+            iso_weeks={},
+            unav_parsed=[{(self.days[0], None)}, set(), set()],
+            req_parsed=[set(), set(), set()],
+            holiday_set=set(),
+        )
+
+        assert diag.find_conflicting_constraints(time_budget=0.0) == []
+
+    def test_no_conflicts_when_feasible(self):
+        """A feasible model should have an empty conflict set."""
+        shifts = self._create_shifts(self.days[:1])
+        diag = ConstraintDiagnostics(
+            workers=self.workers,
+            days=self.days[:1],
+            shifts=shifts,
+            shifts_by_day={self.days[0]: [0, 1, 2]},
+            iso_weeks={},
+            unav_parsed=[set(), set(), set()],
+            req_parsed=[set(), set(), set()],
+            holiday_set=set(),
+        )
+
+        assert diag.find_conflicting_constraints() == []
+
 
 class TestIntegrationWithGenerateSchedule:
     """Integration tests for diagnostics with generate_schedule."""
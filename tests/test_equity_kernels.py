@@ -0,0 +1,93 @@
+"""
+Tests for equity_kernels.py - Vectorised equity stat counting
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from constants import EQUITY_STATS, SHIFT_TYPES
+from equity_kernels import (
+    REPORT_INDEX,
+    STAT_INDEX,
+    UNKNOWN_SHIFT,
+    classify_report_shift,
+    classify_shift,
+    compute_equity_counts,
+    compute_report_counts,
+)
+
+
+class TestClassifyShift:
+    """Tests for per-assignment equity classification."""
+
+    def test_saturday_holiday_night_counts_as_saturday_n(self):
+        """Night on a Saturday holiday should count as Saturday N only."""
+        assert classify_shift('N', 5, True) == ['sat_n']
+
+    def test_weekday_holiday_day_shift(self):
+        """Day shifts on a weekday holiday count as Sunday or Holiday."""
+        assert classify_shift('M1', 2, True) == ['sun_holiday_m1']
+        assert classify_shift('M2', 2, True) == ['sun_holiday_m2']
+
+    def test_friday_night(self):
+        """Non-holiday Friday night counts as weekday N and Friday N."""
+        assert classify_shift('N', 4, False) == ['weekday_n', 'fri_night']
+
+    def test_weekday_m2_tracked_alongside(self):
+        """Monday M2 counts as Monday day shift and weekday M2."""
+        assert classify_shift('M2', 0, False) == ['monday_day', 'weekday_m2']
+
+
+class TestComputeEquityCounts:
+    """Tests for the batched equity counter."""
+
+    def test_counts_per_worker(self):
+        """Counts should land in the right worker row and stat column."""
+        n = SHIFT_TYPES.index('N')
+        stats, dow = compute_equity_counts(
+            worker_idx=[0, 0, 1],
+            shift_idx=[n, n, UNKNOWN_SHIFT],
+            weekday=[5, 4, 2],
+            is_holiday=[False, False, False],
+            num_workers=2,
+        )
+        assert stats.shape == (2, len(EQUITY_STATS))
+        assert stats[0, STAT_INDEX['sat_n']] == 1
+        assert stats[0, STAT_INDEX['fri_night']] == 1
+        assert stats[1].sum() == 0  # Unknown shift types only count per weekday
+        assert dow[1].tolist() == [0, 0, 1, 0, 0, 0, 0]
+
+    def test_empty_batch(self):
+        """No assignments should give all-zero matrices."""
+        stats, dow = compute_equity_counts([], [], [], [], num_workers=3)
+        assert stats.shape == (3, len(EQUITY_STATS))
+        assert not stats.any()
+        assert not dow.any()
+
+
+class TestReportCounts:
+    """Tests for the worker report stat counter."""
+
+    def test_classify_saturday_holiday_night(self):
+        """A Saturday holiday night counts as Saturday and Sunday/holiday night."""
+        assert classify_report_shift('N', 5, True) == [
+            'night_shifts', 'weekend_holiday_shifts', 'sat_night', 'sun_holiday_night',
+        ]
+
+    def test_unknown_shift_only_counts_weekend(self):
+        """Unknown shift types only count as weekend/holiday shifts."""
+        assert classify_report_shift('', 6, False) == ['weekend_holiday_shifts']
+        assert classify_report_shift('', 2, False) == []
+
+    def test_counts_per_worker(self):
+        """Report counts should land in the right worker row."""
+        m1 = SHIFT_TYPES.index('M1')
+        counts = compute_report_counts([1, 1], [m1, UNKNOWN_SHIFT], [6, 6], [False, False], num_workers=2)
+        assert counts[0].sum() == 0
+        assert counts[1, REPORT_INDEX['day_shifts']] == 1
+        assert counts[1, REPORT_INDEX['sun_holiday_day']] == 1
+        assert counts[1, REPORT_INDEX['weekend_holiday_shifts']] == 2
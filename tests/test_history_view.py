@@ -0,0 +1,45 @@
+"""
+Tests for history_view.py - History access adapter
+"""
+
+import pytest
+from datetime import date
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from history_view import HistoryView
+
+
+class TestFixedShifts:
+    """Tests for the (worker, day) -> fixed shift index."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.history = {
+            "W1": {
+                "2026-05": [
+                    {"date": "2026-05-30", "shift": "N", "dur": 12},
+                    {"date": "2026-05-31", "shift": "M1", "dur": 12},
+                    {"date": "2026-05-31", "shift": "M2", "dur": 12},
+                ],
+                # Filed under the wrong month: fixed_shift_for never sees it
+                "2026-06": [{"date": "2026-05-29", "shift": "M2", "dur": 12}],
+            },
+            "W2": {"2026-05": [{"date": "2026-05-30", "shift": None}, "garbage"]},
+        }
+        self.hv = HistoryView(self.history)
+
+    def test_matches_fixed_shift_for(self):
+        """Every lookup should agree with fixed_shift_for."""
+        fixed = self.hv.fixed_shifts()
+        for name in ("W1", "W2", "W3"):
+            for day in range(28, 32):
+                d = date(2026, 5, day)
+                assert fixed.get((name, d)) == self.hv.fixed_shift_for(name, d)
+
+    def test_first_assignment_wins(self):
+        """Duplicate assignments for a day should resolve like fixed_shift_for."""
+        assert self.hv.fixed_shifts()[("W1", date(2026, 5, 31))] == "M1"
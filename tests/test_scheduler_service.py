@@ -20,6 +20,7 @@ from datetime import date
 from scheduler_service import (
     SchedulerService,
     Worker,
+    ScheduleRequest,
     ScheduleResult,
     WorkerStats,
 )
@@ -37,6 +38,12 @@ class TestWorkerDataclass:
         assert worker.weekly_load == 18
         assert worker.color == "#000000"
 
+    def test_worker_accepts_non_str_name_and_color(self):
+        """Non-string names and colors should be stored unchanged."""
+        worker = Worker(name=42, id="ID001", color=None)
+        assert worker.name == 42
+        assert worker.color is None
+
     def test_worker_to_dict(self):
         """Worker.to_dict should return correct dictionary."""
         worker = Worker(name="Alice", id="ID001", color="#ff0000", can_night=False, weekly_load=12)
@@ -173,6 +180,14 @@ class TestWorkerManagement:
         assert w1.id == "ID016"
         assert w2.id == "ID017"
 
+    def test_add_workers_skips_blank_and_duplicates(self, service):
+        """add_workers should strip names and skip blanks and duplicates."""
+        added = service.add_workers([" Worker16 ", "", "Tome", "Worker17", "Worker16"])
+        assert [w.name for w in added] == ["Worker16", "Worker17"]
+        assert [w.id for w in added] == ["ID016", "ID017"]
+        assert len(service.workers) == 17
+        assert service.get_unavailable("Worker16") == []
+
     def test_remove_worker_exists(self, service):
         """remove_worker should return True and remove the worker."""
         result = service.remove_worker("Tome")
@@ -222,6 +237,14 @@ class TestAvailabilityManagement:
         result = service.add_unavailable("NonExistent", "2026-01-15")
         assert result is False
 
+    def test_add_unavailable_entries_skips_existing(self, service):
+        """add_unavailable_entries should return only the newly added entries."""
+        service.add_unavailable("Tome", "2026-01-15 M1")
+        added = service.add_unavailable_entries("Tome", ["2026-01-15 M1", "2026-01-15 N", "2026-01-16 M1"])
+        assert added == ["2026-01-15 N", "2026-01-16 M1"]
+        assert service.get_unavailable("Tome") == ["2026-01-15 M1", "2026-01-15 N", "2026-01-16 M1"]
+        assert service.add_unavailable_entries("NonExistent", ["2026-01-15"]) == []
+
     def test_add_required(self, service):
         """add_required should add entry."""
         result = service.add_required("Tome", "2026-01-20 N")
@@ -274,6 +297,13 @@ class TestHolidayManagement:
         result = service.add_manual_holiday(15)
         assert result is False
 
+    def test_add_manual_holidays_skips_duplicates(self, service):
+        """add_manual_holidays should add each new day once, in order."""
+        service.add_manual_holiday(15)
+        added = service.add_manual_holidays([1, 15, 25, 1])
+        assert added == 2
+        assert service.manual_holidays == [15, 1, 25]
+
     def test_clear_manual_holidays(self, service):
         """clear_manual_holidays should remove all."""
         service.add_manual_holiday(15)
@@ -423,6 +453,25 @@ class TestScheduleGeneration:
         if result.success:
             assert len(service.history) > 0
 
+    def test_prepare_generation_copies_state(self, service):
+        """Edits after prepare_generation should not reach the request."""
+        name = service.workers[0].name
+        service._history = {name: {"2025-12": [{"date": "2025-12-29", "shift": "M1", "dur": 12}]}}
+        request = service.prepare_generation(2026, 1)
+        assert isinstance(request, ScheduleRequest)
+        service.add_unavailable(name, "2026-01-07")
+        service._history[name]["2025-12"].clear()
+        assert request.unavail[name] == []
+        assert len(request.history[name]["2025-12"]) == 1
+
+    def test_solve_leaves_service_untouched(self, service):
+        """solve should only change the service once the result is applied."""
+        result = service.solve(service.prepare_generation(2026, 1))
+        assert service.history == {}
+        service.apply_result(result)
+        if result.success:
+            assert len(service.history) > 0
+
 
 class TestHistoryManagement:
     """Tests for history persistence."""
@@ -466,6 +515,36 @@ class TestHistoryManagement:
             assert result is True
             assert len(service.history) > 0
 
+    def test_save_and_load_history_non_ascii(self, service, temp_file):
+        """History with non-ASCII worker names should round-trip unchanged."""
+        history = {"João": {"2026-01": [{"date": "2026-01-05", "shift": "M1", "dur": 12}]}}
+        service._history = {k: dict(v) for k, v in history.items()}
+        assert service.save_history(temp_file) is True
+
+        service.clear_history()
+        assert service.load_history(temp_file) is True
+        assert service.history == history
+
+    def test_saved_history_is_indented(self, service, temp_file):
+        """History files should stay readable: one JSON value per line, indented."""
+        service._history = {"W1": {"2026-01": [{"date": "2026-01-05", "shift": "M1", "dur": 12}]}}
+        assert service.save_history(temp_file) is True
+        with open(temp_file, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        assert len(lines) > 1
+        assert lines[1].startswith(' ')
+
+    def test_merge_history_skips_existing_assignments(self, service):
+        """merge_history should only add assignments not already present."""
+        ass = {"date": "2026-01-05", "shift": "M1", "dur": 12}
+        service._history = {"W1": {"2026-01": [dict(ass)]}}
+        service.merge_history({
+            "W1": {"2026-01": [dict(ass), {"date": "2026-01-06", "shift": "N", "dur": 12}]},
+            "W2": {"2026-01": [dict(ass)]},
+        })
+        assert len(service.history["W1"]["2026-01"]) == 2
+        assert service.history["W2"]["2026-01"] == [ass]
+
     def test_load_history_invalid_json(self, service, temp_file):
         """load_history should return False for invalid JSON."""
         with open(temp_file, 'w') as f:
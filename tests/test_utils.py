@@ -3,14 +3,15 @@ Tests for utils.py - Utility functions
 """
 
 import pytest
-from datetime import datetime
+from datetime import date, datetime, timedelta
 import sys
 import os
+import subprocess
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from utils import easter_date, compute_holidays
+from utils import easter_date, compute_holidays, holidays_for_year, holiday_ordinals_for_year, is_holiday_ordinal
 
 
 class TestEasterDate:
@@ -100,3 +101,44 @@ class TestComputeHolidays:
         holidays = compute_holidays(2026, 7)
         # Could be empty or have movable holidays
         assert isinstance(holidays, list)
+
+
+class TestHolidaysForYear:
+    """Tests for the per-year holiday set."""
+
+    def test_contains_fixed_and_movable(self):
+        """Year set should include fixed and Easter-based holidays as dates."""
+        holidays = holidays_for_year(2026)
+        assert date(2026, 12, 25) in holidays  # Christmas
+        assert date(2026, 4, 3) in holidays    # Good Friday
+        assert date(2026, 7, 1) not in holidays
+
+    def test_ordinals_match_year_set(self):
+        """Ordinal array should be the sorted ordinals of the year set."""
+        ordinals = holiday_ordinals_for_year(2026)
+        assert ordinals.tolist() == sorted(d.toordinal() for d in holidays_for_year(2026))
+
+    def test_is_holiday_ordinal_across_years(self):
+        """Batch test should match set membership over a multi-year range."""
+        days = [date(2025, 12, 20) + timedelta(days=i) for i in range(40)]
+        mask = is_holiday_ordinal([d.toordinal() for d in days])
+        assert mask.tolist() == [d in holidays_for_year(d.year) for d in days]
+
+    def test_matches_compute_holidays(self):
+        """compute_holidays should be the month slice of the year set."""
+        for month in range(1, 13):
+            expected = sorted(d.day for d in holidays_for_year(2026) if d.month == month)
+            assert compute_holidays(2026, month) == expected
+
+
+class TestHeadlessImports:
+    """Non-UI modules should not load Tk."""
+
+    def test_scheduler_service_does_not_import_tkinter(self):
+        """Importing the service layer should leave tkinter unloaded."""
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run(
+            [sys.executable, "-c", "import sys, scheduler_service; print('tkinter' in sys.modules)"],
+            cwd=root, capture_output=True, text=True, check=True,
+        )
+        assert result.stdout.strip().splitlines()[-1] == "False"
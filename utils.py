@@ -1,10 +1,15 @@
-import tkinter as tk
-from datetime import timedelta, datetime
-from constants import FIXED_HOLIDAYS, MOVABLE_HOLIDAY_OFFSETS
+from datetime import date, timedelta, datetime
+from functools import lru_cache
+
+import numpy as np
+
+from constants import FIXED_HOLIDAY_SET, MOVABLE_HOLIDAY_OFFSETS
 
 
 
 class Tooltip:
+    # tkinter is imported when a tooltip is first shown, so the solver and
+    # service code that import this module never load Tk
     def __init__(self, widget, text):
         self.widget = widget
         self.text = text
@@ -13,6 +18,8 @@ class Tooltip:
         self.widget.bind("<Leave>", self.hide_tooltip)
 
     def show_tooltip(self, event):
+        import tkinter as tk
+
         # Handle different widget types
         if hasattr(self.widget, 'bbox') and 'Listbox' in str(type(self.widget)):
             # For listboxes, use event coordinates
@@ -59,16 +66,42 @@ def easter_date(year):
     day = f % 31 + 1
     return datetime(year, month, day)
 
-def compute_holidays(year: int, month: int) -> list[int]:
-    fixed_holidays = FIXED_HOLIDAYS
+@lru_cache(maxsize=16)
+def holidays_for_year(year: int) -> frozenset[date]:
+    """All fixed and Easter-based holidays of a year, computed once per year."""
+    holidays = {date(year, m, d) for m, d in FIXED_HOLIDAY_SET}
 
     # Movable holidays
-    easter = easter_date(year)
-    auto_days = fixed_holidays.get(month, [])[:]
+    easter = easter_date(year).date()
     for offset in MOVABLE_HOLIDAY_OFFSETS.values():
         dt = easter + timedelta(days=offset)
-        if dt.month == month and dt.year == year:
-            auto_days.append(dt.day)
-    return sorted(list(set(auto_days)))
+        if dt.year == year:
+            holidays.add(dt)
+    return frozenset(holidays)
+
+@lru_cache(maxsize=16)
+def holiday_ordinals_for_year(year: int) -> np.ndarray:
+    """Sorted date.toordinal() values of a year's holidays (read-only int32 array)."""
+    ordinals = np.array(sorted(d.toordinal() for d in holidays_for_year(year)), dtype=np.int32)
+    ordinals.flags.writeable = False
+    return ordinals
+
+def is_holiday_ordinal(ordinals) -> np.ndarray:
+    """Vectorised holiday test for date ordinals (date.toordinal()).
+
+    The holidays of every year spanned by the input are concatenated into one
+    sorted array and the whole batch is matched with a single binary search.
+    """
+    ordinals = np.asarray(ordinals, dtype=np.int32)
+    if ordinals.size == 0:
+        return np.zeros(ordinals.shape, dtype=bool)
+    first_year = date.fromordinal(int(ordinals.min())).year
+    last_year = date.fromordinal(int(ordinals.max())).year
+    table = np.concatenate([holiday_ordinals_for_year(y) for y in range(first_year, last_year + 1)])
+    idx = np.searchsorted(table, ordinals)
+    return (idx < table.size) & (table[idx.clip(max=table.size - 1)] == ordinals)
+
+def compute_holidays(year: int, month: int) -> list[int]:
+    return sorted(d.day for d in holidays_for_year(year) if d.month == month)
 
 